@@ -29,6 +29,8 @@ from dataset_loader.tedlium import (
     Tedlium,
     TedliumDataset,
     TedliumSample,
+    TedliumUtteranceDataset,
+    TedliumUtteranceSample,
     SegmentTedlium,
     SegmentTedliumDataset,
     SegmentTedliumSample,
@@ -66,6 +68,8 @@ __all__ = [
     "Tedlium",
     "TedliumDataset",
     "TedliumSample",
+    "TedliumUtteranceDataset",
+    "TedliumUtteranceSample",
     "SegmentTedlium",
     "SegmentTedliumDataset",
     "SegmentTedliumSample",
@@ -3,8 +3,12 @@
 from dataset_loader.abstract.huggingface_dataset import HuggingfaceDataset
 from dataset_loader.abstract.huggingface_loader import HuggingfaceLoader
 from dataset_loader.abstract.huggingface_snapshot import HuggingfaceSnapshot
-from dataset_loader.abstract.parquet_dataset import ParquetDataset
-from dataset_loader.abstract.parquet_loader import ParquetLoader
+from dataset_loader.abstract.parquet_dataset import ParquetDataset, ParquetData
+from dataset_loader.abstract.parquet_loader import (
+    ParquetLoader,
+    ParquetFilters,
+    ParquetBackend,
+)
 from dataset_loader.abstract.ir_sample import IRSample, IRSampleData
 from dataset_loader.abstract.asr_sample import ASRSample, ASRSampleData
 
@@ -13,7 +17,10 @@ __all__ = [
     "HuggingfaceSnapshot",
     "HuggingfaceLoader",
     "ParquetDataset",
+    "ParquetData",
     "ParquetLoader",
+    "ParquetFilters",
+    "ParquetBackend",
     "IRSample",
     "IRSampleData",
     "ASRSample",
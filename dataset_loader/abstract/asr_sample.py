@@ -4,11 +4,12 @@ import numpy as np
 import numpy.typing as npt
 
 from typing import Any, TypeVar, Generic, cast
-from typing_extensions import Self, ReadOnly, TypedDict
+from typing_extensions import Self, ReadOnly, TypedDict, NotRequired
 from dataclasses import dataclass
-from collections.abc import Mapping, Callable
+from collections.abc import Mapping, Callable, Iterator
 
 from dataset_loader.base.sample import Sample
+from dataset_loader.audio.stream import frame_audio
 
 RefT = TypeVar("RefT", covariant=True)
 DiarizationT = TypeVar("DiarizationT", covariant=True)
@@ -18,6 +19,9 @@ class ASRSampleData(TypedDict, Generic[RefT, DiarizationT]):
     load_audio_func: ReadOnly[Callable[[], npt.NDArray[np.float32]]]
     ref: ReadOnly[RefT]
     diarization: ReadOnly[DiarizationT]
+    stream_audio_func: NotRequired[
+        ReadOnly[Callable[[int, int | None], Iterator[npt.NDArray[np.float32]]]]
+    ]
 
 
 @dataclass(frozen=True, slots=True)
@@ -28,6 +32,25 @@ class ASRSample(Sample, Generic[RefT, DiarizationT]):
             raise AttributeError("Audio data is not available in this sample")
         return cast(npt.NDArray[np.float32], self.data["load_audio_func"]())
 
+    def stream(
+        self, window: int, hop: int | None = None
+    ) -> Iterator[npt.NDArray[np.float32]]:
+        """
+        오디오를 sr 기준 window 길이의 창으로 나누어 차례로 반환한다. 창은 hop 간격으로 시작하며 마지막 창은 짧을 수 있다. \n
+        데이터셋이 stream_audio_func를 제공하면 파일을 조금씩 디코딩하므로 메모리 사용량이 창 크기로 제한된다.
+        제공하지 않으면 audio 전체를 읽은 뒤 나눈다. 스트리밍은 audio_cache와 memory_cache를 사용하지 않는다.
+
+        Args:
+            window (int): 창의 길이(샘플 수)
+            hop (int | None): 창 사이의 간격(샘플 수). None이면 window와 같다.
+        """
+        if "stream_audio_func" in self.data:
+            return cast(
+                Iterator[npt.NDArray[np.float32]],
+                self.data["stream_audio_func"](window, hop),
+            )
+        return frame_audio((self.audio,), window, hop)
+
     @property
     def ref(self) -> RefT:
         if "ref" not in self.data:
@@ -44,6 +67,7 @@ class ASRSample(Sample, Generic[RefT, DiarizationT]):
         data = {**self.data}
         audio = self.audio
         data["load_audio_func"] = lambda: audio
+        data.pop("stream_audio_func", None)
         return ASRSample[RefT, DiarizationT].create(id=self.id, data=data)
 
     @classmethod
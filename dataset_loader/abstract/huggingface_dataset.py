@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import numpy as np
+import numpy.typing as npt
 
 from abc import ABC
 from typing import Any, TypeVar
@@ -41,6 +42,19 @@ class HuggingfaceDataset(Dataset[DT, S], ABC):
             raise RuntimeError("Cannot get length of a cleaned dataset")
         return len(self._dataset)
 
+    def column(self, name: str) -> npt.NDArray[Any]:
+        """
+        Huggingface Dataset의 컬럼을 numpy 배열로 반환한다. 샘플을 만들지 않으므로 길이 등 메타데이터를 읽을 때 사용한다.
+
+        Raises:
+            KeyError: 컬럼이 없는 경우
+        """
+        if self.is_cleaned or self._dataset is None:
+            raise RuntimeError("Cannot get column of a cleaned dataset")
+        if name not in self._dataset.column_names:
+            raise KeyError(f"Column not found: {name}")
+        return np.asarray(self._dataset[name])
+
     @override
     def select(self, indices: Iterable[int]) -> Self:
         if self.is_cleaned or self._dataset is None:
@@ -1,49 +1,222 @@
 from __future__ import annotations
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
+import pyarrow as pa
 
 from abc import ABC
-from typing import Any, TypeVar
-from typing_extensions import override, Self
-from collections.abc import Mapping, Iterable
+from bisect import bisect_right
+from pathlib import Path
+from typing import Any, TypeVar, cast
+from typing_extensions import TypeAlias, override, Self
+from collections.abc import Callable, Mapping, Iterable
 
 from dataset_loader.base import Dataset, Sample
+from dataset_loader.audio import AudioDiskCache, AudioMemoryCache
 
 S = TypeVar("S", bound=Sample)
+ParquetData: TypeAlias = pd.DataFrame | pa.Table
 
 
-class ParquetDataset(Dataset[pd.DataFrame, S], ABC):
-    def __init__(self, *, parquet: pd.DataFrame):
+class ParquetDataset(Dataset[ParquetData, S], ABC):
+    """
+    parquet에서 읽은 메타데이터를 행 단위로 제공하는 Dataset이다. \n
+    parquet이 pd.DataFrame이면 pandas로, pyarrow.Table이면 Arrow 컬럼 버퍼에서 바로 행을 읽는다.
+    Arrow 백엔드에서 select와 step이 있는 slice는 컬럼을 복사하지 않고 indices 뷰만 만들며, 연속된 slice는 Table.slice로 처리한다. \n
+    파일 경로 컬럼은 root 기준 상대 경로 문자열로 보관하고, 파일을 읽을 때 resolve_path로 절대 경로를 만든다. \n
+    audio_cache가 주어지면 디코딩과 리샘플이 끝난 오디오를 디스크에 저장하여 다음 에폭부터는 memory map으로 읽는다.
+    memory_cache가 주어지면 같은 오디오를 다시 읽을 때 디스크 캐시나 디코딩보다 먼저 메모리에서 찾는다.
+    memory_cache는 select, slice로 만든 데이터셋이나 다른 데이터셋과 공유되므로 clean은 참조만 놓고 캐시를 비우지 않는다.
+
+    Attributes:
+        parquet (pd.DataFrame | pa.Table): 메타데이터
+        indices (npt.ArrayLike | None): Arrow 백엔드에서 parquet의 어떤 행을 어떤 순서로 볼지 나타내는 인덱스 뷰
+        root (str | Path | None): 경로 컬럼의 기준 디렉토리. None이면 경로를 그대로 사용한다.
+        audio_cache (AudioDiskCache | None): 디코딩된 오디오의 디스크 캐시. None이면 매번 디코딩한다.
+        memory_cache (AudioMemoryCache | None): 디코딩된 오디오의 메모리 캐시. 여러 데이터셋이 하나의 인스턴스를 공유할 수 있다.
+    Raises:
+        ValueError: pd.DataFrame에 indices가 주어진 경우 발생한다.
+    """
+
+    def __init__(
+        self,
+        *,
+        parquet: ParquetData,
+        indices: npt.ArrayLike | None = None,
+        root: str | Path | None = None,
+        audio_cache: AudioDiskCache | None = None,
+        memory_cache: AudioMemoryCache | None = None,
+    ):
         super().__init__()
-        self._parquet: pd.DataFrame = parquet
+        if indices is not None and not isinstance(parquet, pa.Table):
+            raise ValueError("indices is only supported with a pyarrow.Table")
+        self._parquet: ParquetData = parquet
+        self._indices: npt.NDArray[np.int64] | None = (
+            None if indices is None else np.asarray(indices, dtype=np.int64)
+        )
+        self._root = None if root is None else Path(root)
+        self._audio_cache = audio_cache
+        self._memory_cache = memory_cache
+        self._batches: list[pa.RecordBatch] | None = None
+        self._offsets: list[int] = []
 
     @property
     @override
-    def dataset(self) -> pd.DataFrame:
+    def dataset(self) -> ParquetData:
+        """메타데이터. Arrow 백엔드에 indices 뷰가 있으면 뷰의 행을 take한 새 Table을 반환한다."""
         if self.is_cleaned:
             raise RuntimeError("Cannot get dataset of a cleaned dataset.")
+        if self._indices is not None:
+            return self._parquet.take(self._indices)
         return self._parquet
 
+    @property
+    def is_arrow(self) -> bool:
+        """Arrow 백엔드 여부"""
+        return isinstance(self._parquet, pa.Table)
+
+    @property
+    def root(self) -> Path | None:
+        """경로 컬럼의 기준 디렉토리"""
+        return self._root
+
+    def resolve_path(self, path: str | Path) -> Path:
+        """경로 컬럼의 값을 root와 합친다. 절대 경로이거나 root가 None이면 그대로 반환한다."""
+        if self._root is None:
+            return Path(path)
+        return self._root / path
+
+    @property
+    def audio_cache(self) -> AudioDiskCache | None:
+        return self._audio_cache
+
+    @property
+    def memory_cache(self) -> AudioMemoryCache | None:
+        return self._memory_cache
+
+    def _load_audio(
+        self,
+        path: Path,
+        sr: int,
+        decode: Callable[[], npt.NDArray[np.float32]],
+        *extra: Any,
+    ) -> npt.NDArray[np.float32]:
+        """
+        memory_cache, audio_cache 순서로 (path, sr, *extra)의 오디오를 찾고, 없으면 decode로 디코딩한다.
+        """
+        audio_cache = self._audio_cache
+
+        def load() -> npt.NDArray[np.float32]:
+            if audio_cache is None:
+                return decode()
+            return audio_cache.get_or_load(path, sr, decode, *extra)
+
+        if self._memory_cache is None:
+            return load()
+        return self._memory_cache.get_or_load((str(path), sr, *extra), load)
+
     @property
     @override
     def args(self) -> dict[str, Any]:
-        return {**super().args, "parquet": self.dataset}
+        if self.is_cleaned:
+            raise RuntimeError("Cannot get args of a cleaned dataset.")
+        return {
+            **super().args,
+            "parquet": self._parquet,
+            "indices": self._indices,
+            "root": self._root,
+            "audio_cache": self._audio_cache,
+            "memory_cache": self._memory_cache,
+        }
 
     @property
     @override
     def length(self) -> int:
         if self.is_cleaned:
             raise RuntimeError("Cannot get length of a cleaned dataset.")
-        return len(self.dataset)
+        if self._indices is not None:
+            return len(self._indices)
+        return len(self._parquet)
+
+    def row(self, idx: int) -> dict[str, Any]:
+        """
+        idx번째 행을 dict로 반환한다. Arrow 백엔드는 pandas Series를 만들지 않고 행이 속한 RecordBatch에서 값을 읽는다.
+        """
+        if self.is_cleaned:
+            raise RuntimeError("Cannot get row of a cleaned dataset.")
+        if not isinstance(self._parquet, pa.Table):
+            return cast(dict[str, Any], self._parquet.iloc[idx].to_dict())
+
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("Index out of range")
+        if self._indices is not None:
+            idx = int(self._indices[idx])
+
+        batches, offsets = self._batches, self._offsets
+        if batches is None:
+            # 여러 스레드가 동시에 get할 수 있으므로 _offsets를 먼저 쓰고 _batches를 마지막에 공개한다.
+            # _batches가 None이 아니면 짝이 맞는 _offsets가 이미 있다.
+            batches = self._parquet.to_batches()
+            offsets = np.cumsum([0, *(batch.num_rows for batch in batches)]).tolist()
+            self._offsets = offsets
+            self._batches = batches
+        b = bisect_right(offsets, idx) - 1
+        batch = batches[b]
+        i = idx - offsets[b]
+        return {
+            name: column[i].as_py()
+            for name, column in zip(batch.schema.names, batch.columns)
+        }
+
+    def column(self, name: str) -> npt.NDArray[Any]:
+        """
+        parquet의 컬럼을 numpy 배열로 반환한다. 샘플을 만들지 않으므로 길이 등 메타데이터를 읽을 때 사용한다.
+
+        Raises:
+            KeyError: 컬럼이 없는 경우
+        """
+        if self.is_cleaned:
+            raise RuntimeError("Cannot get column of a cleaned dataset.")
+        if isinstance(self._parquet, pa.Table):
+            if name not in self._parquet.column_names:
+                raise KeyError(f"Column not found: {name}")
+            values = self._parquet.column(name)
+            if self._indices is not None:
+                values = values.take(self._indices)
+            return cast(npt.NDArray[Any], values.to_numpy())
+        if name not in self._parquet.columns:
+            raise KeyError(f"Column not found: {name}")
+        return self._parquet[name].to_numpy()
+
+    def _normalize_indices(self, indices: Iterable[int]) -> npt.NDArray[np.int64]:
+        """음수 인덱스를 양수로 바꾸고 범위를 검사한 int64 인덱스 배열을 반환한다."""
+        if isinstance(indices, np.ndarray):
+            array = indices.astype(np.int64, copy=False).reshape(-1)
+        else:
+            array = np.fromiter(indices, dtype=np.int64)
+
+        length = len(self)
+        if array.size and array.min() < 0:
+            array = np.where(array < 0, array + length, array)
+        if array.size and (array.min() < 0 or array.max() >= length):
+            raise IndexError("Index out of range")
+        return array
 
     @override
     def select(self, indices: Iterable[int]) -> Self:
         if self.is_cleaned:
             raise RuntimeError("Cannot select from a cleaned dataset.")
-        selected_parquet = self.dataset.iloc[list(indices)].reset_index(drop=True)
         args = self.args
-        args["parquet"] = selected_parquet
+        if isinstance(self._parquet, pa.Table):
+            normalized = self._normalize_indices(indices)
+            args["indices"] = (
+                normalized if self._indices is None else self._indices[normalized]
+            )
+        else:
+            args["parquet"] = self._parquet.iloc[list(indices)].reset_index(drop=True)
         return self.__class__(**args)
 
     @override
@@ -52,9 +225,16 @@ class ParquetDataset(Dataset[pd.DataFrame, S], ABC):
     ) -> Self:
         if self.is_cleaned:
             raise RuntimeError("Cannot slice a cleaned dataset.")
-        sliced_parquet = self.dataset.iloc[start:stop:step].reset_index(drop=True)
         args = self.args
-        args["parquet"] = sliced_parquet
+        if not isinstance(self._parquet, pa.Table):
+            sliced = self._parquet.iloc[start:stop:step].reset_index(drop=True)
+            args["parquet"] = sliced
+        elif self._indices is None and step in (None, 1):
+            offset, end, _ = slice(start, stop).indices(len(self))
+            args["parquet"] = self._parquet.slice(offset, max(end - offset, 0))
+        else:
+            view = np.arange(len(self), dtype=np.int64)[start:stop:step]
+            args["indices"] = view if self._indices is None else self._indices[view]
         return self.__class__(**args)
 
     @override
@@ -76,22 +256,38 @@ class ParquetDataset(Dataset[pd.DataFrame, S], ABC):
 
     @override
     def clean(self) -> None:
+        if self.is_cleaned:
+            return
         super().clean()
+        self._memory_cache = None
         self._parquet = pd.DataFrame()
+        self._indices = None
+        self._batches = None
+        self._offsets = []
 
     @override
     def to_dict(self) -> dict[str, Any]:
         if self.is_cleaned:
             raise RuntimeError("Cannot convert a cleaned dataset to dict.")
         args = super().to_dict()
-        args["parquet"] = self.dataset.to_dict(orient="records")
+        args["root"] = None if self._root is None else str(self._root)
+        data = self.dataset
+        if isinstance(data, pa.Table):
+            args["parquet"] = data.to_pylist()
+            args["indices"] = None
+            args["backend"] = "arrow"
+        else:
+            args["parquet"] = data.to_dict(orient="records")
         return args
 
     @classmethod
     @override
     def from_dict(cls, data: Mapping[str, Any]) -> Self:
         data = {**data}
-        data["parquet"] = pd.DataFrame(data["parquet"])
+        if data.pop("backend", "pandas") == "arrow":
+            data["parquet"] = pa.Table.from_pylist(data["parquet"])
+        else:
+            data["parquet"] = pd.DataFrame(data["parquet"])
         return cls(**data)
 
     @classmethod
@@ -103,4 +299,4 @@ class ParquetDataset(Dataset[pd.DataFrame, S], ABC):
         raise TypeError(f"Dataset must be an instance of {cls.__name__}")
 
 
-__all__ = ["ParquetDataset"]
+__all__ = ["ParquetDataset", "ParquetData"]
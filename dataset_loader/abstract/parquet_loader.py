@@ -1,15 +1,40 @@
 from __future__ import annotations
 
+import os
+import json
+import hashlib
+import warnings
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 
-from abc import ABC, abstractmethod
+from tqdm import tqdm
+from abc import ABC
 from pathlib import Path
-from typing import Any
-from typing_extensions import override
+from typing import Any, Literal, overload
+from typing_extensions import TypeAlias, override
 from functools import cached_property
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
 
 from dataset_loader.base import DatasetLoader
+from dataset_loader.audio import probe_audio
+
+PROBE_COLUMNS = ("duration", "num_samples", "native_sr", "channels")
+MANIFEST_SUFFIX = ".manifest.json"
+MANIFEST_VERSION = 1
+# filters가 row group 통계로 건너뛸 수 있도록 row group을 작게 나눈다.
+ROW_GROUP_SIZE = 16_384
+ARROW_CACHE_SUFFIX = ".arrow"
+# Arrow IPC 캐시의 schema metadata에 원본 parquet의 크기와 mtime을 저장하는 키
+ARROW_CACHE_SOURCE_KEY = b"dataset_loader.source"
+
+ParquetBackend: TypeAlias = Literal["pandas", "arrow"]
+FilterTerm: TypeAlias = tuple[str, str, Any]
+ParquetFilters: TypeAlias = (
+    pc.Expression | Sequence[FilterTerm] | Sequence[Sequence[FilterTerm]]
+)
 
 
 class ParquetLoader(DatasetLoader, ABC):
@@ -19,11 +44,15 @@ class ParquetLoader(DatasetLoader, ABC):
         dir_name: str | None = None,
         path: str | Path | None = None,
         parquet_name_and_path: Mapping[str, str] | None = None,
+        audio_column: str | None = None,
+        required_columns: Sequence[str] = (),
     ):
         super().__init__(dir_name=dir_name, path=path)
         if parquet_name_and_path is None:
             parquet_name_and_path = {}
         self._parquet_name_and_path = {**parquet_name_and_path}
+        self._audio_column = audio_column
+        self._required_columns = tuple(required_columns)
 
     @cached_property
     def names(self) -> tuple[str, ...]:
@@ -33,16 +62,100 @@ class ParquetLoader(DatasetLoader, ABC):
     def parquet_name_and_path(self) -> dict[str, str]:
         return self._parquet_name_and_path.copy()
 
+    @property
+    def audio_column(self) -> str | None:
+        """prepare에서 헤더를 읽을 오디오 경로 컬럼. None이면 헤더를 읽지 않는다."""
+        return self._audio_column
+
+    @property
+    def required_columns(self) -> tuple[str, ...]:
+        """load에서 columns를 지정해도 항상 읽는 컬럼. 데이터셋이 샘플을 만들 때 필요한 컬럼이다."""
+        return self._required_columns
+
+    @overload
+    def load(
+        self,
+        *,
+        name: str,
+        prepare_dir: str = ".prepare",
+        columns: Sequence[str] | None = None,
+        filters: ParquetFilters | None = None,
+        backend: Literal["pandas"] = "pandas",
+        cache: bool = True,
+    ) -> pd.DataFrame: ...
+    @overload
+    def load(
+        self,
+        *,
+        name: str,
+        prepare_dir: str = ".prepare",
+        columns: Sequence[str] | None = None,
+        filters: ParquetFilters | None = None,
+        backend: Literal["arrow"],
+        cache: bool = True,
+    ) -> pa.Table: ...
     @override
-    def load(self, *, name: str, prepare_dir: str = ".prepare") -> pd.DataFrame:
+    def load(
+        self,
+        *,
+        name: str,
+        prepare_dir: str = ".prepare",
+        columns: Sequence[str] | None = None,
+        filters: ParquetFilters | None = None,
+        backend: ParquetBackend = "pandas",
+        cache: bool = True,
+    ) -> pd.DataFrame | pa.Table:
+        """
+        준비된 parquet을 읽는다. \n
+        columns가 주어지면 required_columns와 함께 그 컬럼만 읽는다. filters는 pyarrow로 전달되어 row group 통계로
+        조건을 만족할 수 없는 row group은 읽지 않는다. filters에 쓰인 컬럼은 columns에 없어도 된다. \n
+        backend가 "arrow"이면 pyarrow.Table을 반환한다. ParquetDataset에 그대로 넘기면 pandas를 거치지 않고 행을 읽는다.
+        cache가 True이면 parquet 옆의 Arrow IPC 파일(<parquet 이름>.arrow)을 memory map으로 열어 디코딩 없이 바로 사용하므로,
+        여러 프로세스가 같은 split을 읽어도 페이지 캐시를 함께 쓴다. 캐시는 arrow backend로 처음 읽을 때 만들어지며,
+        캐시에 기록된 parquet의 크기와 mtime이 현재 parquet과 정확히 같지 않으면 이 호출에서 다시 만든다.
+        캐시를 쓸 때 filters와 columns는 memory map된 Table에 적용된다. \n
+        audio_column은 loader의 path 기준 상대 경로 문자열 그대로 반환된다. 데이터셋에 root=loader.path를 넘기면
+        오디오를 읽을 때 절대 경로로 바뀐다.
+
+        Args:
+            name (str): 읽을 split 이름
+            prepare_dir (str): parquet이 저장된 디렉토리
+            columns (Sequence[str] | None): 읽을 컬럼. None이면 모든 컬럼을 읽는다.
+            filters (ParquetFilters | None): pyarrow.compute.Expression(예: pc.field("duration") < 20) 또는
+                [("speaker", "in", {...})]와 같은 DNF 형식의 조건
+            backend (ParquetBackend): "pandas"이면 pd.DataFrame, "arrow"이면 pyarrow.Table을 반환한다.
+            cache (bool): backend가 "arrow"일 때 Arrow IPC 캐시를 사용할지 여부
+        Raises:
+            ValueError: name 또는 backend가 유효하지 않은 경우
+            FileNotFoundError: parquet이 없는 경우
+        """
         if name not in self.names:
             raise ValueError(f"Invalid config: {name}, expected one of {self.names}")
+        if backend not in ("pandas", "arrow"):
+            raise ValueError(f"Invalid backend: {backend}, expected 'pandas' or 'arrow'")
 
         parquet_path = self.path / prepare_dir / self._parquet_name_and_path[name]
         if not parquet_path.exists():
             raise FileNotFoundError(f"Parquet file not found: {parquet_path}")
 
-        return pd.read_parquet(parquet_path)
+        if columns is not None:
+            columns = list(dict.fromkeys([*self._required_columns, *columns]))
+        if backend == "pandas":
+            return pd.read_parquet(parquet_path, columns=columns, filters=filters)
+
+        table = _open_arrow_cache(parquet_path) if cache else None
+        if table is None:
+            table = pq.read_table(
+                parquet_path, columns=columns, filters=filters, memory_map=True
+            )
+        else:
+            if filters is not None:
+                if not isinstance(filters, pc.Expression):
+                    filters = pq.filters_to_expression(filters)
+                table = table.filter(filters)
+            if columns is not None:
+                table = table.select(columns)
+        return table
 
     def prepare(
         self,
@@ -51,37 +164,499 @@ class ParquetLoader(DatasetLoader, ABC):
         verbose: bool = True,
         prepare_dir: str = ".prepare",
         parse_options: Mapping[str, Any] | None = None,
+        probe: bool = True,
+        num_workers: int = 1,
+        incremental: bool = False,
+        hash_files: bool = False,
     ) -> None:
-        if name == "all":
-            for name in self.names:
-                self.prepare(
-                    name=name,
-                    verbose=verbose,
-                    prepare_dir=prepare_dir,
-                    parse_options=parse_options,
-                )
-            return
-        elif name not in self.names:
+        """
+        원본 파일을 파싱하여 parquet으로 저장한다. \n
+        probe가 True이고 audio_column이 있으면 오디오 헤더만 읽어 duration, num_samples, native_sr, channels 컬럼을 함께 저장한다.
+        파싱 단계에서 이미 만든 컬럼은 덮어쓰지 않는다. \n
+        num_workers가 1보다 크면 하나의 프로세스 풀에서 모든 split의 파일을 함께 파싱한다. 파일 단위 작업은
+        _list_files가 돌려준 순서대로 합쳐지므로 결과는 num_workers와 상관없이 같다.
+        _list_files를 구현하지 않은 로더는 split 단위로 병렬 처리된다. \n
+        incremental이 True이면 parquet이 있어도 건너뛰지 않고, parquet 옆의 manifest(<parquet>.manifest.json)에 기록된
+        원본 파일의 크기와 mtime(hash_files가 True이면 md5도)을 비교하여 추가되거나 바뀐 작업만 다시 파싱한다.
+        삭제된 작업의 행은 지워지고, 행은 _list_files의 순서대로 다시 저장된다. manifest가 없거나 parquet과 맞지 않으면 전체를 파싱한다.
+
+        Args:
+            name (str): 준비할 split 이름. "all"이면 모든 split을 준비한다.
+            verbose (bool): 진행 상황 출력 여부
+            prepare_dir (str): parquet을 저장할 디렉토리
+            parse_options (Mapping[str, Any] | None): _list_files(없으면 _parse_files)에 전달할 인자
+            probe (bool): 오디오 헤더를 읽을지 여부
+            num_workers (int): 파싱에 사용할 프로세스의 수. 1이면 현재 프로세스에서 순서대로 처리한다.
+            incremental (bool): 바뀐 파일만 다시 파싱할지 여부
+            hash_files (bool): incremental에서 md5를 함께 기록할지 여부. 크기나 mtime이 바뀌어도 md5가 같으면 다시 파싱하지 않는다.
+        Raises:
+            ValueError: name이 유효하지 않거나 num_workers가 양의 정수가 아닌 경우
+            NotImplementedError: incremental이 True인데 _list_files를 구현하지 않은 경우
+        """
+        if name != "all" and name not in self.names:
             raise ValueError(f"Invalid config: {name}, expected one of {self.names}")
+        if not isinstance(num_workers, int) or num_workers <= 0:
+            raise ValueError("num_workers must be a positive integer")
 
         if parse_options is None:
             parse_options = {}
+        column = self._audio_column if probe else None
 
-        parquet_path = self.path / prepare_dir / self._parquet_name_and_path[name]
+        targets: dict[str, Path] = {}
+        for split in self.names if name == "all" else (name,):
+            parquet_path = self.path / prepare_dir / self._parquet_name_and_path[split]
+            if parquet_path.exists() and not incremental:
+                if verbose:
+                    print(f"Parquet file already exists: {parquet_path}")
+            else:
+                targets[split] = parquet_path
+
+        if incremental:
+            self._prepare_incremental(
+                targets,
+                column=column,
+                parse_options=parse_options,
+                num_workers=num_workers,
+                hash_files=hash_files,
+                verbose=verbose,
+            )
+            return
+
+        if num_workers == 1:
+            for split, parquet_path in targets.items():
+                if verbose:
+                    print(f"Preparing {split} set and saving to {parquet_path}...")
+                data = self._parse_files(name=split, verbose=verbose, **parse_options)
+                failed = 0
+                if column is not None:
+                    for row in tqdm(data, desc=f"Probing {split}", disable=not verbose):
+                        failed += not _probe_row(self.path, row, column)
+                _write_parquet(parquet_path, data, name=split, failed=failed)
+            return
+
+        executor = ProcessPoolExecutor(max_workers=num_workers)
+        try:
+            jobs = {
+                split: self._submit_split(executor, split, column, parse_options)
+                for split in targets
+            }
+            for split, futures in jobs.items():
+                if verbose:
+                    print(f"Preparing {split} set and saving to {targets[split]}...")
+                data = []
+                failed = 0
+                for future in tqdm(futures, desc=f"Parsing {split}", disable=not verbose):
+                    rows, n = future.result()
+                    data.extend(rows)
+                    failed += n
+                _write_parquet(targets[split], data, name=split, failed=failed)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _prepare_incremental(
+        self,
+        targets: Mapping[str, Path],
+        *,
+        column: str | None,
+        parse_options: Mapping[str, Any],
+        num_workers: int,
+        hash_files: bool,
+        verbose: bool,
+    ) -> None:
+        executor = None
+        if num_workers > 1:
+            executor = ProcessPoolExecutor(max_workers=num_workers)
+        try:
+            # 모든 split의 바뀐 작업을 먼저 제출하여 하나의 풀을 함께 사용한다.
+            plans = {
+                split: self._plan_split(
+                    split,
+                    parquet_path,
+                    executor=executor,
+                    column=column,
+                    parse_options=parse_options,
+                    hash_files=hash_files,
+                )
+                for split, parquet_path in targets.items()
+            }
+            for split, (previous, units) in plans.items():
+                parquet_path = targets[split]
+                parsed = sum(not isinstance(work, range) for _, work in units)
+                removed = len(previous.keys() - {entry["key"] for entry, _ in units})
+                if verbose:
+                    print(
+                        f"Updating {split} set in {parquet_path}: {parsed} parsed, "
+                        f"{len(units) - parsed} unchanged, {removed} removed"
+                    )
+                entries = [entry for entry, _ in units]
+                if parsed == 0 and [e["key"] for e in entries] == list(previous):
+                    # 행은 그대로이고 mtime만 바뀐 파일이 있을 수 있으므로 manifest만 갱신한다.
+                    _save_manifest(_manifest_path(parquet_path), entries)
+                    continue
+
+                data, failed = self._merge_units(
+                    split, parquet_path, units, column=column, verbose=verbose
+                )
+                _write_parquet(parquet_path, data, name=split, failed=failed)
+                _save_manifest(_manifest_path(parquet_path), entries)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    def _plan_split(
+        self,
+        name: str,
+        parquet_path: Path,
+        *,
+        executor: Executor | None,
+        column: str | None,
+        parse_options: Mapping[str, Any],
+        hash_files: bool,
+    ) -> tuple[dict[str, dict[str, Any]], list[tuple[dict[str, Any], Any]]]:
+        """
+        split의 작업마다 manifest 항목과 할 일을 정한다. 바뀌지 않은 작업은 기존 parquet의 행 범위(range),
+        바뀐 작업은 executor에 제출한 Future(executor가 None이면 작업 자체)가 된다.
+        """
+        try:
+            files = self._list_files(name=name, **parse_options)
+        except NotImplementedError:
+            raise NotImplementedError(
+                f"{type(self).__name__} does not support incremental prepare: "
+                "_list_files is not implemented"
+            ) from None
+
+        previous = _load_manifest(_manifest_path(parquet_path), parquet_path)
+        offsets: dict[str, range] = {}
+        start = 0
+        for key, old_entry in previous.items():
+            offsets[key] = range(start, start + old_entry["num_rows"])
+            start += old_entry["num_rows"]
+
+        units: list[tuple[dict[str, Any], Any]] = []
+        for file in files:
+            key = _relpath(self.path, file)
+            old = previous.get(key, {})
+            sources = _source_state(
+                self.path,
+                self._source_files(file, name=name),
+                old.get("sources", {}),
+                hash_files=hash_files,
+            )
+            entry: dict[str, Any] = {"key": key, "sources": sources}
+            if old and _unchanged(sources, old["sources"]):
+                entry["num_rows"] = old["num_rows"]
+                units.append((entry, offsets[key]))
+            elif executor is not None:
+                future = executor.submit(_parse_file_in_worker, self, file, name, column)
+                units.append((entry, future))
+            else:
+                units.append((entry, file))
+        return previous, units
+
+    def _merge_units(
+        self,
+        name: str,
+        parquet_path: Path,
+        units: list[tuple[dict[str, Any], Any]],
+        *,
+        column: str | None,
+        verbose: bool,
+    ) -> tuple[pd.DataFrame, int]:
+        old_data = None
+        if any(isinstance(work, range) for _, work in units):
+            old_data = pd.read_parquet(parquet_path)
+        pieces: list[pd.DataFrame] = []
+        rows: list[dict[str, Any]] = []
+        span: range | None = None
+        failed = 0
+
+        # 연속된 기존 행과 새 행은 한 조각으로 묶어 concat할 조각의 수를 줄인다.
+        def flush() -> None:
+            nonlocal span
+            if span is not None and old_data is not None:
+                pieces.append(old_data.iloc[span.start : span.stop])
+                span = None
+            if rows:
+                pieces.append(pd.DataFrame(rows))
+                rows.clear()
+
+        for entry, work in tqdm(units, desc=f"Parsing {name}", disable=not verbose):
+            if isinstance(work, range):
+                if rows:
+                    flush()
+                if span is not None and span.stop == work.start:
+                    span = range(span.start, work.stop)
+                else:
+                    flush()
+                    span = work
+                continue
+
+            if span is not None:
+                flush()
+            if isinstance(work, Future):
+                new_rows, n = work.result()
+            else:
+                new_rows, n = _parse_file_in_worker(self, work, name, column)
+            entry["num_rows"] = len(new_rows)
+            rows.extend(new_rows)
+            failed += n
+        flush()
+
+        if not pieces:
+            return pd.DataFrame(), failed
+        return pd.concat(pieces, ignore_index=True), failed
+
+    def _source_files(self, file: Any, *, name: str) -> list[Path]:
+        """
+        _list_files가 돌려준 작업 하나를 이루는 원본 파일 목록을 반환한다. incremental prepare는 이 파일들의
+        크기와 mtime으로 작업이 바뀌었는지 판단한다. 기본 구현은 작업이 Path이면 그 파일 하나를 반환한다.
+        """
+        if not isinstance(file, Path):
+            raise TypeError(
+                f"Cannot determine source files of {file!r}; override _source_files"
+            )
+        return [file]
+
+    def _submit_split(
+        self,
+        executor: Executor,
+        name: str,
+        column: str | None,
+        parse_options: Mapping[str, Any],
+    ) -> list[Future[tuple[list[dict[str, Any]], int]]]:
+        try:
+            files = self._list_files(name=name, **parse_options)
+        except NotImplementedError:
+            return [
+                executor.submit(_parse_split_in_worker, self, name, column, parse_options)
+            ]
+        return [
+            executor.submit(_parse_file_in_worker, self, file, name, column)
+            for file in files
+        ]
+
+    def _parse_files(
+        self, *, name: str, verbose: bool = True, **options: Any
+    ) -> list[dict[str, Any]]:
+        """
+        split의 모든 파일을 파싱한다. 기본 구현은 _list_files(name, **options)가 돌려준 순서대로 _parse_file의 결과를 이어 붙인다.
+        파일 단위로 나눌 수 없는 로더는 이 메서드를 직접 구현한다.
+        """
+        data: list[dict[str, Any]] = []
+        for file in tqdm(
+            self._list_files(name=name, **options),
+            desc=f"Parsing {name}",
+            disable=not verbose,
+        ):
+            data.extend(self._parse_file(file, name=name))
+        return data
+
+    def _list_files(self, *, name: str) -> Sequence[Any]:
+        """split을 이루는 파일 단위 작업 목록을 결정적인 순서로 반환한다. 각 항목은 pickle 가능해야 한다."""
+        raise NotImplementedError("Subclasses must implement _list_files method")
+
+    def _parse_file(self, file: Any, *, name: str) -> list[dict[str, Any]]:
+        """_list_files가 돌려준 작업 하나를 파싱하여 행 목록을 반환한다. 워커 프로세스에서 실행될 수 있다."""
+        raise NotImplementedError("Subclasses must implement _parse_file method")
+
+
+def _probe_row(root: Path, row: dict[str, Any], column: str) -> bool:
+    """행에 오디오 헤더 정보를 채운다. 헤더를 읽지 못하면 값은 None이 되고 False를 반환한다."""
+    try:
+        info = probe_audio(root / row[column]).to_dict()
+        probed = True
+    except (FileNotFoundError, RuntimeError):
+        info = dict.fromkeys(PROBE_COLUMNS)
+        probed = False
+    for key, value in info.items():
+        row.setdefault(key, value)
+    return probed
+
+
+def _parse_file_in_worker(
+    loader: ParquetLoader, file: Any, name: str, column: str | None
+) -> tuple[list[dict[str, Any]], int]:
+    rows = loader._parse_file(file, name=name)
+    if column is None:
+        return rows, 0
+    return rows, sum(not _probe_row(loader.path, row, column) for row in rows)
+
+
+def _parse_split_in_worker(
+    loader: ParquetLoader,
+    name: str,
+    column: str | None,
+    parse_options: Mapping[str, Any],
+) -> tuple[list[dict[str, Any]], int]:
+    rows = loader._parse_files(name=name, verbose=False, **parse_options)
+    if column is None:
+        return rows, 0
+    return rows, sum(not _probe_row(loader.path, row, column) for row in rows)
+
+
+def _relpath(root: Path, file: Any) -> str:
+    if not isinstance(file, Path):
+        return str(file)
+    try:
+        return file.relative_to(root).as_posix()
+    except ValueError:
+        return file.as_posix()
+
+
+def _file_md5(file: Path, chunk_size: int = 1 << 20) -> str:
+    hash_md5 = hashlib.md5()
+    with open(file, "rb") as f:
+        while chunk := f.read(chunk_size):
+            hash_md5.update(chunk)
+    return hash_md5.hexdigest()
+
+
+def _source_state(
+    root: Path,
+    sources: Sequence[Path],
+    previous: Mapping[str, Mapping[str, Any]],
+    *,
+    hash_files: bool,
+) -> dict[str, dict[str, Any]]:
+    """원본 파일의 크기와 mtime을 읽는다. hash_files이면 md5도 기록하되, 크기와 mtime이 같으면 이전 md5를 재사용한다."""
+    state: dict[str, dict[str, Any]] = {}
+    for source in sources:
+        key = _relpath(root, source)
+        stat = source.stat()
+        entry: dict[str, Any] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        if hash_files:
+            old = previous.get(key, {})
+            same = old.get("size") == entry["size"]
+            same = same and old.get("mtime_ns") == entry["mtime_ns"]
+            entry["md5"] = old["md5"] if same and "md5" in old else _file_md5(source)
+        state[key] = entry
+    return state
+
+
+def _unchanged(
+    state: Mapping[str, Mapping[str, Any]], previous: Mapping[str, Mapping[str, Any]]
+) -> bool:
+    if state.keys() != previous.keys():
+        return False
+    for key, entry in state.items():
+        old = previous[key]
+        if "md5" in entry and "md5" in old:
+            if entry["md5"] != old["md5"]:
+                return False
+        elif (entry["size"], entry["mtime_ns"]) != (old["size"], old["mtime_ns"]):
+            return False
+    return True
+
+
+def _manifest_path(parquet_path: Path) -> Path:
+    return parquet_path.with_name(parquet_path.name + MANIFEST_SUFFIX)
+
+
+def _load_manifest(
+    manifest_path: Path, parquet_path: Path
+) -> dict[str, dict[str, Any]]:
+    """
+    manifest를 작업 key 순서의 dict로 읽는다. 파일이 없거나 손상되었거나 행 수가 parquet과 다르면
+    빈 dict를 반환하여 전체를 다시 파싱하게 한다.
+    """
+    if not manifest_path.exists() or not parquet_path.exists():
+        return {}
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("version") != MANIFEST_VERSION:
+            return {}
+        entries = {entry["key"]: entry for entry in manifest["files"]}
+        num_rows = sum(entry["num_rows"] for entry in entries.values())
+    except (OSError, ValueError, KeyError, TypeError):
+        return {}
+
+    if pq.ParquetFile(parquet_path).metadata.num_rows != num_rows:
+        return {}
+    return entries
+
+
+def _save_manifest(manifest_path: Path, entries: list[dict[str, Any]]) -> None:
+    tmp_file = manifest_path.with_name(manifest_path.name + ".tmp")
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump({"version": MANIFEST_VERSION, "files": entries}, f)
+    os.replace(tmp_file, manifest_path)
+
+
+def _write_parquet(
+    parquet_path: Path,
+    data: pd.DataFrame | list[dict[str, Any]],
+    *,
+    name: str,
+    failed: int,
+) -> None:
+    if failed:
+        warnings.warn(
+            f"Could not probe {failed} of {len(data)} audio files in {name}",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+    parquet_path.parent.mkdir(parents=True, exist_ok=True)
+    if not isinstance(data, pd.DataFrame):
+        data = pd.DataFrame(data)
+    data.to_parquet(parquet_path, row_group_size=ROW_GROUP_SIZE)
+    # 캐시는 arrow backend로 읽을 때 다시 만든다.
+    _arrow_cache_path(parquet_path).unlink(missing_ok=True)
+
+
+def _arrow_cache_path(parquet_path: Path) -> Path:
+    return parquet_path.with_suffix(ARROW_CACHE_SUFFIX)
+
+
+def _source_fingerprint(parquet_path: Path) -> bytes:
+    stat = parquet_path.stat()
+    return json.dumps({"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}).encode()
+
+
+def _write_arrow_cache(parquet_path: Path) -> None:
+    """
+    parquet을 압축하지 않은 Arrow IPC 파일로 저장한다. 다른 프로세스가 읽는 중이어도 안전하도록 바꿔치기한다.
+    schema metadata에 읽기 전 parquet의 크기와 mtime을 기록한다.
+    """
+    fingerprint = _source_fingerprint(parquet_path)
+    table = pq.read_table(parquet_path)
+    metadata = {**(table.schema.metadata or {}), ARROW_CACHE_SOURCE_KEY: fingerprint}
+    table = table.replace_schema_metadata(metadata)
+    cache_path = _arrow_cache_path(parquet_path)
+    tmp_file = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    with pa.OSFile(str(tmp_file), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table, max_chunksize=ROW_GROUP_SIZE)
+    os.replace(tmp_file, cache_path)
+
+
+def _open_arrow_cache(parquet_path: Path) -> pa.Table | None:
+    """
+    Arrow IPC 캐시를 memory map으로 연다. 캐시가 없거나 기록된 parquet의 크기와 mtime이 현재 parquet과 다르면
+    다시 만들고, 캐시를 쓸 수 없는 경우(읽기 전용 디렉토리 등)에는 None을 반환한다.
+    """
+    cache_path = _arrow_cache_path(parquet_path)
+    try:
+        table = _read_arrow_cache(cache_path, _source_fingerprint(parquet_path))
+        if table is None:
+            _write_arrow_cache(parquet_path)
+            table = _read_arrow_cache(cache_path, _source_fingerprint(parquet_path))
+        return table
+    except (OSError, pa.ArrowInvalid):
+        return None
 
-        if parquet_path.exists():
-            if verbose:
-                print(f"Parquet file already exists: {parquet_path}")
-        else:
-            if verbose:
-                print(f"Preparing {name} set and saving to {parquet_path}...")
-            data = self._parse_files(name=name, verbose=verbose, **parse_options)
-            parquet_path.parent.mkdir(parents=True, exist_ok=True)
-            pd.DataFrame(data).to_parquet(parquet_path)
 
-    @abstractmethod
-    def _parse_files(self, *, name: str, verbose: bool = True) -> list[dict[str, Any]]:
-        raise NotImplementedError("Subclasses must implement _parse_files method")
+def _read_arrow_cache(cache_path: Path, fingerprint: bytes) -> pa.Table | None:
+    """캐시에 기록된 fingerprint가 같으면 캐시를 읽고, 없거나 다르면 None을 반환한다."""
+    try:
+        # Table의 버퍼가 memory map을 참조하므로 파일을 닫지 않는다.
+        reader = pa.ipc.open_file(pa.memory_map(str(cache_path), "r"))
+    except (FileNotFoundError, pa.ArrowInvalid):
+        return None
+    metadata = dict(reader.schema.metadata or {})
+    if metadata.pop(ARROW_CACHE_SOURCE_KEY, None) != fingerprint:
+        return None
+    return reader.read_all().replace_schema_metadata(metadata or None)
 
 
-__all__ = ["ParquetLoader"]
+__all__ = ["ParquetLoader", "ParquetFilters", "ParquetBackend"]
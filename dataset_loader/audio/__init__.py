@@ -0,0 +1,31 @@
+# dataset_loader/audio/__init__.py
+
+from dataset_loader.audio.probe import AudioInfo, probe_audio, probe_sph
+from dataset_loader.audio.disk_cache import AudioDiskCache
+from dataset_loader.audio.memory_cache import AudioMemoryCache
+from dataset_loader.audio.resample import (
+    ResampleQuality,
+    RESAMPLE_QUALITIES,
+    DEFAULT_RESAMPLE_QUALITY,
+    check_resample_quality,
+    resample,
+)
+from dataset_loader.audio.segment import load_segment, load_audio
+from dataset_loader.audio.stream import frame_audio, stream_audio
+
+__all__ = [
+    "AudioInfo",
+    "probe_audio",
+    "probe_sph",
+    "AudioDiskCache",
+    "AudioMemoryCache",
+    "ResampleQuality",
+    "RESAMPLE_QUALITIES",
+    "DEFAULT_RESAMPLE_QUALITY",
+    "check_resample_quality",
+    "resample",
+    "load_segment",
+    "load_audio",
+    "frame_audio",
+    "stream_audio",
+]
@@ -0,0 +1,193 @@
+# pyright: reportUnnecessaryIsInstance=false
+
+from __future__ import annotations
+
+import os
+import hashlib
+import threading
+import numpy as np
+import numpy.typing as npt
+
+from pathlib import Path
+from typing import Any, Literal
+from collections.abc import Callable
+
+CACHE_SUFFIX = ".npy"
+INT16_SCALE = 32767.0
+# max_bytes를 넘으면 이 비율까지 지워서 디렉토리를 다시 읽는 횟수를 줄인다.
+EVICT_TARGET = 0.9
+
+
+class AudioDiskCache:
+    """
+    디코딩과 리샘플이 끝난 오디오를 .npy 파일로 저장하는 디스크 캐시이다. \n
+    키는 원본 경로, 원본의 크기와 mtime, 목표 sr로 만들어지므로 원본이 바뀌거나 sr이 다르면 다시 디코딩한다.
+    읽기는 np.load(mmap_mode="r")로 memory map하므로 반환된 배열은 읽기 전용이다. \n
+    저장된 파일의 총 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 파일부터 max_bytes의 EVICT_TARGET 비율까지 지우므로,
+    디렉토리를 다시 읽는 비용은 여러 번의 put에 나눠진다. 사용 시각은 파일의 mtime으로 기록하므로
+    같은 디렉토리를 여러 프로세스가 함께 사용할 수 있다. 파일은 임시 파일에 쓴 뒤 바꿔치기하므로 읽는 쪽은 쓰다 만 파일을 보지 않는다.
+
+    Attributes:
+        directory (str | Path): 캐시 디렉토리
+        max_bytes (int): 캐시의 최대 크기(바이트)
+        dtype (Literal["float32", "int16"]): 저장 형식. int16이면 크기가 절반이 되지만 읽을 때 float32로 변환하므로 memory map되지 않는다.
+    Raises:
+        ValueError: max_bytes가 양의 정수가 아니거나 dtype이 유효하지 않은 경우 발생한다.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        max_bytes: int,
+        dtype: Literal["float32", "int16"] = "float32",
+    ):
+        if not isinstance(max_bytes, int) or max_bytes <= 0:
+            raise ValueError("max_bytes must be a positive integer")
+        if dtype not in ("float32", "int16"):
+            raise ValueError(f"Invalid dtype: {dtype}, expected 'float32' or 'int16'")
+
+        self._directory = Path(directory)
+        self._max_bytes = max_bytes
+        self._dtype = dtype
+        self._size: int | None = None
+        self._lock = threading.Lock()
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @property
+    def dtype(self) -> Literal["float32", "int16"]:
+        return self._dtype
+
+    def key(self, path: str | Path, sr: int, *extra: Any) -> str:
+        """원본 경로, 크기, mtime, sr과 extra로 캐시 키를 만든다."""
+        path = Path(path)
+        stat = path.stat()
+        parts = [
+            str(path.resolve()),
+            str(stat.st_size),
+            str(stat.st_mtime_ns),
+            str(sr),
+            self._dtype,
+            *map(str, extra),
+        ]
+        return hashlib.sha1("\0".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> npt.NDArray[np.float32] | None:
+        """캐시된 오디오를 반환한다. 없으면 None을 반환한다."""
+        file = self._file(key)
+        try:
+            audio: npt.NDArray[Any] = np.load(file, mmap_mode="r")
+            os.utime(file)
+        except FileNotFoundError:
+            return None
+        if audio.dtype == np.int16:
+            return (audio / INT16_SCALE).astype(np.float32)
+        return audio
+
+    def put(self, key: str, audio: npt.NDArray[np.float32]) -> None:
+        """오디오를 저장하고 캐시가 max_bytes를 넘으면 오래된 파일을 지운다."""
+        if self._dtype == "int16":
+            data: npt.NDArray[Any] = np.round(
+                np.clip(audio, -1.0, 1.0) * INT16_SCALE
+            ).astype(np.int16)
+        else:
+            data = np.asarray(audio, dtype=np.float32)
+
+        file = self._file(key)
+        tmp_file = file.with_name(
+            f"{file.stem}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        with open(tmp_file, "wb") as f:
+            np.save(f, data)
+        os.replace(tmp_file, file)
+
+        with self._lock:
+            if self._size is not None:
+                self._size += file.stat().st_size
+            if self._size is None or self._size > self._max_bytes:
+                self._evict()
+
+    def get_or_load(
+        self,
+        path: str | Path,
+        sr: int,
+        load: Callable[[], npt.NDArray[np.float32]],
+        *extra: Any,
+    ) -> npt.NDArray[np.float32]:
+        """
+        캐시된 오디오가 있으면 반환하고, 없으면 load로 디코딩하여 저장한다. 처음 디코딩한 경우에는 load의 결과를 그대로 반환한다.
+        """
+        key = self.key(path, sr, *extra)
+        audio = self.get(key)
+        if audio is not None:
+            return audio
+        audio = load()
+        self.put(key, audio)
+        return audio
+
+    def size(self) -> int:
+        """캐시 디렉토리에 저장된 파일의 총 크기(바이트)"""
+        return sum(stat.st_size for _, stat in self._entries())
+
+    def clear(self) -> None:
+        """캐시된 파일을 모두 지운다."""
+        with self._lock:
+            for file, _ in self._entries():
+                file.unlink(missing_ok=True)
+            self._size = 0
+
+    def _file(self, key: str) -> Path:
+        return self._directory / f"{key}{CACHE_SUFFIX}"
+
+    def _entries(self) -> list[tuple[Path, os.stat_result]]:
+        entries: list[tuple[Path, os.stat_result]] = []
+        for file in self._directory.glob(f"*{CACHE_SUFFIX}"):
+            try:
+                entries.append((file, file.stat()))
+            except FileNotFoundError:
+                continue
+        return entries
+
+    def _evict(self) -> None:
+        # 다른 프로세스도 같은 디렉토리를 쓰므로 지울 때는 디렉토리를 다시 읽어 크기를 맞춘다.
+        entries = sorted(self._entries(), key=lambda entry: entry[1].st_mtime_ns)
+        size = sum(stat.st_size for _, stat in entries)
+        if size <= self._max_bytes:
+            self._size = size
+            return
+        target = int(self._max_bytes * EVICT_TARGET)
+        for file, stat in entries:
+            if size <= target:
+                break
+            file.unlink(missing_ok=True)
+            size -= stat.st_size
+        self._size = size
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {
+            "directory": self._directory,
+            "max_bytes": self._max_bytes,
+            "dtype": self._dtype,
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(  # type: ignore[misc]
+            state["directory"], max_bytes=state["max_bytes"], dtype=state["dtype"]
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"AudioDiskCache(directory={str(self._directory)!r}, "
+            f"max_bytes={self._max_bytes}, dtype={self._dtype!r})"
+        )
+
+
+__all__ = ["AudioDiskCache"]
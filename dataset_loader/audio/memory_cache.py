@@ -0,0 +1,110 @@
+# pyright: reportUnnecessaryIsInstance=false
+
+from __future__ import annotations
+
+import threading
+import numpy as np
+import numpy.typing as npt
+
+from typing import Any
+from collections.abc import Callable, Hashable
+
+from cachetools import LRUCache
+
+
+def _nbytes(audio: npt.NDArray[Any]) -> int:
+    return int(audio.nbytes)
+
+
+class AudioMemoryCache:
+    """
+    디코딩된 오디오를 프로세스 메모리에 두는 LRU 캐시이다. \n
+    같은 샘플을 반복해서 읽는 평가나 한 녹음을 여러 구간으로 나눠 읽는 경우 디코딩을 한 번만 한다.
+    캐시된 배열의 총 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 배열부터 버린다. max_bytes보다 큰 배열은 캐시하지 않는다. \n
+    여러 데이터셋과 thread_iter의 스레드가 하나의 인스턴스를 함께 사용할 수 있다. 캐시된 배열은 공유되므로 읽기 전용으로 바뀐다.
+    pickle하면 설정만 전달되어 다른 프로세스에서는 빈 캐시로 시작한다.
+
+    Attributes:
+        max_bytes (int): 캐시의 최대 크기(바이트)
+        hits (int): 캐시에서 찾은 횟수
+        misses (int): 캐시에 없어 디코딩한 횟수
+        size (int): 캐시된 배열의 총 크기(바이트)
+    Raises:
+        ValueError: max_bytes가 양의 정수가 아닌 경우 발생한다.
+    """
+
+    def __init__(self, max_bytes: int):
+        if not isinstance(max_bytes, int) or max_bytes <= 0:
+            raise ValueError("max_bytes must be a positive integer")
+
+        self._max_bytes = max_bytes
+        self._cache: LRUCache[Hashable, npt.NDArray[np.float32]] = LRUCache(
+            maxsize=max_bytes, getsizeof=_nbytes
+        )
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def size(self) -> int:
+        with self._lock:
+            return int(self._cache.currsize)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._cache)
+
+    def get_or_load(
+        self, key: Hashable, load: Callable[[], npt.NDArray[np.float32]]
+    ) -> npt.NDArray[np.float32]:
+        """
+        key로 캐시된 배열을 반환하고, 없으면 load로 디코딩하여 캐시한다. 디코딩은 lock 밖에서 실행되므로
+        같은 key를 동시에 요청하면 중복으로 디코딩될 수 있다.
+        """
+        with self._lock:
+            audio = self._cache.get(key)
+            if audio is not None:
+                self._hits += 1
+                return audio
+            self._misses += 1
+
+        audio = load()
+        if audio.nbytes <= self._max_bytes:
+            audio.flags.writeable = False
+            with self._lock:
+                self._cache[key] = audio
+        return audio
+
+    def clear(self) -> None:
+        """캐시를 비우고 hits와 misses를 0으로 되돌린다."""
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"max_bytes": self._max_bytes}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(state["max_bytes"])  # type: ignore[misc]
+
+    def __repr__(self) -> str:
+        return (
+            f"AudioMemoryCache(max_bytes={self._max_bytes}, size={self.size}, "
+            f"hits={self._hits}, misses={self._misses})"
+        )
+
+
+__all__ = ["AudioMemoryCache"]
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import soundfile as sf
+
+from pathlib import Path
+from typing import Any
+from dataclasses import dataclass
+
+SPH_HEADER_PREFIX = 16
+
+
+@dataclass(frozen=True, slots=True)
+class AudioInfo:
+    """
+    디코딩 없이 헤더에서 읽은 오디오 파일 정보이다.
+
+    Attributes:
+        num_samples (int): 채널당 샘플 수
+        native_sr (int): 파일의 샘플링 레이트
+        channels (int): 채널 수
+        duration (float): 길이(초)
+    """
+
+    num_samples: int
+    native_sr: int
+    channels: int
+
+    @property
+    def duration(self) -> float:
+        return self.num_samples / self.native_sr
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "duration": self.duration,
+            "num_samples": self.num_samples,
+            "native_sr": self.native_sr,
+            "channels": self.channels,
+        }
+
+
+def probe_audio(path: str | Path) -> AudioInfo:
+    """
+    오디오 파일의 헤더만 읽어 AudioInfo를 반환한다. \n
+    SPH는 NIST 헤더를 직접 읽고, libsndfile이 읽을 수 있는 형식(FLAC, WAV 등)은 soundfile로, 그 외(MP4 등)는 ffprobe로 읽는다.
+
+    Raises:
+        FileNotFoundError: 파일이 없는 경우
+        RuntimeError: 헤더를 읽을 수 없는 경우
+    """
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"Audio file not found: {path}")
+
+    if path.suffix.lower() == ".sph":
+        try:
+            return probe_sph(path)
+        except RuntimeError:
+            pass
+
+    try:
+        info = sf.info(str(path))
+    except (sf.LibsndfileError, RuntimeError):
+        return _probe_ffprobe(path)
+    return AudioInfo(
+        num_samples=int(info.frames),
+        native_sr=int(info.samplerate),
+        channels=int(info.channels),
+    )
+
+
+def probe_sph(path: str | Path) -> AudioInfo:
+    """
+    NIST SPHERE 헤더의 sample_count, sample_rate, channel_count를 읽는다. shorten 등으로 압축된 파일도 헤더는 읽을 수 있다.
+
+    Raises:
+        RuntimeError: NIST SPHERE 헤더가 아니거나 필요한 필드가 없는 경우
+    """
+    with open(path, "rb") as f:
+        head = f.read(SPH_HEADER_PREFIX)
+        if not head.startswith(b"NIST_1A"):
+            raise RuntimeError(f"Not a NIST SPHERE file: {path}")
+        try:
+            header_size = int(head.split(b"\n")[1])
+        except (IndexError, ValueError) as e:
+            raise RuntimeError(f"Invalid NIST SPHERE header: {path}") from e
+        head += f.read(max(header_size - len(head), 0))
+
+    fields: dict[str, str] = {}
+    for line in head[:header_size].decode("ascii", errors="replace").splitlines()[2:]:
+        parts = line.split(maxsplit=2)
+        if parts and parts[0] == "end_head":
+            break
+        if len(parts) == 3:
+            fields[parts[0]] = parts[2]
+
+    try:
+        return AudioInfo(
+            num_samples=int(fields["sample_count"]),
+            native_sr=int(fields["sample_rate"]),
+            channels=int(fields.get("channel_count", 1)),
+        )
+    except (KeyError, ValueError) as e:
+        raise RuntimeError(f"Incomplete NIST SPHERE header: {path}") from e
+
+
+def _probe_ffprobe(path: Path) -> AudioInfo:
+    import ffmpeg
+
+    try:
+        probe = ffmpeg.probe(str(path), select_streams="a:0")
+    except (ffmpeg.Error, FileNotFoundError) as e:
+        raise RuntimeError(f"Cannot probe audio file: {path}") from e
+
+    streams = probe.get("streams", [])
+    if not streams:
+        raise RuntimeError(f"No audio stream in file: {path}")
+    stream = streams[0]
+
+    sample_rate, channels = stream.get("sample_rate"), stream.get("channels")
+    duration = stream.get("duration") or probe.get("format", {}).get("duration")
+    if sample_rate is None or channels is None:
+        raise RuntimeError(f"Incomplete audio stream info: {path}")
+    try:
+        sr = int(sample_rate)
+        if "duration_ts" in stream and stream.get("time_base") == f"1/{sr}":
+            num_samples = int(stream["duration_ts"])
+        elif duration is not None:
+            num_samples = round(float(duration) * sr)
+        else:
+            raise RuntimeError(f"Incomplete audio stream info: {path}")
+        return AudioInfo(num_samples=num_samples, native_sr=sr, channels=int(channels))
+    except ValueError as e:
+        raise RuntimeError(f"Incomplete audio stream info: {path}") from e
+
+
+__all__ = ["AudioInfo", "probe_audio", "probe_sph"]
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import math
+import numpy as np
+import numpy.typing as npt
+
+from typing import Literal, get_args
+from typing_extensions import TypeAlias
+
+ResampleQuality: TypeAlias = Literal[
+    "soxr_vhq", "soxr_hq", "soxr_mq", "soxr_lq", "soxr_qq", "polyphase"
+]
+RESAMPLE_QUALITIES: tuple[str, ...] = get_args(ResampleQuality)
+DEFAULT_RESAMPLE_QUALITY: ResampleQuality = "soxr_hq"
+SOXR_QUALITIES: dict[str, str] = {
+    "soxr_vhq": "VHQ",
+    "soxr_hq": "HQ",
+    "soxr_mq": "MQ",
+    "soxr_lq": "LQ",
+    "soxr_qq": "QQ",
+}
+
+
+def check_resample_quality(quality: str) -> None:
+    """
+    Raises:
+        ValueError: quality가 RESAMPLE_QUALITIES에 없는 경우
+    """
+    if quality not in RESAMPLE_QUALITIES:
+        raise ValueError(
+            f"Invalid resample quality: {quality}, expected one of {RESAMPLE_QUALITIES}"
+        )
+
+
+def soxr_quality(quality: str) -> str:
+    """
+    soxr.ResampleStream에 넘길 quality를 반환한다. polyphase는 블록 단위로 나눌 수 없으므로 스트리밍에서는 HQ를 사용한다.
+    """
+    check_resample_quality(quality)
+    return SOXR_QUALITIES.get(quality, "HQ")
+
+
+def resample(
+    wav: npt.NDArray[np.float32],
+    orig_sr: int,
+    target_sr: int,
+    *,
+    quality: ResampleQuality = DEFAULT_RESAMPLE_QUALITY,
+) -> npt.NDArray[np.float32]:
+    """
+    오디오를 orig_sr에서 target_sr로 리샘플한다. 두 sr이 같으면 리샘플하지 않는다. \n
+    soxr_*는 soxr의 해당 품질로, polyphase는 scipy.signal.resample_poly로 리샘플한다.
+    soxr_hq가 librosa.load의 기본값과 같고, 품질을 낮추거나 polyphase를 사용하면 더 빠르다.
+
+    Raises:
+        ValueError: quality가 유효하지 않은 경우
+    """
+    check_resample_quality(quality)
+    if orig_sr == target_sr:
+        return wav.astype(np.float32, copy=False)
+
+    if quality == "polyphase":
+        from scipy.signal import resample_poly
+
+        gcd = math.gcd(orig_sr, target_sr)
+        resampled = resample_poly(wav, target_sr // gcd, orig_sr // gcd, axis=-1)
+    else:
+        import soxr
+
+        resampled = soxr.resample(
+            wav, orig_sr, target_sr, quality=SOXR_QUALITIES[quality]
+        )
+    return np.asarray(resampled, dtype=np.float32)
+
+
+__all__ = [
+    "ResampleQuality",
+    "RESAMPLE_QUALITIES",
+    "DEFAULT_RESAMPLE_QUALITY",
+    "check_resample_quality",
+    "soxr_quality",
+    "resample",
+]
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import librosa
+import numpy as np
+import numpy.typing as npt
+import soundfile as sf
+
+from pathlib import Path
+
+from dataset_loader.audio.resample import (
+    ResampleQuality,
+    DEFAULT_RESAMPLE_QUALITY,
+    check_resample_quality,
+    resample,
+)
+
+
+def load_segment(
+    path: str | Path,
+    start: float = 0.0,
+    end: float | None = None,
+    *,
+    sr: int | None = None,
+    quality: ResampleQuality = DEFAULT_RESAMPLE_QUALITY,
+) -> npt.NDArray[np.float32]:
+    """
+    오디오 파일의 start~end초 구간만 읽어 mono float32로 반환한다. \n
+    libsndfile이 읽을 수 있는 형식(SPH, FLAC, WAV 등)은 soundfile로 start 위치로 seek한 뒤 구간의 프레임만 읽으므로
+    긴 녹음에서도 구간 길이만큼만 디코딩한다. 그 외 형식은 librosa.load의 offset과 duration으로 읽는다.
+    sr이 주어지고 파일의 sr과 다르면 읽은 구간만 quality로 리샘플한다.
+
+    Args:
+        path (str | Path): 오디오 파일 경로
+        start (float): 구간 시작(초)
+        end (float | None): 구간 끝(초). None이면 파일 끝까지 읽는다.
+        sr (int | None): 목표 sr. None이면 파일의 sr을 그대로 사용한다.
+        quality (ResampleQuality): 리샘플 방식. resample을 참고한다.
+    Raises:
+        ValueError: start가 음수이거나 end가 start보다 작거나 quality가 유효하지 않은 경우 발생한다.
+    """
+    check_resample_quality(quality)
+    if start < 0:
+        raise ValueError("start must be non-negative")
+    if end is not None and end < start:
+        raise ValueError("end must be greater than or equal to start")
+
+    try:
+        with sf.SoundFile(str(path)) as f:
+            native_sr = int(f.samplerate)
+            first = min(round(start * native_sr), f.frames)
+            last = f.frames if end is None else min(round(end * native_sr), f.frames)
+            f.seek(first)
+            frames = f.read(max(last - first, 0), dtype="float32", always_2d=True)
+    except (sf.LibsndfileError, RuntimeError):
+        duration = None if end is None else end - start
+        y, _ = librosa.load(
+            path, sr=sr, offset=start, duration=duration, res_type=quality
+        )
+        return y.astype(np.float32)
+
+    wav: npt.NDArray[np.float32] = frames.mean(axis=1)
+    if sr is None:
+        return wav
+    return resample(wav, native_sr, sr, quality=quality)
+
+
+def load_audio(
+    path: str | Path,
+    *,
+    sr: int | None = None,
+    quality: ResampleQuality = DEFAULT_RESAMPLE_QUALITY,
+) -> npt.NDArray[np.float32]:
+    """
+    오디오 파일 전체를 mono float32로 읽는다. librosa.load(path, sr=sr)와 같은 결과를 반환하되,
+    파일의 sr과 sr이 같으면 리샘플하지 않고 다르면 quality로 리샘플한다.
+    """
+    return load_segment(path, sr=sr, quality=quality)
+
+
+__all__ = ["load_segment", "load_audio"]
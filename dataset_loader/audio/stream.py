@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import numpy as np
+import numpy.typing as npt
+import soundfile as sf
+
+from pathlib import Path
+from collections.abc import Iterable, Iterator
+
+from dataset_loader.audio.resample import (
+    ResampleQuality,
+    DEFAULT_RESAMPLE_QUALITY,
+    soxr_quality,
+)
+
+# 파일에서 한 번에 읽는 샘플 수. 창 크기와 함께 스트리밍 중 메모리 사용량의 상한이 된다.
+READ_BLOCK_SIZE = 1 << 16
+FLOAT32_BYTES = 4
+
+
+def frame_audio(
+    blocks: Iterable[npt.NDArray[np.float32]], window: int, hop: int | None = None
+) -> Iterator[npt.NDArray[np.float32]]:
+    """
+    연속된 오디오 블록을 window 길이의 창으로 나눈다. 창은 0, hop, 2 * hop, ...에서 시작한다. \n
+    블록은 필요한 만큼만 소비하므로 버퍼는 window와 블록 하나의 길이를 넘지 않는다.
+    끝에 창을 채우지 못한 샘플이 남으면 마지막 창은 window보다 짧다. 반환된 창은 버퍼의 복사본이다.
+
+    Args:
+        blocks (Iterable[npt.NDArray[np.float32]]): 1차원 오디오 블록
+        window (int): 창의 길이(샘플 수)
+        hop (int | None): 창 사이의 간격(샘플 수). None이면 window와 같아 창이 겹치지 않는다.
+    Raises:
+        ValueError: window 또는 hop이 양의 정수가 아니거나 hop이 window보다 큰 경우 발생한다.
+    """
+    hop = window if hop is None else hop
+    if not isinstance(window, int) or window <= 0:
+        raise ValueError("window must be a positive integer")
+    if not isinstance(hop, int) or hop <= 0 or hop > window:
+        raise ValueError("hop must be a positive integer not greater than window")
+
+    buffer = np.empty(0, dtype=np.float32)
+    # buffer[0]의 스트림 위치와 마지막으로 내보낸 창의 끝 위치
+    offset, emitted = 0, 0
+    for block in blocks:
+        buffer = np.concatenate((buffer, np.asarray(block, dtype=np.float32)))
+        while len(buffer) >= window:
+            yield buffer[:window].copy()
+            emitted = offset + window
+            buffer = buffer[hop:]
+            offset += hop
+
+    if len(buffer) > 0 and offset + len(buffer) > emitted:
+        yield buffer.copy()
+
+
+def stream_audio(
+    path: str | Path,
+    *,
+    sr: int,
+    window: int,
+    hop: int | None = None,
+    start: float = 0.0,
+    end: float | None = None,
+    quality: ResampleQuality = DEFAULT_RESAMPLE_QUALITY,
+) -> Iterator[npt.NDArray[np.float32]]:
+    """
+    오디오 파일을 처음부터 조금씩 디코딩하면서 sr 기준 window 길이의 mono float32 창을 반환한다. \n
+    libsndfile이 읽을 수 있는 형식은 soundfile로 READ_BLOCK_SIZE 프레임씩 읽고 quality의 soxr 스트림으로 리샘플한다.
+    polyphase는 블록 단위로 나눌 수 없으므로 soxr_hq를 사용한다.
+    그 외 형식(MP4 등)은 ffmpeg 프로세스가 sr로 디코딩한 PCM을 파이프로 읽는다.
+    어느 경우든 파일 전체를 메모리에 올리지 않는다. start와 end(초)로 읽을 구간을 정할 수 있다.
+
+    Raises:
+        ValueError: sr이 양의 정수가 아니거나 구간 또는 quality가 잘못된 경우 발생한다.
+    """
+    resampler_quality = soxr_quality(quality)
+    if not isinstance(sr, int) or sr <= 0:
+        raise ValueError("sr must be a positive integer")
+    if start < 0:
+        raise ValueError("start must be non-negative")
+    if end is not None and end < start:
+        raise ValueError("end must be greater than or equal to start")
+
+    try:
+        file = sf.SoundFile(str(path))
+    except (sf.LibsndfileError, RuntimeError):
+        blocks = _ffmpeg_blocks(Path(path), sr, start, end)
+    else:
+        blocks = _soundfile_blocks(file, sr, start, end, resampler_quality)
+    yield from frame_audio(blocks, window, hop)
+
+
+def _soundfile_blocks(
+    file: sf.SoundFile, sr: int, start: float, end: float | None, quality: str
+) -> Iterator[npt.NDArray[np.float32]]:
+    with file:
+        native_sr = int(file.samplerate)
+        first = min(round(start * native_sr), file.frames)
+        last = file.frames if end is None else min(round(end * native_sr), file.frames)
+        file.seek(first)
+
+        resampler = None
+        if native_sr != sr:
+            import soxr
+
+            resampler = soxr.ResampleStream(
+                native_sr, sr, 1, dtype="float32", quality=quality
+            )
+
+        remaining = max(last - first, 0)
+        while remaining > 0:
+            frames = file.read(
+                min(READ_BLOCK_SIZE, remaining), dtype="float32", always_2d=True
+            )
+            if len(frames) == 0:
+                break
+            remaining -= len(frames)
+            block = frames.mean(axis=1)
+            if resampler is not None:
+                block = resampler.resample_chunk(block, last=remaining <= 0)
+            yield block
+        if resampler is not None and remaining > 0:
+            yield resampler.resample_chunk(np.empty(0, dtype=np.float32), last=True)
+
+
+def _ffmpeg_blocks(
+    path: Path, sr: int, start: float, end: float | None
+) -> Iterator[npt.NDArray[np.float32]]:
+    import ffmpeg
+
+    options: dict[str, float] = {"ss": start}
+    if end is not None:
+        options["t"] = end - start
+    process = (
+        ffmpeg.input(str(path), **options)
+        .output("pipe:", format="f32le", ac=1, ar=sr)
+        .global_args("-loglevel", "error")
+        .run_async(pipe_stdout=True)
+    )
+    try:
+        while data := process.stdout.read(READ_BLOCK_SIZE * FLOAT32_BYTES):
+            # read는 요청보다 적게 반환할 수 있으므로 샘플 경계에 맞춰 읽는다.
+            if rest := len(data) % FLOAT32_BYTES:
+                data += process.stdout.read(FLOAT32_BYTES - rest)
+            yield np.frombuffer(data, dtype=np.float32)
+        if process.wait() != 0:
+            raise RuntimeError(f"ffmpeg failed to decode audio file: {path}")
+    finally:
+        # 창을 다 읽기 전에 반복을 멈추면 ffmpeg 프로세스를 종료한다.
+        process.stdout.close()
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+
+
+__all__ = ["frame_audio", "stream_audio"]
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import numpy as np
+import numpy.typing as npt
+
+from bisect import bisect_right
 
 from typing import Any, TypeVar, cast
 from typing_extensions import override, Self
@@ -18,15 +21,22 @@ S = TypeVar("S", bound=Sample)
 class ConcatDataset(Dataset[MutableSequence[D], S], ConcatDatasetProtocol[D, S]):
     """
     여러 Dataset을 하나로 합치는 기능을 제공하는 클래스이다. 이 클래스는 Dataset을 상속하여 구현되며, 내부적으로 여러 Dataset을 리스트로 관리한다. \n
-    ConcatDataset은 각 Dataset의 샘플을 순차적으로 연결하여 하나의 큰 Dataset처럼 동작한다.
+    ConcatDataset은 각 Dataset의 샘플을 순차적으로 연결하여 하나의 큰 Dataset처럼 동작한다. \n
+    indices가 주어지면 연결된 Dataset 위의 인덱스 뷰로 동작한다. 이때 select, slice, sample은
+    하위 Dataset을 복사하지 않고 int64 인덱스 배열만 새로 만들며, get은 이 배열을 거쳐 하위 Dataset으로 전달된다.
+    select로 만든 뷰는 하위 Dataset을 원본과 공유하므로 소유하지 않으며(owns_datasets가 False), clean은 하위 Dataset을
+    정리하지 않고 참조만 놓는다. 하위 Dataset을 바꿔야 하면 materialize로 소유한 복사본을 만든다.
 
     Attributes:
         datasets (list[Dataset]): 합쳐진 Dataset들의 리스트
+        indices (npt.ArrayLike | None): 연결된 Dataset 위의 전체 인덱스 배열. None이면 모든 샘플을 순서대로 사용한다.
     Raises:
-        ValueError: datasets가 비어있을 경우 발생한다.
+        ValueError: datasets가 비어있거나 indices가 범위를 벗어난 경우 발생한다.
     """
 
-    def __init__(self, *, datasets: Sequence[D]):
+    def __init__(
+        self, *, datasets: Sequence[D], indices: npt.ArrayLike | None = None
+    ):
         if len(datasets) == 0:
             raise ValueError("At least one dataset is required")
 
@@ -38,6 +48,17 @@ class ConcatDataset(Dataset[MutableSequence[D], S], ConcatDatasetProtocol[D, S])
 
         super().__init__()
         self._datasets: list[D] = list(dts)
+        self._offsets: npt.NDArray[np.int64] | None = None
+        self._offset_list: list[int] | None = None
+        self._owns_datasets = True
+
+        self._indices: npt.NDArray[np.int64] | None = None
+        if indices is not None:
+            array = np.array(indices, dtype=np.int64).reshape(-1)
+            if array.size and (array.min() < 0 or array.max() >= self.offsets[-1]):
+                raise ValueError("Indices out of range of the concatenated datasets")
+            array.flags.writeable = False
+            self._indices = array
 
     @property
     @override
@@ -47,12 +68,67 @@ class ConcatDataset(Dataset[MutableSequence[D], S], ConcatDatasetProtocol[D, S])
     @property
     @override
     def args(self) -> dict[str, Any]:
-        return {**super().args, "datasets": self._datasets}
+        return {**super().args, "datasets": self._datasets, "indices": self._indices}
 
     @property
     @override
     def length(self) -> int:
-        return sum(len(ds) for ds in self._datasets)
+        if self._indices is not None:
+            return len(self._indices)
+        return int(self.offsets[-1])
+
+    @property
+    def indices(self) -> npt.NDArray[np.int64] | None:
+        """
+        인덱스 뷰로 동작하는 경우 연결된 Dataset 위의 전체 인덱스 배열을 반환하는 속성입니다.
+
+        Returns:
+            npt.NDArray[np.int64] | None: 읽기 전용 인덱스 배열입니다. 뷰가 아닌 경우 None입니다.
+        """
+        return self._indices
+
+    @property
+    def owns_datasets(self) -> bool:
+        """
+        하위 Dataset을 이 ConcatDataset이 소유하는지 여부입니다. select로 만든 뷰는 원본과 하위 Dataset을 공유하므로 False입니다.
+        소유하지 않은 하위 Dataset은 clean에서 정리하지 않습니다.
+        """
+        return self._owns_datasets
+
+    @property
+    def offsets(self) -> npt.NDArray[np.int64]:
+        """
+        각 Dataset의 시작 위치를 나타내는 누적 길이 배열을 반환하는 속성입니다.
+        i번째 Dataset은 전체 인덱스 [offsets[i], offsets[i + 1]) 구간을 차지합니다.
+        처음 접근할 때 한 번 계산되어 캐시되며, Dataset 리스트가 바뀌면 무효화됩니다.
+
+        Returns:
+            npt.NDArray[np.int64]: 길이가 len(datasets) + 1인 누적 길이 배열입니다. 첫 원소는 항상 0입니다.
+        """
+        if self._offsets is None:
+            offsets = np.zeros(len(self._datasets) + 1, dtype=np.int64)
+            np.cumsum([len(ds) for ds in self._datasets], out=offsets[1:])
+            offsets.flags.writeable = False
+            self._offsets = offsets
+            self._offset_list = offsets.tolist()
+        return self._offsets
+
+    def _invalidate_offsets(self) -> None:
+        self._offsets = None
+        self._offset_list = None
+
+    def _locate(self, idx: int) -> tuple[int, int]:
+        """전체 인덱스를 (Dataset 위치, Dataset 내부 인덱스)로 변환한다."""
+        length = len(self)
+        if idx < 0:
+            idx += length
+        if not (0 <= idx < length):
+            raise IndexError("Index out of range")
+        if self._indices is not None:
+            idx = int(self._indices[idx])
+        offsets = cast(list[int], self._offset_list)
+        ds_idx = bisect_right(offsets, idx) - 1
+        return ds_idx, idx - offsets[ds_idx]
 
     @property
     @override
@@ -70,25 +146,84 @@ class ConcatDataset(Dataset[MutableSequence[D], S], ConcatDatasetProtocol[D, S])
         ...
         return [ds.name for ds in self._datasets]
 
+    def _normalize_indices(self, indices: Iterable[int]) -> npt.NDArray[np.int64]:
+        """음수 인덱스를 양수로 바꾸고 범위를 검사한 int64 인덱스 배열을 반환한다."""
+        if isinstance(indices, np.ndarray):
+            array = indices.astype(np.int64, copy=False).reshape(-1)
+        else:
+            array = np.fromiter(indices, dtype=np.int64)
+
+        length = len(self)
+        if array.size and array.min() < 0:
+            array = np.where(array < 0, array + length, array)
+        if array.size and (array.min() < 0 or array.max() >= length):
+            raise IndexError("Index out of range")
+        return array
+
+    def _partition(
+        self, indices: npt.NDArray[np.int64]
+    ) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.int64]]:
+        """
+        정규화된 전체 인덱스를 한 번의 벡터 연산으로 (Dataset 위치, Dataset 내부 인덱스)로 나눈다.
+        """
+        offsets = self.offsets
+        ds_ids = np.searchsorted(offsets, indices, side="right") - 1
+        return ds_ids, indices - offsets[ds_ids]
+
     @override
     def select(self, indices: Iterable[int]) -> Self:
+        """
+        주어진 인덱스 순서를 그대로 유지하는 인덱스 뷰를 반환한다. \n
+        하위 Dataset은 복사하지 않고 공유하며(뷰는 하위 Dataset을 소유하지 않는다), 뷰에서 다시 select하면 인덱스 배열만 합성된다.
+        """
         if self.is_cleaned:
             raise RuntimeError("Cannot select from a cleaned dataset")
 
-        length = len(self)
-        normalized_indices = [i if i >= 0 else length + i for i in indices]
+        normalized = self._normalize_indices(indices)
+        args = self.args
+        args["indices"] = (
+            normalized if self._indices is None else self._indices[normalized]
+        )
+        view = type(self)(**args)
+        view._owns_datasets = False
+        return view
+
+    def materialize(self) -> Self:
+        """
+        인덱스 뷰를 하위 Dataset의 select로 구체화한 ConcatDataset을 반환한다. \n
+        인덱스를 하위 Dataset별로 모아(stable argsort) 하위 Dataset마다 select를 한 번만 호출하므로,
+        섞인 인덱스도 하위 Dataset 수만큼만 선택한다. 인덱스가 하위 Dataset 순서대로 정렬되어 있지 않으면
+        원래 순서를 유지하도록 선택 결과 위의 인덱스 뷰를 반환한다. 선택된 하위 Dataset은 결과가 소유한다.
+        """
+        if self.is_cleaned:
+            raise RuntimeError("Cannot materialize a cleaned dataset")
 
-        selected_datasets: list[D] = []
-        start = 0
-        for ds in self._datasets:
-            end = start + len(ds)
-            if ds_indices := [
-                i - start for i in normalized_indices if start <= i < end
-            ]:
-                selected_datasets.append(ds.select(ds_indices))
-            start = end
         args = self.args
+        args["indices"] = None
+        if self._indices is None:
+            materialized = type(self)(**args)
+            materialized._owns_datasets = self._owns_datasets
+            return materialized
+        elif self._indices.size == 0:
+            args["datasets"] = [self._datasets[0].select([])]
+            return type(self)(**args)
+
+        ds_ids, local = self._partition(self._indices)
+        order = np.argsort(ds_ids, kind="stable")
+        bounds = np.searchsorted(ds_ids[order], np.arange(len(self._datasets) + 1))
+
+        selected_datasets: list[D] = []
+        for i, ds in enumerate(self._datasets):
+            if bounds[i] < bounds[i + 1]:
+                selected_datasets.append(
+                    ds.select(local[order[bounds[i] : bounds[i + 1]]].tolist())
+                )
         args["datasets"] = selected_datasets
+        if (np.diff(ds_ids) < 0).any():
+            # 선택 결과는 하위 Dataset 순서로 정렬되어 있으므로 원래 순서의 위치를 인덱스로 준다.
+            positions = np.empty_like(order)
+            positions[order] = np.arange(len(order))
+            args["indices"] = positions
         return type(self)(**args)
 
     @override
@@ -99,7 +234,7 @@ class ConcatDataset(Dataset[MutableSequence[D], S], ConcatDatasetProtocol[D, S])
             raise RuntimeError("Cannot slice a cleaned dataset")
 
         start = start if start is not None else 0
-        stop = stop if stop is not None else len(self)
+        stop = min(stop, len(self)) if stop is not None else len(self)
         step = step if step is not None else 1
 
         if start < 0:
@@ -119,9 +254,63 @@ class ConcatDataset(Dataset[MutableSequence[D], S], ConcatDatasetProtocol[D, S])
         *,
         rng: np.random.Generator | np.random.RandomState | None = None,
     ) -> Self:
-        if rng is not None:
-            raise NotImplementedError("Random sampling is not implemented")
-        return self.slice(start=start, stop=start + size)
+        if self.is_cleaned:
+            raise RuntimeError("Cannot sample from a cleaned dataset")
+        elif rng is None or size == len(self) - start:
+            return self.slice(start=start, stop=start + size)
+        else:
+            indices = rng.choice(len(self) - start, size=size, replace=False) + start
+            return self.select(indices)
+
+    def weighted_sample(
+        self,
+        size: int,
+        weights: Sequence[float],
+        *,
+        rng: np.random.Generator | np.random.RandomState,
+    ) -> Self:
+        """
+        각 Dataset의 가중치에 비례하는 개수만큼 중복 없이 무작위로 샘플을 선택한다. \n
+        Dataset별 개수는 size * weight를 내림한 뒤 나머지가 큰 순서대로 1씩 더해 정하며, 결과 순서는 섞여서 반환된다.
+
+        Args:
+            size (int): 선택할 전체 샘플의 수입니다.
+            weights (Sequence[float]): dataset 순서와 같은 순서의 Dataset별 가중치입니다. 합이 1일 필요는 없습니다.
+            rng (np.random.Generator | np.random.RandomState): 무작위 샘플링에 사용할 난수 생성기입니다.
+        Returns:
+            Self: 선택된 샘플로 구성된 인덱스 뷰입니다.
+        Raises:
+            ValueError: weights의 길이가 Dataset 수와 다르거나, 음수가 있거나, 합이 0인 경우,
+                또는 어떤 Dataset의 샘플 수가 배정된 개수보다 적은 경우
+        """
+        if self.is_cleaned:
+            raise RuntimeError("Cannot sample from a cleaned dataset")
+
+        w = np.asarray(weights, dtype=np.float64)
+        if w.shape != (len(self._datasets),):
+            raise ValueError(
+                f"Expected {len(self._datasets)} weights, got {w.shape[0] if w.ndim else 0}"
+            )
+        elif (w < 0).any() or w.sum() <= 0:
+            raise ValueError("Weights must be non-negative and sum to a positive value")
+        elif not (0 <= size <= len(self)):
+            raise ValueError(f"Invalid sample size: {size}")
+
+        quotas = _allocate(size, w / w.sum())
+        ds_ids, _ = self._partition(self._view_indices())
+        order = np.argsort(ds_ids, kind="stable")
+        bounds = np.searchsorted(ds_ids[order], np.arange(len(self._datasets) + 1))
+
+        chosen: list[npt.NDArray[np.int64]] = []
+        for i, quota in enumerate(quotas.tolist()):
+            candidates = order[bounds[i] : bounds[i + 1]]
+            if quota > len(candidates):
+                raise ValueError(
+                    f"Dataset {i} ({self._datasets[i].name}) has {len(candidates)} samples, "
+                    f"but {quota} were requested"
+                )
+            chosen.append(candidates[rng.choice(len(candidates), quota, replace=False)])
+        return self.select(rng.permutation(np.concatenate(chosen)))
 
     @override
     def concat(self, other: DatasetProtocol[Any, Any]) -> ConcatDataset[Any, Any]:
@@ -129,30 +318,63 @@ class ConcatDataset(Dataset[MutableSequence[D], S], ConcatDatasetProtocol[D, S])
             raise RuntimeError("Cannot concatenate a cleaned dataset")
         elif isinstance(other, ConcatDataset):
             other = cast(ConcatDataset[Any, Any], other)  # type: ignore[redundant-cast]
-            return ConcatDataset(datasets=self._datasets + other._datasets)
         elif isinstance(other, Dataset):
-            return ConcatDataset(datasets=self._datasets + [other])
+            other = ConcatDataset(datasets=[other])
         else:
             raise TypeError("Invalid type for concatenation")
 
+        datasets = self._datasets + other._datasets
+        concat: ConcatDataset[Any, Any]
+        if self._indices is None and other._indices is None:
+            concat = ConcatDataset(datasets=datasets)
+        else:
+            indices = np.concatenate(
+                (self._view_indices(), other._view_indices() + self.offsets[-1])
+            )
+            concat = ConcatDataset(datasets=datasets, indices=indices)
+        concat._owns_datasets = self._owns_datasets and other._owns_datasets
+        return concat
+
+    def column(self, name: str) -> npt.NDArray[Any]:
+        """
+        하위 Dataset의 column(name)을 이어 붙여 이 Dataset의 순서대로 반환한다.
+
+        Raises:
+            TypeError: 하위 Dataset이 column을 제공하지 않는 경우
+            KeyError: 하위 Dataset에 컬럼이 없는 경우
+        """
+        if self.is_cleaned:
+            raise RuntimeError("Cannot get column of a cleaned dataset")
+        columns: list[npt.NDArray[Any]] = []
+        for ds in self._datasets:
+            column = getattr(ds, "column", None)
+            if column is None:
+                raise TypeError(f"{type(ds).__name__} does not provide columns")
+            columns.append(np.asarray(column(name)))
+        values = np.concatenate(columns)
+        return values if self._indices is None else values[self._indices]
+
+    def _view_indices(self) -> npt.NDArray[np.int64]:
+        if self._indices is not None:
+            return self._indices
+        return np.arange(self.offsets[-1], dtype=np.int64)
+
     @override
     def clean(self) -> None:
         if self.is_cleaned:
             return
-        for ds in self._datasets:
-            ds.clean()
+        if self._owns_datasets:
+            for ds in self._datasets:
+                ds.clean()
         self._datasets.clear()
+        self._indices = None
+        self._invalidate_offsets()
         super().clean()
 
     @override
     def get(self, idx: int) -> S:
-        start = 0
-        for ds in self._datasets:
-            d_idx = idx - start
-            if d_idx < len(ds):
-                return cast(S, ds.get(d_idx))
-            start += len(ds)
-        raise IndexError("Index out of range")
+        ds_idx, d_idx = self._locate(idx)
+        return cast(S, self._datasets[ds_idx].get(d_idx))
 
     @override
     def to_dict(self) -> dict[str, Any]:
@@ -160,6 +382,8 @@ class ConcatDataset(Dataset[MutableSequence[D], S], ConcatDatasetProtocol[D, S])
             raise RuntimeError("Cannot serialize a cleaned dataset")
         args = self.args
         args["datasets"] = [ds.to_dict() for ds in self._datasets]
+        if self._indices is not None:
+            args["indices"] = self._indices.tolist()
         args["classes"] = [ds.__class__ for ds in self._datasets]
         args["method"] = "from_dict"
         return args
@@ -188,9 +412,11 @@ class ConcatDataset(Dataset[MutableSequence[D], S], ConcatDatasetProtocol[D, S])
             raise RuntimeError("Cannot serialize a cleaned dataset")
         args = self.args
         args["datasets"] = [ds.__getstate__() for ds in self._datasets]
+        if self._indices is not None:
+            args["indices"] = self._indices.tolist()
         args["method"] = "from_pointer"
 
-        return args
+        return {**args, **self.__get_import__()}
 
     @classmethod
     @override
@@ -203,4 +429,14 @@ class ConcatDataset(Dataset[MutableSequence[D], S], ConcatDatasetProtocol[D, S])
         return dataset
 
 
+def _allocate(size: int, proportions: npt.NDArray[np.float64]) -> npt.NDArray[np.int64]:
+    """size를 비율에 따라 정수 개수로 나눈다 (최대 나머지 방식)."""
+    raw = size * proportions
+    quotas = np.floor(raw).astype(np.int64)
+    remainder = size - int(quotas.sum())
+    if remainder > 0:
+        quotas[np.argsort(quotas - raw, kind="stable")[:remainder]] += 1
+    return quotas
+
+
 __all__ = ["ConcatDataset"]
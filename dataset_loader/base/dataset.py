@@ -155,8 +155,7 @@ class Dataset(DatasetProtocol[T, S], ABC):
         from dataset_loader.base.concat_dataset import ConcatDataset
 
         if isinstance(other, ConcatDataset):
-            other = cast(ConcatDataset[Any, Any], other)  # type: ignore[redundant-cast]
-            return ConcatDataset(datasets=[self] + other.dataset)
+            return ConcatDataset(datasets=[self]).concat(other)
         elif isinstance(other, Dataset):
             return ConcatDataset(datasets=[self, other])
         else:
@@ -49,6 +49,7 @@ FILE_TYPE: dict[str, dict[str, str]] = {
     },
     MP4: {"file": "en.OS.man-diar.mp4", "explain": "원본영상"},
 }
+REQUIRED_COLUMNS: tuple[str, ...] = ("id", "mp4_path", VERBATIM)
 
 
 __all__ = [
@@ -67,4 +68,5 @@ __all__ = [
     "PUNCT_VERBATIM",
     "MP4",
     "FILE_TYPE",
+    "REQUIRED_COLUMNS",
 ]
@@ -1,21 +1,20 @@
 from __future__ import annotations
 
 import os
-import pandas as pd
 
 from pathlib import Path
-from tqdm import tqdm
-from typing import overload, Any
+from typing import Any
 from typing_extensions import override
+from collections.abc import Sequence
 
 from sjpy.string import normalize_text_only_en
 
-from dataset_loader.abstract import ParquetLoader
+from dataset_loader.abstract import ParquetLoader, ParquetFilters, ParquetBackend
+from dataset_loader.audio import AudioDiskCache, AudioMemoryCache
 
 from dataset_loader.esic.esic_v1_dataset import ESICv1Dataset
 from dataset_loader.esic.algorithm import search_dirs, select_file_from_dir
 from dataset_loader.esic.constants import (
-    ESICDataset,
     TXT,
     VERT_TS,
     ORTO,
@@ -29,6 +28,7 @@ from dataset_loader.esic.constants import (
     DEFAULT_SAMPLE_RATE,
     DEFAULT_DOWNLOAD_URL,
     DATA_PARQUET,
+    REQUIRED_COLUMNS,
 )
 
 
@@ -49,7 +49,11 @@ class ESICv1(ParquetLoader):
         if parquet_name_and_path is None:
             parquet_name_and_path = DATA_PARQUET
         super().__init__(
-            dir_name=dir_name, path=path, parquet_name_and_path=parquet_name_and_path
+            dir_name=dir_name,
+            path=path,
+            parquet_name_and_path=parquet_name_and_path,
+            audio_column="mp4_path",
+            required_columns=REQUIRED_COLUMNS,
         )
         self._download_url = download_url
 
@@ -79,80 +83,114 @@ class ESICv1(ParquetLoader):
         target.unlink()
         return extracted
 
-    @overload
-    def load(
-        self, *, name: ESICDataset, prepare_dir: str = ".prepare"
-    ) -> pd.DataFrame: ...
-    @overload
-    def load(self, *, name: str, prepare_dir: str = ".prepare") -> pd.DataFrame: ...
     @override
-    def load(self, *, name: str, prepare_dir: str = ".prepare") -> pd.DataFrame:
-        data = super().load(name=name, prepare_dir=prepare_dir)
-        data["mp4_path"] = data["mp4_path"].apply(lambda x: self.path / x)  # type: ignore[unused-ignore]
-        return data
+    def _list_files(self, *, name: str, excludes: tuple[str, ...] = ()) -> list[Path]:
+        return sorted(search_dirs(self.path / name, excludes=excludes))
 
     @override
-    def _parse_files(
-        self,
-        *,
-        name: str,
-        verbose: bool = False,
-        excludes: tuple[str, ...] = (),
-    ) -> list[dict[str, Any]]:
-        data: list[dict[str, Any]] = []
-        for d in tqdm(
-            search_dirs(self.path / name, excludes=excludes),
-            desc=f"Parsing {name}",
-            disable=not verbose,
-        ):
-            _id = normalize_text_only_en(str(Path(*d.parts[-3:])))[-255:]
-            txt_path = select_file_from_dir(d, TXT)
-            vert_ts_path = select_file_from_dir(d, VERT_TS)
-            orto_path = select_file_from_dir(d, ORTO)
-            orto_ts_path = select_file_from_dir(d, ORTO_TS)
-            verbatim_path = select_file_from_dir(d, VERBATIM)
-            punct_verbatim_path = select_file_from_dir(d, PUNCT_VERBATIM)
-            mp4_path = select_file_from_dir(d, MP4)
-            data.append(
-                {
-                    "id": _id,
-                    TXT: txt_path.read_text(encoding="utf-8"),
-                    VERT_TS: vert_ts_path.read_text(encoding="utf-8"),
-                    ORTO: orto_path.read_text(encoding="utf-8"),
-                    ORTO_TS: orto_ts_path.read_text(encoding="utf-8"),
-                    VERBATIM: verbatim_path.read_text(encoding="utf-8"),
-                    PUNCT_VERBATIM: punct_verbatim_path.read_text(encoding="utf-8"),
-                    "mp4_path": str(mp4_path.relative_to(self.path)),
-                }
-            )
-        return data
+    def _source_files(self, file: Path, *, name: str) -> list[Path]:
+        return sorted(p for p in file.iterdir() if p.is_file())
+
+    @override
+    def _parse_file(self, file: Path, *, name: str) -> list[dict[str, Any]]:
+        _id = normalize_text_only_en(str(Path(*file.parts[-3:])))[-255:]
+        txt_path = select_file_from_dir(file, TXT)
+        vert_ts_path = select_file_from_dir(file, VERT_TS)
+        orto_path = select_file_from_dir(file, ORTO)
+        orto_ts_path = select_file_from_dir(file, ORTO_TS)
+        verbatim_path = select_file_from_dir(file, VERBATIM)
+        punct_verbatim_path = select_file_from_dir(file, PUNCT_VERBATIM)
+        mp4_path = select_file_from_dir(file, MP4)
+        return [
+            {
+                "id": _id,
+                TXT: txt_path.read_text(encoding="utf-8"),
+                VERT_TS: vert_ts_path.read_text(encoding="utf-8"),
+                ORTO: orto_path.read_text(encoding="utf-8"),
+                ORTO_TS: orto_ts_path.read_text(encoding="utf-8"),
+                VERBATIM: verbatim_path.read_text(encoding="utf-8"),
+                PUNCT_VERBATIM: punct_verbatim_path.read_text(encoding="utf-8"),
+                "mp4_path": str(mp4_path.relative_to(self.path)),
+            }
+        ]
 
     def dev(
         self,
         *,
         sr: int = DEFAULT_SAMPLE_RATE,
         prepare_dir: str = ".prepare",
+        columns: Sequence[str] | None = None,
+        filters: ParquetFilters | None = None,
+        backend: ParquetBackend = "pandas",
+        audio_cache: AudioDiskCache | None = None,
+        memory_cache: AudioMemoryCache | None = None,
     ) -> ESICv1Dataset:
-        data = self.load(name=DEFAULT_DEV, prepare_dir=prepare_dir)
-        return ESICv1Dataset(parquet=data, sr=sr)
+        data = self.load(
+            name=DEFAULT_DEV,
+            prepare_dir=prepare_dir,
+            columns=columns,
+            filters=filters,
+            backend=backend,
+        )
+        return ESICv1Dataset(
+            parquet=data,
+            sr=sr,
+            root=self.path,
+            audio_cache=audio_cache,
+            memory_cache=memory_cache,
+        )
 
     def dev2(
         self,
         *,
         sr: int = DEFAULT_SAMPLE_RATE,
         prepare_dir: str = ".prepare",
+        columns: Sequence[str] | None = None,
+        filters: ParquetFilters | None = None,
+        backend: ParquetBackend = "pandas",
+        audio_cache: AudioDiskCache | None = None,
+        memory_cache: AudioMemoryCache | None = None,
     ) -> ESICv1Dataset:
-        data = self.load(name=DEFAULT_DEV2, prepare_dir=prepare_dir)
-        return ESICv1Dataset(parquet=data, sr=sr)
+        data = self.load(
+            name=DEFAULT_DEV2,
+            prepare_dir=prepare_dir,
+            columns=columns,
+            filters=filters,
+            backend=backend,
+        )
+        return ESICv1Dataset(
+            parquet=data,
+            sr=sr,
+            root=self.path,
+            audio_cache=audio_cache,
+            memory_cache=memory_cache,
+        )
 
     def test(
         self,
         *,
         sr: int = DEFAULT_SAMPLE_RATE,
         prepare_dir: str = ".prepare",
+        columns: Sequence[str] | None = None,
+        filters: ParquetFilters | None = None,
+        backend: ParquetBackend = "pandas",
+        audio_cache: AudioDiskCache | None = None,
+        memory_cache: AudioMemoryCache | None = None,
     ) -> ESICv1Dataset:
-        data = self.load(name=DEFAULT_TEST, prepare_dir=prepare_dir)
-        return ESICv1Dataset(parquet=data, sr=sr)
+        data = self.load(
+            name=DEFAULT_TEST,
+            prepare_dir=prepare_dir,
+            columns=columns,
+            filters=filters,
+            backend=backend,
+        )
+        return ESICv1Dataset(
+            parquet=data,
+            sr=sr,
+            root=self.path,
+            audio_cache=audio_cache,
+            memory_cache=memory_cache,
+        )
 
 
 __all__ = ["ESICv1"]
@@ -3,22 +3,39 @@ from __future__ import annotations
 import re
 import numpy as np
 import numpy.typing as npt
-import pandas as pd
 
-from typing import Any, cast
+from pathlib import Path
+from typing import Any
 from typing_extensions import override
+from collections.abc import Iterator
 
 from sjpy.audio import load_from_mp4_file
 
-from dataset_loader.abstract import ParquetDataset
+from dataset_loader.abstract import ParquetDataset, ParquetData
+from dataset_loader.audio import AudioDiskCache, AudioMemoryCache, stream_audio
 
 from dataset_loader.esic.constants import VERBATIM
 from dataset_loader.esic.esic_v1_sample import ESICv1Sample
 
 
 class ESICv1Dataset(ParquetDataset[ESICv1Sample]):
-    def __init__(self, *, parquet: pd.DataFrame, sr: int):
-        super().__init__(parquet=parquet)
+    def __init__(
+        self,
+        *,
+        parquet: ParquetData,
+        sr: int,
+        indices: npt.ArrayLike | None = None,
+        root: str | Path | None = None,
+        audio_cache: AudioDiskCache | None = None,
+        memory_cache: AudioMemoryCache | None = None,
+    ):
+        super().__init__(
+            parquet=parquet,
+            indices=indices,
+            root=root,
+            audio_cache=audio_cache,
+            memory_cache=memory_cache,
+        )
         self._sr: int = sr
 
     @property
@@ -41,16 +58,29 @@ class ESICv1Dataset(ParquetDataset[ESICv1Sample]):
         if self.is_cleaned:
             raise RuntimeError("Cannot get sample from a cleaned dataset.")
 
-        data = cast(dict[str, Any], self.dataset.iloc[idx].to_dict())
+        data = self.row(idx)
+        data["mp4_path"] = self.resolve_path(data["mp4_path"])
 
         def load_audio_func() -> npt.NDArray[np.float32]:
             mp4_path = data["mp4_path"]
-            wav, _ = load_from_mp4_file(mp4_path, self._sr)
-            return wav
+            sr = self._sr
+
+            def decode() -> npt.NDArray[np.float32]:
+                wav, _ = load_from_mp4_file(mp4_path, sr)
+                return wav
+
+            return self._load_audio(mp4_path, sr, decode)
+
+        def stream_audio_func(
+            window: int, hop: int | None = None
+        ) -> Iterator[npt.NDArray[np.float32]]:
+            mp4_path = data["mp4_path"]
+            return stream_audio(mp4_path, sr=self._sr, window=window, hop=hop)
 
         _id: str = data.pop("id")
         result: dict[str, Any] = {
             "load_audio_func": load_audio_func,
+            "stream_audio_func": stream_audio_func,
             "ref": re.sub(r"\s+", " ", data[VERBATIM]).strip(),
             **data,
         }
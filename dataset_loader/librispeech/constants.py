@@ -31,6 +31,7 @@ DATA_PARQUET: dict[str, str] = {
     "test-clean": "test-clean.parquet",
     "test-other": "test-other.parquet",
 }
+REQUIRED_COLUMNS: tuple[str, ...] = ("id", "audio_path", "ref")
 
 
 __all__ = [
@@ -38,4 +39,5 @@ __all__ = [
     "DEFAULT_SAMPLE_RATE",
     "DEFAULT_DOWNLOAD_URLS",
     "DATA_PARQUET",
+    "REQUIRED_COLUMNS",
 ]
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
-import pandas as pd
 
-from tqdm import tqdm
 from pathlib import Path
-from typing import Literal, overload
+from typing import Any, Literal, overload
 from typing_extensions import override
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 
-from dataset_loader.abstract import ParquetLoader
+from dataset_loader.abstract import ParquetLoader, ParquetFilters, ParquetBackend
+from dataset_loader.audio import (
+    AudioDiskCache,
+    AudioMemoryCache,
+    ResampleQuality,
+    DEFAULT_RESAMPLE_QUALITY,
+)
 
 from dataset_loader.librispeech.librispeech_dataset import LibriSpeechDataset
 from dataset_loader.librispeech.constants import (
@@ -16,6 +20,7 @@ from dataset_loader.librispeech.constants import (
     DEFAULT_SAMPLE_RATE,
     DEFAULT_DOWNLOAD_URLS,
     DATA_PARQUET,
+    REQUIRED_COLUMNS,
 )
 
 
@@ -36,7 +41,11 @@ class LibriSpeech(ParquetLoader):
         if parquet_name_and_path is None:
             parquet_name_and_path = DATA_PARQUET
         super().__init__(
-            dir_name=dir_name, path=path, parquet_name_and_path=parquet_name_and_path
+            dir_name=dir_name,
+            path=path,
+            parquet_name_and_path=parquet_name_and_path,
+            audio_column="audio_path",
+            required_columns=REQUIRED_COLUMNS,
         )
         self._download_urls = download_urls
 
@@ -114,80 +123,233 @@ class LibriSpeech(ParquetLoader):
         return target_path
 
     @override
-    def load(self, *, name: str, prepare_dir: str = ".prepare") -> pd.DataFrame:
-        data = super().load(name=name, prepare_dir=prepare_dir)
-        data["audio_path"] = data["audio_path"].apply(lambda x: self.path / x)  # type: ignore[unused-ignore]
-        return data
-
-    @override
-    def _parse_files(self, *, name: str, verbose: bool = False) -> list[dict[str, str]]:
+    def _list_files(self, *, name: str) -> list[Path]:
         target = self.path / name
         if not target.exists():
             raise FileNotFoundError(f"LibriSpeech dataset not found at: {target}")
+        return sorted(target.rglob("**/*.txt"))
+
+    @override
+    def _source_files(self, file: Path, *, name: str) -> list[Path]:
+        return [file, *sorted(file.parent.glob("*.flac"))]
 
-        data: list[dict[str, str]] = []
-        for txt_path in tqdm(
-            target.rglob("**/*.txt"), desc=f"Parsing {name}", disable=not verbose
-        ):
-            lines = txt_path.read_text(encoding="utf-8").strip().splitlines()
-            for line in lines:
-                parts = line.strip().split(" ", maxsplit=1)
-                if len(parts) != 2:
-                    continue
-                _id = parts[0]
-                ref = parts[1]
-                paths = parts[0].split("-")
-                audio_path = target / paths[0] / paths[1] / f"{parts[0]}.flac"
-                data.append(
-                    {
-                        "id": _id,
-                        "audio_path": str(audio_path.relative_to(self.path)),
-                        "ref": ref,
-                    }
-                )
+    @override
+    def _parse_file(self, file: Path, *, name: str) -> list[dict[str, Any]]:
+        target = self.path / name
+        data: list[dict[str, Any]] = []
+        lines = file.read_text(encoding="utf-8").strip().splitlines()
+        for line in lines:
+            parts = line.strip().split(" ", maxsplit=1)
+            if len(parts) != 2:
+                continue
+            _id = parts[0]
+            ref = parts[1]
+            paths = parts[0].split("-")
+            audio_path = target / paths[0] / paths[1] / f"{parts[0]}.flac"
+            data.append(
+                {
+                    "id": _id,
+                    "audio_path": str(audio_path.relative_to(self.path)),
+                    "ref": ref,
+                }
+            )
         return data
 
     def train_clean_100(
-        self, sr: int = DEFAULT_SAMPLE_RATE, prepare_dir: str = ".prepare"
+        self,
+        sr: int = DEFAULT_SAMPLE_RATE,
+        prepare_dir: str = ".prepare",
+        *,
+        columns: Sequence[str] | None = None,
+        filters: ParquetFilters | None = None,
+        backend: ParquetBackend = "pandas",
+        audio_cache: AudioDiskCache | None = None,
+        memory_cache: AudioMemoryCache | None = None,
+        resample_quality: ResampleQuality = DEFAULT_RESAMPLE_QUALITY,
     ) -> LibriSpeechDataset:
-        data = self.load(name="train-clean-100", prepare_dir=prepare_dir)
-        return LibriSpeechDataset(parquet=data, sr=sr)
+        data = self.load(
+            name="train-clean-100",
+            prepare_dir=prepare_dir,
+            columns=columns,
+            filters=filters,
+            backend=backend,
+        )
+        return LibriSpeechDataset(
+            parquet=data,
+            sr=sr,
+            root=self.path,
+            audio_cache=audio_cache,
+            memory_cache=memory_cache,
+            resample_quality=resample_quality,
+        )
 
     def train_clean_360(
-        self, sr: int = DEFAULT_SAMPLE_RATE, prepare_dir: str = ".prepare"
+        self,
+        sr: int = DEFAULT_SAMPLE_RATE,
+        prepare_dir: str = ".prepare",
+        *,
+        columns: Sequence[str] | None = None,
+        filters: ParquetFilters | None = None,
+        backend: ParquetBackend = "pandas",
+        audio_cache: AudioDiskCache | None = None,
+        memory_cache: AudioMemoryCache | None = None,
+        resample_quality: ResampleQuality = DEFAULT_RESAMPLE_QUALITY,
     ) -> LibriSpeechDataset:
-        data = self.load(name="train-clean-360", prepare_dir=prepare_dir)
-        return LibriSpeechDataset(parquet=data, sr=sr)
+        data = self.load(
+            name="train-clean-360",
+            prepare_dir=prepare_dir,
+            columns=columns,
+            filters=filters,
+            backend=backend,
+        )
+        return LibriSpeechDataset(
+            parquet=data,
+            sr=sr,
+            root=self.path,
+            audio_cache=audio_cache,
+            memory_cache=memory_cache,
+            resample_quality=resample_quality,
+        )
 
     def train_other_500(
-        self, sr: int = DEFAULT_SAMPLE_RATE, prepare_dir: str = ".prepare"
+        self,
+        sr: int = DEFAULT_SAMPLE_RATE,
+        prepare_dir: str = ".prepare",
+        *,
+        columns: Sequence[str] | None = None,
+        filters: ParquetFilters | None = None,
+        backend: ParquetBackend = "pandas",
+        audio_cache: AudioDiskCache | None = None,
+        memory_cache: AudioMemoryCache | None = None,
+        resample_quality: ResampleQuality = DEFAULT_RESAMPLE_QUALITY,
     ) -> LibriSpeechDataset:
-        data = self.load(name="train-other-500", prepare_dir=prepare_dir)
-        return LibriSpeechDataset(parquet=data, sr=sr)
+        data = self.load(
+            name="train-other-500",
+            prepare_dir=prepare_dir,
+            columns=columns,
+            filters=filters,
+            backend=backend,
+        )
+        return LibriSpeechDataset(
+            parquet=data,
+            sr=sr,
+            root=self.path,
+            audio_cache=audio_cache,
+            memory_cache=memory_cache,
+            resample_quality=resample_quality,
+        )
 
     def dev_clean(
-        self, sr: int = DEFAULT_SAMPLE_RATE, prepare_dir: str = ".prepare"
+        self,
+        sr: int = DEFAULT_SAMPLE_RATE,
+        prepare_dir: str = ".prepare",
+        *,
+        columns: Sequence[str] | None = None,
+        filters: ParquetFilters | None = None,
+        backend: ParquetBackend = "pandas",
+        audio_cache: AudioDiskCache | None = None,
+        memory_cache: AudioMemoryCache | None = None,
+        resample_quality: ResampleQuality = DEFAULT_RESAMPLE_QUALITY,
     ) -> LibriSpeechDataset:
-        data = self.load(name="dev-clean", prepare_dir=prepare_dir)
-        return LibriSpeechDataset(parquet=data, sr=sr)
+        data = self.load(
+            name="dev-clean",
+            prepare_dir=prepare_dir,
+            columns=columns,
+            filters=filters,
+            backend=backend,
+        )
+        return LibriSpeechDataset(
+            parquet=data,
+            sr=sr,
+            root=self.path,
+            audio_cache=audio_cache,
+            memory_cache=memory_cache,
+            resample_quality=resample_quality,
+        )
 
     def dev_other(
-        self, sr: int = DEFAULT_SAMPLE_RATE, prepare_dir: str = ".prepare"
+        self,
+        sr: int = DEFAULT_SAMPLE_RATE,
+        prepare_dir: str = ".prepare",
+        *,
+        columns: Sequence[str] | None = None,
+        filters: ParquetFilters | None = None,
+        backend: ParquetBackend = "pandas",
+        audio_cache: AudioDiskCache | None = None,
+        memory_cache: AudioMemoryCache | None = None,
+        resample_quality: ResampleQuality = DEFAULT_RESAMPLE_QUALITY,
     ) -> LibriSpeechDataset:
-        data = self.load(name="dev-other", prepare_dir=prepare_dir)
-        return LibriSpeechDataset(parquet=data, sr=sr)
+        data = self.load(
+            name="dev-other",
+            prepare_dir=prepare_dir,
+            columns=columns,
+            filters=filters,
+            backend=backend,
+        )
+        return LibriSpeechDataset(
+            parquet=data,
+            sr=sr,
+            root=self.path,
+            audio_cache=audio_cache,
+            memory_cache=memory_cache,
+            resample_quality=resample_quality,
+        )
 
     def test_clean(
-        self, sr: int = DEFAULT_SAMPLE_RATE, prepare_dir: str = ".prepare"
+        self,
+        sr: int = DEFAULT_SAMPLE_RATE,
+        prepare_dir: str = ".prepare",
+        *,
+        columns: Sequence[str] | None = None,
+        filters: ParquetFilters | None = None,
+        backend: ParquetBackend = "pandas",
+        audio_cache: AudioDiskCache | None = None,
+        memory_cache: AudioMemoryCache | None = None,
+        resample_quality: ResampleQuality = DEFAULT_RESAMPLE_QUALITY,
     ) -> LibriSpeechDataset:
-        data = self.load(name="test-clean", prepare_dir=prepare_dir)
-        return LibriSpeechDataset(parquet=data, sr=sr)
+        data = self.load(
+            name="test-clean",
+            prepare_dir=prepare_dir,
+            columns=columns,
+            filters=filters,
+            backend=backend,
+        )
+        return LibriSpeechDataset(
+            parquet=data,
+            sr=sr,
+            root=self.path,
+            audio_cache=audio_cache,
+            memory_cache=memory_cache,
+            resample_quality=resample_quality,
+        )
 
     def test_other(
-        self, sr: int = DEFAULT_SAMPLE_RATE, prepare_dir: str = ".prepare"
+        self,
+        sr: int = DEFAULT_SAMPLE_RATE,
+        prepare_dir: str = ".prepare",
+        *,
+        columns: Sequence[str] | None = None,
+        filters: ParquetFilters | None = None,
+        backend: ParquetBackend = "pandas",
+        audio_cache: AudioDiskCache | None = None,
+        memory_cache: AudioMemoryCache | None = None,
+        resample_quality: ResampleQuality = DEFAULT_RESAMPLE_QUALITY,
     ) -> LibriSpeechDataset:
-        data = self.load(name="test-other", prepare_dir=prepare_dir)
-        return LibriSpeechDataset(parquet=data, sr=sr)
+        data = self.load(
+            name="test-other",
+            prepare_dir=prepare_dir,
+            columns=columns,
+            filters=filters,
+            backend=backend,
+        )
+        return LibriSpeechDataset(
+            parquet=data,
+            sr=sr,
+            root=self.path,
+            audio_cache=audio_cache,
+            memory_cache=memory_cache,
+            resample_quality=resample_quality,
+        )
 
 
 __all__ = ["LibriSpeech"]
@@ -1,14 +1,23 @@
 from __future__ import annotations
 
-import librosa
 import numpy as np
 import numpy.typing as npt
-import pandas as pd
 
+from pathlib import Path
 from typing import Any
 from typing_extensions import override
+from collections.abc import Iterator
 
-from dataset_loader.abstract import ParquetDataset
+from dataset_loader.abstract import ParquetDataset, ParquetData
+from dataset_loader.audio import (
+    AudioDiskCache,
+    AudioMemoryCache,
+    stream_audio,
+    load_audio,
+    ResampleQuality,
+    DEFAULT_RESAMPLE_QUALITY,
+    check_resample_quality,
+)
 
 from dataset_loader.librispeech.librispeech_sample import LibriSpeechSample
 
@@ -17,16 +26,33 @@ class LibriSpeechDataset(ParquetDataset[LibriSpeechSample]):
     def __init__(
         self: LibriSpeechDataset,
         *,
-        parquet: pd.DataFrame,
+        parquet: ParquetData,
         sr: int,
+        indices: npt.ArrayLike | None = None,
+        root: str | Path | None = None,
+        audio_cache: AudioDiskCache | None = None,
+        memory_cache: AudioMemoryCache | None = None,
+        resample_quality: ResampleQuality = DEFAULT_RESAMPLE_QUALITY,
     ):
-        super().__init__(parquet=parquet)
+        super().__init__(
+            parquet=parquet,
+            indices=indices,
+            root=root,
+            audio_cache=audio_cache,
+            memory_cache=memory_cache,
+        )
         self._sr: int = sr
+        check_resample_quality(resample_quality)
+        self._resample_quality: ResampleQuality = resample_quality
 
     @property
     @override
     def args(self: LibriSpeechDataset) -> dict[str, Any]:
-        return {**super().args, "sr": self._sr}
+        return {
+            **super().args,
+            "sr": self._sr,
+            "resample_quality": self._resample_quality,
+        }
 
     @property
     def sr(self: LibriSpeechDataset) -> int:
@@ -38,20 +64,46 @@ class LibriSpeechDataset(ParquetDataset[LibriSpeechSample]):
             raise ValueError("Sample rate must be a positive integer")
         self._sr = value
 
+    @property
+    def resample_quality(self: LibriSpeechDataset) -> ResampleQuality:
+        return self._resample_quality
+
+    @resample_quality.setter
+    def resample_quality(self: LibriSpeechDataset, value: ResampleQuality) -> None:
+        check_resample_quality(value)
+        self._resample_quality = value
+
     @override
     def get(self: LibriSpeechDataset, idx: int) -> LibriSpeechSample:
         if self.is_cleaned:
             raise RuntimeError("Cannot get sample from a cleaned dataset.")
-        data = self.dataset.iloc[idx].to_dict()
+        data = self.row(idx)
 
         def load_audio_func() -> npt.NDArray[np.float32]:
-            audio_path = data["audio_path"]
-            wav, _ = librosa.load(audio_path, sr=self._sr)
-            return wav.astype(np.float32)
+            audio_path = self.resolve_path(data["audio_path"])
+            sr, quality = self._sr, self._resample_quality
+
+            def decode() -> npt.NDArray[np.float32]:
+                return load_audio(audio_path, sr=sr, quality=quality)
+
+            return self._load_audio(audio_path, sr, decode, quality)
+
+        def stream_audio_func(
+            window: int, hop: int | None = None
+        ) -> Iterator[npt.NDArray[np.float32]]:
+            audio_path = self.resolve_path(data["audio_path"])
+            return stream_audio(
+                audio_path,
+                sr=self._sr,
+                window=window,
+                hop=hop,
+                quality=self._resample_quality,
+            )
 
         _id = data.pop("id")
         result: dict[str, Any] = {
             "load_audio_func": load_audio_func,
+            "stream_audio_func": stream_audio_func,
             "ref": data["ref"],
         }
 
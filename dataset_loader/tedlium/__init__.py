@@ -3,6 +3,8 @@
 from dataset_loader.tedlium.tedlium import Tedlium
 from dataset_loader.tedlium.tedlium_dataset import TedliumDataset
 from dataset_loader.tedlium.tedlium_sample import TedliumSample
+from dataset_loader.tedlium.tedlium_utterance_dataset import TedliumUtteranceDataset
+from dataset_loader.tedlium.tedlium_utterance_sample import TedliumUtteranceSample
 
 from dataset_loader.tedlium.segment_tedlium import SegmentTedlium
 from dataset_loader.tedlium.segment_tedlium_dataset import SegmentTedliumDataset
@@ -15,6 +17,8 @@ __all__ = [
     "Tedlium",
     "TedliumDataset",
     "TedliumSample",
+    "TedliumUtteranceDataset",
+    "TedliumUtteranceSample",
     "SegmentTedlium",
     "SegmentTedliumDataset",
     "SegmentTedliumSample",
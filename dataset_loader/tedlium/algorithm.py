@@ -1,21 +1,111 @@
 from __future__ import annotations
 
+import os
+import re
+import json
 import hashlib
 import librosa
+import numpy as np
 
 from pathlib import Path
 from tqdm import tqdm
 from typing import Any
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from dataset_loader.audio import probe_audio
 
-def get_file_hash(file: Path) -> str:
+# librosa.load의 기본 sr. 저장된 duration은 이 sr로 리샘플한 길이를 기준으로 한다.
+LIBROSA_DEFAULT_SR = 22050
+HASH_CHUNK_SIZE = 1 << 20
+
+
+def get_file_hash(file: Path, chunk_size: int = HASH_CHUNK_SIZE) -> str:
+    """파일을 chunk_size 바이트씩 읽어 md5를 계산한다. 메모리 사용량은 파일 크기와 상관없이 chunk_size로 제한된다."""
     hash_md5 = hashlib.md5()
-    readlines = file.read_bytes()
-    hash_md5.update(readlines)
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    with open(file, "rb", buffering=0) as f:
+        while n := f.readinto(buffer):
+            hash_md5.update(view[:n])
     return hash_md5.hexdigest()
 
 
+def verify_file_hashes(
+    hashes: Mapping[Path, str],
+    *,
+    cache_file: Path | None = None,
+    num_workers: int = 8,
+    verbose: bool = False,
+) -> None:
+    """
+    파일들의 md5를 스레드 풀에서 병렬로 검증한다. hashlib은 해시 계산 중 GIL을 놓으므로 검증은 I/O에 묶인다. \n
+    cache_file이 주어지면 검증된 파일의 md5, 크기, mtime을 기록하고, 다음 호출에서는 크기와 mtime이 같은 파일을 건너뛴다.
+    검증이 중간에 실패하거나 중단되어도 그때까지 검증된 파일은 기록된다.
+
+    Args:
+        hashes (Mapping[Path, str]): 파일 경로와 기대하는 md5
+        cache_file (Path | None): 검증 결과를 기록할 JSON 파일
+        num_workers (int): 사용할 스레드의 수
+        verbose (bool): 진행 상황 출력 여부
+    Raises:
+        ValueError: md5가 다른 파일이 있는 경우
+    """
+    cache = _load_hash_cache(cache_file)
+    stats = {file: os.stat(file) for file in hashes}
+    pending = [
+        file
+        for file, md5 in hashes.items()
+        if cache.get(_cache_key(file, cache_file))
+        != _cache_entry(md5, stats[file])
+    ]
+
+    executor = ThreadPoolExecutor(max_workers=num_workers)
+    try:
+        futures = {executor.submit(get_file_hash, file): file for file in pending}
+        for future in tqdm(
+            as_completed(futures),
+            total=len(futures),
+            desc="Verifying files",
+            disable=not verbose,
+        ):
+            file = futures[future]
+            if future.result() != hashes[file]:
+                raise ValueError(f"Hash mismatch for file {file}")
+            cache[_cache_key(file, cache_file)] = _cache_entry(hashes[file], stats[file])
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+        if cache_file is not None and pending:
+            _save_hash_cache(cache_file, cache)
+
+
+def _cache_key(file: Path, cache_file: Path | None) -> str:
+    if cache_file is None:
+        return str(file)
+    return os.path.relpath(file, cache_file.parent)
+
+
+def _cache_entry(md5: str, stat: os.stat_result) -> dict[str, Any]:
+    return {"md5": md5, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _load_hash_cache(cache_file: Path | None) -> dict[str, Any]:
+    if cache_file is None or not cache_file.exists():
+        return {}
+    try:
+        cache = json.loads(cache_file.read_text())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_hash_cache(cache_file: Path, cache: Mapping[str, Any]) -> None:
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = cache_file.with_name(cache_file.name + ".tmp")
+    tmp_file.write_text(json.dumps(cache, sort_keys=True))
+    os.replace(tmp_file, cache_file)
+
+
 def parse_ctl_hashes(ctl_file: Path) -> dict[str, str]:
     readlines = ctl_file.read_text().splitlines()
     hashes: dict[str, str] = {}
@@ -26,6 +116,110 @@ def parse_ctl_hashes(ctl_file: Path) -> dict[str, str]:
     return hashes
 
 
+def get_duration(sph_file: Path) -> float:
+    """
+    librosa.load(sph_file)로 디코딩한 결과의 길이와 같은 duration을 헤더만 읽어서 계산한다. \n
+    librosa.load는 기본 22050Hz로 리샘플하며 길이는 ceil(num_samples * 22050 / native_sr)이 된다.
+    헤더를 읽을 수 없는 경우에만 디코딩한다.
+    """
+    try:
+        info = probe_audio(sph_file)
+    except RuntimeError:
+        wav, sr = librosa.load(sph_file)
+        return librosa.get_duration(y=wav, sr=sr)
+
+    ratio = float(LIBROSA_DEFAULT_SR) / info.native_sr
+    num_samples = int(np.ceil(info.num_samples * ratio))
+    return float(num_samples) / LIBROSA_DEFAULT_SR
+
+
+def clean_ref(ref: str, ignore_set: Sequence[str]) -> str:
+    """ref에서 ignore_set의 토큰과 뒤따르는 공백을 지우고 양끝 공백을 제거한다."""
+    for ignore in ignore_set:
+        ref = re.sub(rf"{re.escape(ignore)}\s*", "", ref)
+    return ref.strip()
+
+
+def list_files(sph_dir: Path, stm_dir: Path) -> list[Path]:
+    """sph_dir의 .sph 파일을 이름 순으로 반환한다. .sph와 .stm 파일의 수가 다르면 ValueError가 발생한다."""
+    sph_files = sorted(sph_dir.glob("*.sph"))
+    stm_files = list(stm_dir.glob("*.stm"))
+    if len(sph_files) != len(stm_files):
+        raise ValueError(
+            f"Number of .sph files ({len(sph_files)}) does not match number of .stm files ({len(stm_files)})"
+        )
+    return sph_files
+
+
+def parse_file(
+    sph_file: Path,
+    stm_dir: Path,
+    *,
+    sph_md5: str | None = None,
+    stm_md5: str | None = None,
+    dataset_path: Path | str = "/",
+) -> dict[str, Any]:
+    """
+    .sph 파일 하나와 짝이 되는 .stm 파일을 파싱한다. md5가 주어지면 파일의 해시와 비교한다.
+
+    Raises:
+        FileNotFoundError: .stm 파일이 없는 경우
+        ValueError: 해시가 다르거나 .stm 파일의 형식이 잘못된 경우
+    """
+    stm_file = stm_dir / (sph_file.stem + ".stm")
+    if not stm_file.exists():
+        raise FileNotFoundError(
+            f"STM file {stm_file} does not exist for SPH file {sph_file}"
+        )
+
+    if sph_md5 is not None and get_file_hash(sph_file) != sph_md5:
+        raise ValueError(f"Hash mismatch for SPH file {sph_file}")
+    if stm_md5 is not None and get_file_hash(stm_file) != stm_md5:
+        raise ValueError(f"Hash mismatch for STM file {stm_file}")
+
+    readlines = stm_file.read_text().splitlines()
+    splitlines = [line.split(maxsplit=6) for line in readlines]
+    file_ids: set[str] = set()
+    channel_ids: set[str] = set()
+    speaker_ids: set[str] = set()
+    refs: list[dict[str, Any]] = []
+    for splitline in splitlines:
+        if len(splitline) < 7:
+            raise ValueError(f"Invalid line in STM file {stm_file}: {splitline}")
+        file_id, channel_id, speaker_id, start_time, end_time, label, ref = splitline
+
+        file_ids.add(file_id)
+        channel_ids.add(channel_id)
+        speaker_ids.add(speaker_id)
+        refs.append(
+            {
+                "start": float(start_time),
+                "end": float(end_time),
+                "label": label,
+                "ref": ref.strip(),
+                "speaker_id": speaker_id,
+            }
+        )
+
+    if len(file_ids) != 1:
+        raise ValueError(f"Multiple file IDs in STM file {stm_file}: {file_ids}")
+    if len(channel_ids) != 1:
+        raise ValueError(f"Multiple channel IDs in STM file {stm_file}: {channel_ids}")
+
+    text = " ".join(ref["ref"] for ref in refs)
+    duration = get_duration(sph_file)
+
+    return {
+        "id": file_ids.pop(),
+        "channel": channel_ids.pop(),
+        "speakers": sorted(speaker_ids),
+        "audio_path": str(sph_file.relative_to(dataset_path)),
+        "duration": duration,
+        "text": text,
+        "stm": refs,
+    }
+
+
 def parse_files(
     sph_dir: Path,
     stm_dir: Path,
@@ -35,76 +229,29 @@ def parse_files(
     verbose: bool = False,
     dataset_path: Path | str = "/",
 ) -> list[dict[str, Any]]:
-    sph_files = list(sph_dir.glob("*.sph"))
-    stm_files = list(stm_dir.glob("*.stm"))
-    if len(sph_files) != len(stm_files):
-        raise ValueError(
-            f"Number of .sph files ({len(sph_files)}) does not match number of .stm files ({len(stm_files)})"
-        )
+    sph_files = list_files(sph_dir, stm_dir)
+    hashes: dict[Path, str] = {}
+    for sph_file in sph_files:
+        if sph_hash is not None:
+            hashes[sph_file] = sph_hash[sph_file.name]
+        if stm_hash is not None:
+            stm_name = sph_file.stem + ".stm"
+            hashes[stm_dir / stm_name] = stm_hash[stm_name]
+    verify_file_hashes(hashes, verbose=verbose)
 
     data: list[dict[str, Any]] = []
     for sph_file in tqdm(sph_files, desc="Parsing files", disable=not verbose):
-        stm_file = stm_dir / (sph_file.stem + ".stm")
-        if not stm_file.exists():
-            raise FileNotFoundError(
-                f"STM file {stm_file} does not exist for SPH file {sph_file}"
-            )
-
-        if sph_hash is not None and get_file_hash(sph_file) != sph_hash[sph_file.name]:
-            raise ValueError(f"Hash mismatch for SPH file {sph_file}")
-        if stm_hash is not None and get_file_hash(stm_file) != stm_hash[stm_file.name]:
-            raise ValueError(f"Hash mismatch for STM file {stm_file}")
-
-        readlines = stm_file.read_text().splitlines()
-        splitlines = [line.split(maxsplit=6) for line in readlines]
-        file_ids: set[str] = set()
-        channel_ids: set[str] = set()
-        speaker_ids: set[str] = set()
-        refs: list[dict[str, Any]] = []
-        for splitline in splitlines:
-            if len(splitline) < 7:
-                raise ValueError(f"Invalid line in STM file {stm_file}: {splitline}")
-            file_id, channel_id, speaker_id, start_time, end_time, label, ref = (
-                splitline
-            )
-
-            file_ids.add(file_id)
-            channel_ids.add(channel_id)
-            speaker_ids.add(speaker_id)
-            refs.append(
-                {
-                    "start": float(start_time),
-                    "end": float(end_time),
-                    "label": label,
-                    "ref": ref.strip(),
-                    "speaker_id": speaker_id,
-                }
-            )
-
-        if len(file_ids) != 1:
-            raise ValueError(f"Multiple file IDs in STM file {stm_file}: {file_ids}")
-        if len(channel_ids) != 1:
-            raise ValueError(
-                f"Multiple channel IDs in STM file {stm_file}: {channel_ids}"
-            )
-
-        text = " ".join(ref["ref"] for ref in refs)
-        wav, sr = librosa.load(sph_file)
-        duration = librosa.get_duration(y=wav, sr=sr)
-
-        data.append(
-            {
-                "id": file_ids.pop(),
-                "channel": channel_ids.pop(),
-                "speakers": list(speaker_ids),
-                "audio_path": str(sph_file.relative_to(dataset_path)),
-                "duration": duration,
-                "text": text,
-                "stm": refs,
-            }
-        )
-
+        data.append(parse_file(sph_file, stm_dir, dataset_path=dataset_path))
     return data
 
 
-__all__ = ["get_file_hash", "parse_ctl_hashes", "parse_files"]
+__all__ = [
+    "get_file_hash",
+    "verify_file_hashes",
+    "get_duration",
+    "parse_ctl_hashes",
+    "clean_ref",
+    "list_files",
+    "parse_file",
+    "parse_files",
+]
@@ -24,6 +24,8 @@ DATA_PARQUET: dict[str, str] = {
     "dev": "dev.parquet",
     "test": "test.parquet",
 }
+VERIFIED_MD5_FILE: str = ".verified_md5.json"
+REQUIRED_COLUMNS: tuple[str, ...] = ("id", "audio_path", "stm", "text")
 
 
 __all__ = [
@@ -34,4 +36,6 @@ __all__ = [
     "DEFAULT_SAMPLE_RATE",
     "DEFAULT_IGNORE_SET",
     "DATA_PARQUET",
+    "VERIFIED_MD5_FILE",
+    "REQUIRED_COLUMNS",
 ]
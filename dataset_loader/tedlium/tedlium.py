@@ -1,12 +1,17 @@
 from __future__ import annotations
 
-import pandas as pd
-
 from typing import Any
+from pathlib import Path
 from typing_extensions import override
 from collections.abc import Mapping, Sequence
 
-from dataset_loader.abstract import ParquetLoader
+from dataset_loader.abstract import ParquetLoader, ParquetFilters, ParquetBackend
+from dataset_loader.audio import (
+    AudioDiskCache,
+    AudioMemoryCache,
+    ResampleQuality,
+    DEFAULT_RESAMPLE_QUALITY,
+)
 
 from dataset_loader.tedlium.tedlium_dataset import TedliumDataset
 
@@ -14,7 +19,8 @@ from dataset_loader.tedlium.constants import (
     DEFAULT_SAMPLE_RATE,
     DEFAULT_IGNORE_SET,
     DATA_PARQUET,
-    TedliumSet,
+    VERIFIED_MD5_FILE,
+    REQUIRED_COLUMNS,
 )
 
 
@@ -34,7 +40,11 @@ class Tedlium(ParquetLoader):
         if parquet_name_and_path is None:
             parquet_name_and_path = DATA_PARQUET
         super().__init__(
-            dir_name=dir_name, path=path, parquet_name_and_path=parquet_name_and_path
+            dir_name=dir_name,
+            path=path,
+            parquet_name_and_path=parquet_name_and_path,
+            audio_column="audio_path",
+            required_columns=REQUIRED_COLUMNS,
         )
 
     @override
@@ -43,41 +53,54 @@ class Tedlium(ParquetLoader):
             "Tedlium dataset is not available for download. Please download it manually from the official website and place it in the specified directory."
         )
 
-    @override
-    def load(
-        self, *, name: TedliumSet | str, prepare_dir: str = ".prepare"
-    ) -> pd.DataFrame:
-        data = super().load(name=name, prepare_dir=prepare_dir)
-        data["audio_path"] = data["audio_path"].apply(lambda x: self.path / x)  # type: ignore[unused-ignore]
-        return data
+    def _split_dir(self, name: str) -> Path:
+        if name == "train":
+            return self.path / "TEDLIUM_release-3/data"
+        return self.path / f"TEDLIUM_release-3/legacy/{name}"
 
     @override
-    def _parse_files(self, *, name: str, verbose: bool = False) -> list[dict[str, str]]:
+    def _list_files(
+        self, *, name: str, hash_workers: int = 8, verbose: bool = False
+    ) -> list[Path]:
+        """
+        split의 .sph 파일 목록을 반환한다. train은 ctl의 md5로 .sph와 .stm 파일을 먼저 검증하며,
+        검증 결과는 .verified_md5.json에 기록되어 바뀌지 않은 파일은 다시 해시하지 않는다.
+        """
         from dataset_loader.tedlium.algorithm import (
+            list_files,
             parse_ctl_hashes,
-            parse_files,
+            verify_file_hashes,
         )
 
+        path = self._split_dir(name)
+        sph_files = list_files(path / "sph", path / "stm")
         if name == "train":
-            path = self.path / "TEDLIUM_release-3/data"
             sph_hash = parse_ctl_hashes(path / "ctl" / "sph_md5sum")
             stm_hash = parse_ctl_hashes(path / "ctl" / "stm_md5sum")
-            return parse_files(
-                path / "sph",
-                path / "stm",
-                sph_hash=sph_hash,
-                stm_hash=stm_hash,
+            hashes: dict[Path, str] = {}
+            for sph_file in sph_files:
+                stm_name = sph_file.stem + ".stm"
+                hashes[sph_file] = sph_hash[sph_file.name]
+                hashes[path / "stm" / stm_name] = stm_hash[stm_name]
+            verify_file_hashes(
+                hashes,
+                cache_file=self.path / VERIFIED_MD5_FILE,
+                num_workers=hash_workers,
                 verbose=verbose,
-                dataset_path=self.path,
-            )
-        else:
-            path = self.path / f"TEDLIUM_release-3/legacy/{name}"
-            return parse_files(
-                path / "sph",
-                path / "stm",
-                verbose=verbose,
-                dataset_path=self.path,
             )
+        return sph_files
+
+    @override
+    def _source_files(self, file: Path, *, name: str) -> list[Path]:
+        return [file, self._split_dir(name) / "stm" / f"{file.stem}.stm"]
+
+    @override
+    def _parse_file(self, file: Path, *, name: str) -> list[dict[str, Any]]:
+        from dataset_loader.tedlium.algorithm import parse_file
+
+        return [
+            parse_file(file, self._split_dir(name) / "stm", dataset_path=self.path)
+        ]
 
     def train(
         self,
@@ -85,9 +108,29 @@ class Tedlium(ParquetLoader):
         sr: int = DEFAULT_SAMPLE_RATE,
         prepare_dir: str = ".prepare",
         ignore_set: Sequence[str] = DEFAULT_IGNORE_SET,
+        columns: Sequence[str] | None = None,
+        filters: ParquetFilters | None = None,
+        backend: ParquetBackend = "pandas",
+        audio_cache: AudioDiskCache | None = None,
+        memory_cache: AudioMemoryCache | None = None,
+        resample_quality: ResampleQuality = DEFAULT_RESAMPLE_QUALITY,
     ) -> TedliumDataset:
-        data = self.load(name="train", prepare_dir=prepare_dir)
-        return TedliumDataset(parquet=data, sr=sr, ignore_set=ignore_set)
+        data = self.load(
+            name="train",
+            prepare_dir=prepare_dir,
+            columns=columns,
+            filters=filters,
+            backend=backend,
+        )
+        return TedliumDataset(
+            parquet=data,
+            sr=sr,
+            ignore_set=ignore_set,
+            root=self.path,
+            audio_cache=audio_cache,
+            memory_cache=memory_cache,
+            resample_quality=resample_quality,
+        )
 
     def dev(
         self,
@@ -95,9 +138,29 @@ class Tedlium(ParquetLoader):
         sr: int = DEFAULT_SAMPLE_RATE,
         prepare_dir: str = ".prepare",
         ignore_set: Sequence[str] = DEFAULT_IGNORE_SET,
+        columns: Sequence[str] | None = None,
+        filters: ParquetFilters | None = None,
+        backend: ParquetBackend = "pandas",
+        audio_cache: AudioDiskCache | None = None,
+        memory_cache: AudioMemoryCache | None = None,
+        resample_quality: ResampleQuality = DEFAULT_RESAMPLE_QUALITY,
     ) -> TedliumDataset:
-        data = self.load(name="dev", prepare_dir=prepare_dir)
-        return TedliumDataset(parquet=data, sr=sr, ignore_set=ignore_set)
+        data = self.load(
+            name="dev",
+            prepare_dir=prepare_dir,
+            columns=columns,
+            filters=filters,
+            backend=backend,
+        )
+        return TedliumDataset(
+            parquet=data,
+            sr=sr,
+            ignore_set=ignore_set,
+            root=self.path,
+            audio_cache=audio_cache,
+            memory_cache=memory_cache,
+            resample_quality=resample_quality,
+        )
 
     def test(
         self,
@@ -105,9 +168,29 @@ class Tedlium(ParquetLoader):
         sr: int = DEFAULT_SAMPLE_RATE,
         prepare_dir: str = ".prepare",
         ignore_set: Sequence[str] = DEFAULT_IGNORE_SET,
+        columns: Sequence[str] | None = None,
+        filters: ParquetFilters | None = None,
+        backend: ParquetBackend = "pandas",
+        audio_cache: AudioDiskCache | None = None,
+        memory_cache: AudioMemoryCache | None = None,
+        resample_quality: ResampleQuality = DEFAULT_RESAMPLE_QUALITY,
     ) -> TedliumDataset:
-        data = self.load(name="test", prepare_dir=prepare_dir)
-        return TedliumDataset(parquet=data, sr=sr, ignore_set=ignore_set)
+        data = self.load(
+            name="test",
+            prepare_dir=prepare_dir,
+            columns=columns,
+            filters=filters,
+            backend=backend,
+        )
+        return TedliumDataset(
+            parquet=data,
+            sr=sr,
+            ignore_set=ignore_set,
+            root=self.path,
+            audio_cache=audio_cache,
+            memory_cache=memory_cache,
+            resample_quality=resample_quality,
+        )
 
 
 __all__ = ["Tedlium"]
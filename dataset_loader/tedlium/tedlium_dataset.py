@@ -1,36 +1,66 @@
 from __future__ import annotations
-import re
 
-import librosa
 import numpy as np
 import numpy.typing as npt
-import pandas as pd
 
+from pathlib import Path
 from typing import Any
 from typing_extensions import override
-from collections.abc import Sequence
-
-from dataset_loader.abstract import ParquetDataset
-
+from collections.abc import Sequence, Iterator
+
+from dataset_loader.abstract import ParquetDataset, ParquetData
+from dataset_loader.audio import (
+    AudioDiskCache,
+    AudioMemoryCache,
+    stream_audio,
+    load_audio,
+    ResampleQuality,
+    DEFAULT_RESAMPLE_QUALITY,
+    check_resample_quality,
+)
+
+from dataset_loader.tedlium.algorithm import clean_ref
 from dataset_loader.tedlium.tedlium_sample import TedliumSample
+from dataset_loader.tedlium.tedlium_utterance_dataset import (
+    TedliumUtteranceDataset,
+    explode_segments,
+)
 
 
 class TedliumDataset(ParquetDataset[TedliumSample]):
     def __init__(
         self,
         *,
-        parquet: pd.DataFrame,
+        parquet: ParquetData,
         sr: int,
         ignore_set: Sequence[str] = [],
+        indices: npt.ArrayLike | None = None,
+        root: str | Path | None = None,
+        audio_cache: AudioDiskCache | None = None,
+        memory_cache: AudioMemoryCache | None = None,
+        resample_quality: ResampleQuality = DEFAULT_RESAMPLE_QUALITY,
     ):
-        super().__init__(parquet=parquet)
+        super().__init__(
+            parquet=parquet,
+            indices=indices,
+            root=root,
+            audio_cache=audio_cache,
+            memory_cache=memory_cache,
+        )
         self._sr = sr
+        check_resample_quality(resample_quality)
+        self._resample_quality: ResampleQuality = resample_quality
         self._ignore_set = list(ignore_set)
 
     @property
     @override
     def args(self) -> dict[str, Any]:
-        return {**super().args, "ignore_set": self._ignore_set, "sr": self._sr}
+        return {
+            **super().args,
+            "ignore_set": self._ignore_set,
+            "sr": self._sr,
+            "resample_quality": self._resample_quality,
+        }
 
     @property
     def sr(self) -> int:
@@ -42,27 +72,51 @@ class TedliumDataset(ParquetDataset[TedliumSample]):
             raise ValueError("Sample rate must be a positive integer")
         self._sr = value
 
+    @property
+    def resample_quality(self) -> ResampleQuality:
+        return self._resample_quality
+
+    @resample_quality.setter
+    def resample_quality(self, value: ResampleQuality) -> None:
+        check_resample_quality(value)
+        self._resample_quality = value
+
     @override
     def get(self, idx: int) -> TedliumSample:
         if self.is_cleaned:
             raise RuntimeError("Cannot get sample from a cleaned dataset")
 
-        data: dict[str, Any] = self.dataset.iloc[idx].to_dict()  # type: ignore[assignment]
+        data = self.row(idx)
+        data["audio_path"] = str(self.resolve_path(data["audio_path"]))
 
         def load_audio_func() -> npt.NDArray[np.float32]:
-            audio_path = data["audio_path"]
-            wav, _ = librosa.load(audio_path, sr=self._sr)
-            return wav.astype(np.float32)
+            audio_path = Path(data["audio_path"])
+            sr, quality = self._sr, self._resample_quality
+
+            def decode() -> npt.NDArray[np.float32]:
+                return load_audio(audio_path, sr=sr, quality=quality)
+
+            return self._load_audio(audio_path, sr, decode, quality)
+
+        def stream_audio_func(
+            window: int, hop: int | None = None
+        ) -> Iterator[npt.NDArray[np.float32]]:
+            audio_path = Path(data["audio_path"])
+            return stream_audio(
+                audio_path,
+                sr=self._sr,
+                window=window,
+                hop=hop,
+                quality=self._resample_quality,
+            )
 
         diarization: str = data.pop("stm")
-        ref: str = data["text"]
-        for ignore in self._ignore_set:
-            ref = re.sub(rf"{re.escape(ignore)}\s*", "", ref)
-        ref = ref.strip()
+        ref = clean_ref(data["text"], self._ignore_set)
         _id: str = data.pop("id")
 
         result: dict[str, Any] = {
             "load_audio_func": load_audio_func,
+            "stream_audio_func": stream_audio_func,
             "ref": ref,
             "diarization": diarization,
             **data,
@@ -70,5 +124,27 @@ class TedliumDataset(ParquetDataset[TedliumSample]):
 
         return TedliumSample(id=_id, data=result)
 
+    def segments(self, *, drop_ignored: bool = True) -> TedliumUtteranceDataset:
+        """
+        녹음마다 STM 세그먼트를 하나의 샘플로 펼친 TedliumUtteranceDataset을 반환한다. \n
+        sr, ignore_set, root와 캐시는 그대로 넘겨지며, 세그먼트 샘플은 녹음 전체가 아니라 세그먼트 구간만 읽는다.
+
+        Args:
+            drop_ignored (bool): ignore_set을 지운 ref가 빈 세그먼트를 제외할지 여부
+        """
+        if self.is_cleaned:
+            raise RuntimeError("Cannot get segments of a cleaned dataset")
+        return TedliumUtteranceDataset(
+            parquet=explode_segments(
+                self.dataset, ignore_set=self._ignore_set, drop_ignored=drop_ignored
+            ),
+            sr=self._sr,
+            ignore_set=self._ignore_set,
+            root=self.root,
+            audio_cache=self.audio_cache,
+            memory_cache=self.memory_cache,
+            resample_quality=self._resample_quality,
+        )
+
 
 __all__ = ["TedliumDataset"]
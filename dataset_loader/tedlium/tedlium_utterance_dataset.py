@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import numpy as np
+import numpy.typing as npt
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from pathlib import Path
+from typing import Any
+from typing_extensions import override
+from collections.abc import Sequence, Iterator
+
+from dataset_loader.abstract import ParquetDataset, ParquetData
+from dataset_loader.audio import (
+    AudioDiskCache,
+    AudioMemoryCache,
+    load_segment,
+    stream_audio,
+    ResampleQuality,
+    DEFAULT_RESAMPLE_QUALITY,
+    check_resample_quality,
+)
+
+from dataset_loader.tedlium.algorithm import clean_ref
+from dataset_loader.tedlium.tedlium_utterance_sample import TedliumUtteranceSample
+
+SEGMENT_FIELDS: tuple[str, ...] = ("start", "end", "label", "speaker_id", "ref")
+
+
+def explode_segments(
+    parquet: ParquetData, *, ignore_set: Sequence[str] = (), drop_ignored: bool = True
+) -> ParquetData:
+    """
+    녹음 단위 메타데이터의 stm 컬럼을 펼쳐 세그먼트 단위 메타데이터를 만든다. 오디오는 읽지 않는다. \n
+    결과는 talk_id, audio_path, start, end, duration, label, speaker_id, ref 컬럼을 가지며 parquet과 같은 백엔드로 반환된다.
+    drop_ignored가 True이면 ignore_set을 지운 ref가 빈 세그먼트(ignore_time_segment_in_scoring 등)를 제외한다.
+    """
+    if isinstance(parquet, pa.Table):
+        table = parquet.select(["id", "audio_path", "stm"])
+    else:
+        table = pa.Table.from_pandas(
+            parquet[["id", "audio_path", "stm"]], preserve_index=False
+        )
+
+    stm = table.column("stm")
+    segments = pc.list_flatten(stm)
+    talks = table.select(["id", "audio_path"]).take(pc.list_parent_indices(stm))
+    fields = {name: pc.struct_field(segments, name) for name in SEGMENT_FIELDS}
+    result = pa.table(
+        {
+            "talk_id": talks.column("id"),
+            "audio_path": talks.column("audio_path"),
+            "start": fields["start"],
+            "end": fields["end"],
+            "duration": pc.subtract(fields["end"], fields["start"]),
+            "label": fields["label"],
+            "speaker_id": fields["speaker_id"],
+            "ref": fields["ref"],
+        }
+    )
+
+    if drop_ignored:
+        keep = [bool(clean_ref(ref, ignore_set)) for ref in fields["ref"].to_pylist()]
+        result = result.filter(pa.array(keep, type=pa.bool_()))
+    if isinstance(parquet, pa.Table):
+        return result
+    return result.to_pandas()
+
+
+class TedliumUtteranceDataset(ParquetDataset[TedliumUtteranceSample]):
+    """
+    TED-LIUM 녹음을 STM 세그먼트 단위로 제공하는 Dataset이다. TedliumDataset.segments로 만든다. \n
+    샘플의 audio는 load_segment로 세그먼트 구간의 프레임만 읽으므로 긴 녹음 전체를 디코딩하지 않는다.
+    audio_cache와 memory_cache의 키에는 구간이 포함된다.
+    미리 잘린 HuggingFace TED-LIUM 세그먼트를 읽는 SegmentTedliumDataset과 달리 로컬 녹음과 STM만 있으면 된다.
+
+    Attributes:
+        parquet (pd.DataFrame | pa.Table): explode_segments로 만든 세그먼트 메타데이터
+        sr (int): 목표 sr
+        ignore_set (Sequence[str]): ref에서 지울 토큰
+    """
+
+    def __init__(
+        self,
+        *,
+        parquet: ParquetData,
+        sr: int,
+        ignore_set: Sequence[str] = [],
+        indices: npt.ArrayLike | None = None,
+        root: str | Path | None = None,
+        audio_cache: AudioDiskCache | None = None,
+        memory_cache: AudioMemoryCache | None = None,
+        resample_quality: ResampleQuality = DEFAULT_RESAMPLE_QUALITY,
+    ):
+        super().__init__(
+            parquet=parquet,
+            indices=indices,
+            root=root,
+            audio_cache=audio_cache,
+            memory_cache=memory_cache,
+        )
+        self._sr = sr
+        check_resample_quality(resample_quality)
+        self._resample_quality: ResampleQuality = resample_quality
+        self._ignore_set = list(ignore_set)
+
+    @property
+    @override
+    def args(self) -> dict[str, Any]:
+        return {
+            **super().args,
+            "ignore_set": self._ignore_set,
+            "sr": self._sr,
+            "resample_quality": self._resample_quality,
+        }
+
+    @property
+    def sr(self) -> int:
+        return self._sr
+
+    @sr.setter
+    def sr(self, value: int) -> None:
+        if value <= 0:
+            raise ValueError("Sample rate must be a positive integer")
+        self._sr = value
+
+    @property
+    def resample_quality(self) -> ResampleQuality:
+        return self._resample_quality
+
+    @resample_quality.setter
+    def resample_quality(self, value: ResampleQuality) -> None:
+        check_resample_quality(value)
+        self._resample_quality = value
+
+    @override
+    def get(self, idx: int) -> TedliumUtteranceSample:
+        if self.is_cleaned:
+            raise RuntimeError("Cannot get sample from a cleaned dataset")
+
+        data = self.row(idx)
+        data["audio_path"] = str(self.resolve_path(data["audio_path"]))
+        start, end = float(data["start"]), float(data["end"])
+
+        def load_audio_func() -> npt.NDArray[np.float32]:
+            audio_path = Path(data["audio_path"])
+            sr, quality = self._sr, self._resample_quality
+
+            def decode() -> npt.NDArray[np.float32]:
+                return load_segment(audio_path, start, end, sr=sr, quality=quality)
+
+            return self._load_audio(audio_path, sr, decode, start, end, quality)
+
+        def stream_audio_func(
+            window: int, hop: int | None = None
+        ) -> Iterator[npt.NDArray[np.float32]]:
+            audio_path = Path(data["audio_path"])
+            return stream_audio(
+                audio_path,
+                sr=self._sr,
+                window=window,
+                hop=hop,
+                start=start,
+                end=end,
+                quality=self._resample_quality,
+            )
+
+        ref = clean_ref(data.pop("ref"), self._ignore_set)
+        _id = f"{data['talk_id']}-{start:.2f}-{end:.2f}"
+
+        result: dict[str, Any] = {
+            "load_audio_func": load_audio_func,
+            "stream_audio_func": stream_audio_func,
+            "ref": ref,
+            "diarization": [
+                {
+                    "start": 0.0,
+                    "end": end - start,
+                    "speaker": data["speaker_id"],
+                    "label": data["label"],
+                }
+            ],
+            **data,
+        }
+
+        return TedliumUtteranceSample(id=_id, data=result)
+
+
+__all__ = ["TedliumUtteranceDataset", "explode_segments"]
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from typing import cast, TypedDict
+from typing_extensions import ReadOnly
+from dataclasses import dataclass
+
+from dataset_loader.abstract import ASRSample
+
+
+class UtteranceLabel(TypedDict):
+    start: ReadOnly[float]
+    end: ReadOnly[float]
+    speaker: ReadOnly[str]
+    label: ReadOnly[str]
+
+
+@dataclass(frozen=True, slots=True)
+class TedliumUtteranceSample(ASRSample[str, list[UtteranceLabel]]):
+    """
+    TED-LIUM 녹음의 STM 세그먼트(발화) 하나를 나타내는 클래스. \n
+    audio는 세그먼트 구간만 담으며, diarization의 시간은 세그먼트 시작을 0으로 한다.
+    HuggingFace 데이터셋의 세그먼트를 그대로 읽는 SegmentTedliumSample과 달리 로컬 .sph 녹음에서 구간을 잘라 만든다.
+    """
+
+    @property
+    def talk_id(self) -> str:
+        return cast(str, self.data["talk_id"])
+
+    @property
+    def audio_path(self) -> str:
+        return cast(str, self.data["audio_path"])
+
+    @property
+    def start(self) -> float:
+        """녹음에서 세그먼트가 시작하는 시각(초)"""
+        return cast(float, self.data["start"])
+
+    @property
+    def end(self) -> float:
+        """녹음에서 세그먼트가 끝나는 시각(초)"""
+        return cast(float, self.data["end"])
+
+    @property
+    def duration(self) -> float:
+        return cast(float, self.data["duration"])
+
+    @property
+    def speaker_id(self) -> str:
+        return cast(str, self.data["speaker_id"])
+
+
+__all__ = ["TedliumUtteranceSample", "UtteranceLabel"]
@@ -2,5 +2,16 @@
 
 from dataset_loader.wrapper.dataset_wrapper import DatasetWrapper
 from dataset_loader.wrapper.thread_loader_mixin import ThreadLoaderMixin
+from dataset_loader.wrapper.process_loader_mixin import ProcessLoaderMixin
+from dataset_loader.wrapper.async_loader_mixin import AsyncLoaderMixin
+from dataset_loader.wrapper.loader_pool import LoaderPool
+from dataset_loader.wrapper.shared_memory_ring import SharedMemoryRing
 
-__all__ = ["DatasetWrapper", "ThreadLoaderMixin"]
+__all__ = [
+    "DatasetWrapper",
+    "ThreadLoaderMixin",
+    "ProcessLoaderMixin",
+    "AsyncLoaderMixin",
+    "SharedMemoryRing",
+    "LoaderPool",
+]
@@ -1,11 +1,15 @@
 # dataset_loader/interface/asr/__init__.py
 
 from dataset_loader.wrapper.asr.protocol import ASRDatasetProtocol
+from dataset_loader.wrapper.asr.asr_batch import ASRBatch
 from dataset_loader.wrapper.asr.asr_concat_dataset import ASRConcatDataset
 from dataset_loader.wrapper.asr.asr_dataset import ASRDataset
+from dataset_loader.wrapper.asr.bucket_sampler import BucketBatchSampler
 
 __all__ = [
     "ASRDatasetProtocol",
+    "ASRBatch",
     "ASRConcatDataset",
     "ASRDataset",
+    "BucketBatchSampler",
 ]
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import numpy as np
+import numpy.typing as npt
+
+from typing import Any, Generic, TypeVar
+from dataclasses import dataclass, field
+
+RefT = TypeVar("RefT")
+
+
+@dataclass(frozen=True, slots=True)
+class ASRBatch(Generic[RefT]):
+    """
+    ASRDataset.batch_iter가 반환하는 패딩된 배치이다.
+
+    Attributes:
+        ids (list[str]): 샘플 id
+        audio (npt.NDArray[np.float32]): [B, T_max] 크기의 오디오. 각 행의 lengths 이후는 0으로 채워진다.
+        lengths (npt.NDArray[np.int32]): [B] 크기의 각 샘플의 유효 길이
+        refs (list[RefT]): 샘플의 ref. ref가 없는 샘플은 None이다.
+    """
+
+    ids: list[str]
+    audio: npt.NDArray[np.float32] = field(repr=False)
+    lengths: npt.NDArray[np.int32]
+    refs: list[RefT] = field(repr=False)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def mask(self) -> npt.NDArray[np.bool_]:
+        """[B, T_max] 크기의 유효 구간 마스크를 반환한다."""
+        steps: npt.NDArray[Any] = np.arange(self.audio.shape[1])
+        return steps[None, :] < self.lengths[:, None]
+
+
+__all__ = ["ASRBatch"]
@@ -7,6 +7,7 @@ from typing_extensions import override
 from collections.abc import MutableSequence
 
 from dataset_loader.protocol import DatasetProtocol, ConcatDatasetProtocol
+from dataset_loader.base import ConcatDataset
 from dataset_loader.abstract import ASRSample
 
 from dataset_loader.wrapper.asr.protocol import ASRDatasetProtocol
@@ -19,6 +20,7 @@ DiarizationT = TypeVar("DiarizationT")
 class ASRConcatDataset(ASRDatasetMixin[RefT, DiarizationT]):
     """
     ASRDataset을 연결하여 새로운 ASRDataset을 만드는 클래스이다.
+    select로 만든 뷰에서 sr을 바꾸면 하위 Dataset을 소유한 복사본으로 구체화한 뒤 바꾸므로 원본에는 영향을 주지 않는다.
     """
 
     def __init__(
@@ -51,8 +53,12 @@ class ASRConcatDataset(ASRDatasetMixin[RefT, DiarizationT]):
 
     @sr.setter
     def sr(self, value: int) -> None:
-        for dataset in self.dataset.dataset:
-            dataset.sr = value
+        dataset = self.dataset
+        if isinstance(dataset, ConcatDataset) and not dataset.owns_datasets:
+            # 뷰의 하위 Dataset은 원본과 공유되므로 소유한 복사본으로 바꾼 뒤 sr을 바꾼다.
+            self._dataset = dataset.materialize()
+        for ds in self.dataset.dataset:
+            ds.sr = value
 
     @property
     def names(self) -> MutableSequence[str]:
@@ -1,13 +1,25 @@
 from __future__ import annotations
 
+import numpy as np
+import numpy.typing as npt
+
 from abc import ABC, abstractmethod
-from typing import TypeVar
+from typing import Any, TypeVar, cast
 from typing_extensions import override
+from collections import deque
+from functools import cached_property
+from collections.abc import Generator, Iterable, Sequence
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 
 from dataset_loader.abstract import ASRSample
 
 from dataset_loader.wrapper.dataset_wrapper import DatasetWrapper
 from dataset_loader.wrapper.thread_loader_mixin import ThreadLoaderMixin
+from dataset_loader.wrapper.process_loader_mixin import ProcessLoaderMixin
+from dataset_loader.wrapper.async_loader_mixin import AsyncLoaderMixin
+from dataset_loader.wrapper.thread_loader_mixin import _release
+
+from dataset_loader.wrapper.asr.asr_batch import ASRBatch
 
 from dataset_loader.wrapper.asr.protocol import ASRDatasetProtocol
 
@@ -18,6 +30,8 @@ DiarizationT = TypeVar("DiarizationT")
 class ASRDatasetMixin(
     DatasetWrapper[ASRSample[RefT, DiarizationT]],
     ThreadLoaderMixin[ASRSample[RefT, DiarizationT]],
+    ProcessLoaderMixin[ASRSample[RefT, DiarizationT]],
+    AsyncLoaderMixin[ASRSample[RefT, DiarizationT]],
     ASRDatasetProtocol,
     ABC,
 ):
@@ -35,5 +49,206 @@ class ASRDatasetMixin(
     ) -> ASRSample[RefT, DiarizationT]:
         return sample.loaded_audio_sample()
 
+    @cached_property
+    def durations(self) -> npt.NDArray[np.float64]:
+        """
+        샘플별 오디오 길이(초)를 반환한다. \n
+        prepare에서 저장한 dataset의 "duration" 컬럼을 읽으므로 오디오를 디코딩하지 않으며, 한 번 읽은 값은 캐시된다.
+
+        Raises:
+            TypeError: dataset이 컬럼을 제공하지 않는 경우
+            KeyError: dataset에 duration 컬럼이 없는 경우
+        """
+        column = getattr(self.dataset, "column", None)
+        if column is None:
+            raise TypeError(f"{type(self.dataset).__name__} does not provide columns")
+        durations = np.array(column("duration"), dtype=np.float64)
+        durations.setflags(write=False)
+        return durations
+
+    def batch_iter(
+        self,
+        batch_size: int | None = None,
+        *,
+        num_workers: int = 4,
+        prefetch: int = 2,
+        batches: Iterable[Sequence[int]] | None = None,
+        max_length: int | None = None,
+        drop_last: bool = False,
+        pool: Executor | None = None,
+        shutdown_wait: bool = False,
+    ) -> Generator[ASRBatch[RefT], None, None]:
+        """
+        샘플을 batch_size개씩, 또는 batches가 주는 인덱스 묶음대로 묶어 패딩된 ASRBatch로 반환하는 제너레이터 메서드입니다. \n
+        thread_iter와 같이 스레드에서 오디오를 디코딩하며, prefetch개의 배치를 미리 준비합니다.
+        배치 버퍼는 디코딩 전에 할당하고 각 로더 스레드가 자기 행에 직접 씁니다.
+        max_length가 주어지면 버퍼는 [B, max_length]이고, 주어지지 않으면 durations로 구한 배치의 최대 길이 T_max로
+        [B, T_max]를 할당합니다. durations를 쓸 수 없거나 배치에 duration이 없는 샘플이 있으면 디코딩이 끝난 뒤
+        버퍼를 할당하여 각 행을 한 번씩 복사하고, 디코딩된 오디오가 T_max보다 길면 그 배치만 버퍼를 다시 할당합니다.
+
+        Args:
+            batch_size (int | None): 배치의 크기입니다. batches와 둘 중 하나만 주어야 합니다.
+            num_workers (int): 사용할 스레드의 수입니다. pool이 주어지면 무시됩니다. 기본값은 4입니다.
+            prefetch (int): 미리 준비할 배치의 수입니다. 기본값은 2입니다.
+            batches (Iterable[Sequence[int]] | None): 배치별 인덱스 묶음입니다(예: BucketBatchSampler). 기본값은 None입니다.
+            max_length (int | None): 배치의 길이(샘플 수)입니다. 더 긴 오디오는 잘립니다. 기본값은 None입니다.
+            drop_last (bool): True이면 batch_size보다 작은 마지막 배치를 버립니다. 기본값은 False입니다.
+            pool (Executor | None): 재사용할 Executor입니다(예: LoaderPool). 기본값은 None입니다.
+            shutdown_wait (bool): 종료할 때 로드가 완료될 때까지 기다릴지 여부입니다. 기본값은 False입니다.
+        Yields:
+            ASRBatch[RefT]: 패딩된 배치입니다.
+        Raises:
+            ValueError: batch_size와 batches가 둘 다 주어지거나 둘 다 주어지지 않은 경우,
+                batch_size, num_workers, prefetch 또는 max_length가 양의 정수가 아닌 경우,
+                drop_last 또는 shutdown_wait가 boolean이 아닌 경우, pool이 Executor가 아닌 경우 발생합니다.
+        """
+
+        if (batch_size is None) == (batches is None):
+            raise ValueError("Exactly one of batch_size and batches must be given")
+        if batch_size is not None and (
+            not isinstance(batch_size, int) or batch_size <= 0
+        ):
+            raise ValueError("batch_size must be a positive integer")
+        if not isinstance(num_workers, int) or num_workers <= 0:
+            raise ValueError("num_workers must be a positive integer")
+        if not isinstance(prefetch, int) or prefetch <= 0:
+            raise ValueError("prefetch must be a positive integer")
+        if max_length is not None and (
+            not isinstance(max_length, int) or max_length <= 0
+        ):
+            raise ValueError("max_length must be a positive integer")
+        if not isinstance(drop_last, bool):
+            raise ValueError("drop_last must be a boolean")
+        if not isinstance(shutdown_wait, bool):
+            raise ValueError("shutdown_wait must be a boolean")
+        if pool is not None and not isinstance(pool, Executor):
+            raise ValueError("pool must be an Executor")
+
+        groups: Iterable[Sequence[int]]
+        if batch_size is not None:
+            length = len(self)
+            stop = length - length % batch_size if drop_last else length
+            groups = (
+                range(start, min(start + batch_size, stop))
+                for start in range(0, stop, batch_size)
+            )
+        else:
+            groups = cast(Iterable[Sequence[int]], batches)
+
+        executor: Executor = (
+            ThreadPoolExecutor(max_workers=num_workers) if pool is None else pool
+        )
+        pending: deque[
+            tuple[
+                list[ASRSample[RefT, DiarizationT]],
+                npt.NDArray[np.float32] | None,
+                list[Future[tuple[int, npt.NDArray[np.float32] | None]]],
+            ]
+        ] = deque()
+
+        durations: npt.NDArray[np.float64] | None = None
+        if max_length is None:
+            try:
+                durations = self.durations
+            except (TypeError, KeyError):
+                durations = None
+
+        def allocate(indices: Sequence[int]) -> npt.NDArray[np.float32] | None:
+            if max_length is not None:
+                return np.zeros((len(indices), max_length), dtype=np.float32)
+            if durations is None:
+                return None
+            batch_durations = durations[np.asarray(indices, dtype=np.int64)]
+            if np.isnan(batch_durations).any():
+                return None
+            longest = np.ceil(batch_durations.max(initial=0.0) * self.sr)
+            return np.zeros((len(indices), int(longest)), dtype=np.float32)
+
+        def collate() -> ASRBatch[RefT]:
+            samples, buffer, futures = pending.popleft()
+            results = [f.result() for f in futures]
+            lengths = np.array([n for n, _ in results], dtype=np.int32)
+            longest = int(lengths.max(initial=0))
+
+            if buffer is None or longest > buffer.shape[1]:
+                # 버퍼에 들어가지 않은 행(audio가 있는 행)이 있으면 버퍼를 다시 할당한다.
+                grown = np.zeros((len(samples), longest), dtype=np.float32)
+                if buffer is not None:
+                    grown[:, : buffer.shape[1]] = buffer
+                for row, (n, audio) in enumerate(results):
+                    if audio is not None:
+                        grown[row, :n] = audio
+                buffer = grown
+            elif max_length is None:
+                buffer = buffer[:, :longest]
+            refs = [cast(RefT, sample.data.get("ref")) for sample in samples]
+            return ASRBatch(
+                ids=[sample.id for sample in samples],
+                audio=buffer,
+                lengths=lengths,
+                refs=refs,
+            )
+
+        try:
+            for indices in groups:
+                samples = [self.get(int(idx)) for idx in indices]
+                buffer = allocate(indices)
+                futures = [
+                    executor.submit(
+                        _load_row, sample, buffer, row, max_length is not None
+                    )
+                    for row, sample in enumerate(samples)
+                ]
+                pending.append((samples, buffer, futures))
+
+                if len(pending) >= prefetch:
+                    yield collate()
+
+            while pending:
+                yield collate()
+        finally:
+            _release(
+                executor,
+                pool is None,
+                [f for _, _, futures in pending for f in futures],
+                shutdown_wait,
+            )
+
+    @override
+    def _pack(
+        self, sample: ASRSample[RefT, DiarizationT]
+    ) -> tuple[str, dict[str, Any], npt.NDArray[np.float32]]:
+        # 오디오 함수는 워커의 데이터셋을 참조하므로 보내지 않고, 받은 쪽은 배열에서 창을 나눈다.
+        data = {
+            k: v
+            for k, v in sample.data.items()
+            if k not in ("load_audio_func", "stream_audio_func")
+        }
+        return sample.id, data, sample.audio
+
+    @override
+    def _unpack(
+        self, id: str, data: dict[str, Any], array: npt.NDArray[Any]
+    ) -> ASRSample[RefT, DiarizationT]:
+        return ASRSample[RefT, DiarizationT].create(id=id, audio=array, data=data)
+
+
+def _load_row(
+    sample: ASRSample[Any, Any],
+    buffer: npt.NDArray[np.float32] | None,
+    row: int,
+    truncate: bool,
+) -> tuple[int, npt.NDArray[np.float32] | None]:
+    """
+    오디오를 디코딩하여 buffer의 row 행에 쓰고 (길이, None)을 반환한다. \n
+    buffer가 없거나, truncate가 False이고 오디오가 buffer보다 길면 쓰지 않고 (길이, 오디오)를 반환한다.
+    """
+    audio = sample.audio
+    if buffer is None or (not truncate and len(audio) > buffer.shape[1]):
+        return len(audio), audio
+    n = min(len(audio), buffer.shape[1])
+    buffer[row, :n] = audio[:n]
+    return n, None
+
 
 __all__ = ["ASRDatasetMixin"]
@@ -0,0 +1,120 @@
+# pyright: reportUnnecessaryIsInstance=false
+
+from __future__ import annotations
+
+import numpy as np
+import numpy.typing as npt
+
+from typing import TYPE_CHECKING, Any
+from collections.abc import Iterator
+
+if TYPE_CHECKING:
+    from dataset_loader.wrapper.asr.asr_dataset_mixin import ASRDatasetMixin
+
+
+class BucketBatchSampler:
+    """
+    오디오 길이가 비슷한 샘플끼리 배치를 만드는 샘플러이다. \n
+    dataset.durations로 샘플을 길이 분위수 기준 num_buckets개의 버킷으로 나누고, 각 버킷 안에서
+    (배치 크기 x 배치 내 최대 길이)가 max_frames를 넘지 않도록 배치를 만든다. 오디오는 디코딩하지 않는다. \n
+    shuffle이 True이면 반복할 때마다 rng로 버킷 안의 순서와 배치의 순서를 섞는다. 같은 시드의 rng는 같은 배치 순서를 만든다.
+    max_frames보다 긴 샘플과 probe에 실패하여 duration이 없는 샘플은 혼자 하나의 배치가 된다.
+
+    Attributes:
+        dataset (ASRDatasetMixin): 배치를 만들 ASR 데이터셋
+        max_frames (int): 패딩을 포함한 배치의 최대 샘플 수 (dataset.sr 기준)
+        num_buckets (int): 버킷의 수
+        shuffle (bool): 섞을지 여부
+        rng (np.random.Generator | None): 섞을 때 사용할 난수 생성기. None이면 시드 없이 생성한다.
+    Raises:
+        ValueError: max_frames 또는 num_buckets가 양의 정수가 아니거나 shuffle이 boolean이 아닌 경우 발생한다.
+    """
+
+    def __init__(
+        self,
+        dataset: ASRDatasetMixin[Any, Any],
+        *,
+        max_frames: int,
+        num_buckets: int = 10,
+        shuffle: bool = True,
+        rng: np.random.Generator | None = None,
+    ):
+        if not isinstance(max_frames, int) or max_frames <= 0:
+            raise ValueError("max_frames must be a positive integer")
+        if not isinstance(num_buckets, int) or num_buckets <= 0:
+            raise ValueError("num_buckets must be a positive integer")
+        if not isinstance(shuffle, bool):
+            raise ValueError("shuffle must be a boolean")
+
+        self._max_frames = max_frames
+        self._num_buckets = num_buckets
+        self._shuffle = shuffle
+        self._rng = np.random.default_rng() if rng is None else rng
+
+        durations = dataset.durations
+        missing = np.isnan(durations)
+        self._frames: npt.NDArray[np.int64] = np.where(
+            missing, -1, np.ceil(np.where(missing, 0.0, durations) * dataset.sr)
+        ).astype(np.int64)
+        self._missing: npt.NDArray[np.int64] = np.flatnonzero(missing)
+
+        known = self._frames[~missing]
+        if len(known) > 0:
+            quantiles = np.linspace(0, 1, num_buckets + 1)[1:-1]
+            boundaries = np.quantile(known, quantiles)
+        else:
+            boundaries = np.empty(0)
+        bucket_of = np.searchsorted(boundaries, self._frames, side="right")
+        # 셔플하지 않을 때는 버킷 안에서 짧은 샘플부터 배치를 만든다.
+        order = np.argsort(self._frames, kind="stable")
+        order = order[~missing[order]]
+        self._buckets: list[npt.NDArray[np.int64]] = [
+            order[bucket_of[order] == b] for b in range(num_buckets)
+        ]
+
+    @property
+    def max_frames(self) -> int:
+        return self._max_frames
+
+    @property
+    def num_buckets(self) -> int:
+        return self._num_buckets
+
+    @property
+    def frames(self) -> npt.NDArray[np.int64]:
+        """샘플별 길이(샘플 수). duration이 없는 샘플은 -1이다."""
+        return self._frames
+
+    def batches(self) -> list[list[int]]:
+        """한 에폭의 배치 인덱스 목록을 만든다. shuffle이 True이면 호출할 때마다 rng를 사용하여 새로 섞는다."""
+        batches: list[list[int]] = []
+        for bucket in self._buckets:
+            if self._shuffle:
+                bucket = self._rng.permutation(bucket)
+            batches.extend(self._pack(bucket))
+        batches.extend([idx] for idx in self._missing.tolist())
+
+        if self._shuffle:
+            return [batches[i] for i in self._rng.permutation(len(batches))]
+        return batches
+
+    def _pack(self, indices: npt.NDArray[np.int64]) -> list[list[int]]:
+        batches: list[list[int]] = []
+        batch: list[int] = []
+        longest = 0
+        for idx, frames in zip(indices.tolist(), self._frames[indices].tolist()):
+            longest_with = max(longest, frames)
+            if batch and longest_with * (len(batch) + 1) > self._max_frames:
+                batches.append(batch)
+                batch, longest_with = [], frames
+            batch.append(idx)
+            longest = longest_with
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def __iter__(self) -> Iterator[list[int]]:
+        yield from self.batches()
+
+
+__all__ = ["BucketBatchSampler"]
@@ -0,0 +1,86 @@
+# pyright: reportUnnecessaryIsInstance=false
+
+from __future__ import annotations
+
+import asyncio
+
+from abc import ABC, abstractmethod
+from typing import Generic, TypeVar
+from collections import deque
+from collections.abc import AsyncGenerator, Generator
+from concurrent.futures import Executor, ThreadPoolExecutor
+
+T = TypeVar("T")
+
+
+class AsyncLoaderMixin(Generic[T], ABC):
+    async def aiter(
+        self,
+        *,
+        concurrency: int = 4,
+        prefetch: int = 8,
+        executor: Executor | None = None,
+    ) -> AsyncGenerator[T, None]:
+        """
+        asyncio 이벤트 루프를 막지 않고 샘플을 로드하는 비동기 제너레이터 메서드입니다. \n
+        로드는 executor에서 실행되며, 동시에 실행되는 로드는 concurrency개, 미리 로드하는 샘플은 prefetch개로 제한됩니다.
+        소비자가 중간에 멈추거나 취소되면 아직 시작되지 않은 로드는 취소됩니다.
+
+        Args:
+            concurrency (int): 동시에 실행할 로드의 수입니다. 기본값은 4입니다.
+            prefetch (int): 미리 로드할 샘플의 수입니다. 기본값은 8입니다.
+            executor (Executor | None): 로드를 실행할 Executor입니다. None이면 concurrency개의 스레드를 가진
+                ThreadPoolExecutor를 만들고 종료 시 정리합니다. 주어진 Executor는 종료하지 않습니다.
+        Yields:
+            T: 로드된 샘플입니다.
+        Raises:
+            ValueError: concurrency 또는 prefetch가 양의 정수가 아닌 경우, executor가 Executor가 아닌 경우 발생합니다.
+        """
+
+        if not isinstance(concurrency, int) or concurrency <= 0:
+            raise ValueError("concurrency must be a positive integer")
+        if not isinstance(prefetch, int) or prefetch <= 0:
+            raise ValueError("prefetch must be a positive integer")
+        if executor is not None and not isinstance(executor, Executor):
+            raise ValueError("executor must be an Executor")
+
+        loop = asyncio.get_running_loop()
+        owned = executor is None
+        pool = ThreadPoolExecutor(max_workers=concurrency) if owned else executor
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def load(sample: T) -> T:
+            async with semaphore:
+                return await loop.run_in_executor(pool, self._loader, sample)
+
+        tasks: deque[asyncio.Task[T]] = deque()
+        try:
+            for sample in self:
+                tasks.append(asyncio.ensure_future(load(sample)))
+
+                if len(tasks) >= prefetch:
+                    yield await tasks.popleft()
+
+            while tasks:
+                yield await tasks.popleft()
+        finally:
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            if owned and pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+    def __aiter__(self) -> AsyncGenerator[T, None]:
+        return self.aiter()
+
+    @abstractmethod
+    def __iter__(self) -> Generator[T, None, None]:
+        raise NotImplementedError("Subclasses must implement __iter__ method")
+
+    @abstractmethod
+    def _loader(self, sample: T) -> T:
+        raise NotImplementedError("Subclasses must implement _loader method")
+
+
+__all__ = ["AsyncLoaderMixin"]
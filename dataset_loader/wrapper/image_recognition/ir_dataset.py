@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import numpy as np
+import numpy.typing as npt
+
 from typing import Any, TypeVar, cast
 from typing_extensions import override
 
@@ -10,6 +13,8 @@ from dataset_loader.abstract import IRSample
 
 from dataset_loader.wrapper.dataset_wrapper import DatasetWrapper
 from dataset_loader.wrapper.thread_loader_mixin import ThreadLoaderMixin
+from dataset_loader.wrapper.process_loader_mixin import ProcessLoaderMixin
+from dataset_loader.wrapper.async_loader_mixin import AsyncLoaderMixin
 
 LabelT = TypeVar("LabelT")
 
@@ -17,6 +22,8 @@ LabelT = TypeVar("LabelT")
 class IRDataset(
     DatasetWrapper[IRSample[LabelT]],
     ThreadLoaderMixin[IRSample[LabelT]],
+    ProcessLoaderMixin[IRSample[LabelT]],
+    AsyncLoaderMixin[IRSample[LabelT]],
 ):
     @override
     def concat(self, other: DatasetProtocol[Any, IRSample[Any]]) -> IRDataset[Any]:
@@ -32,5 +39,18 @@ class IRDataset(
     def _loader(self, sample: IRSample[LabelT]) -> IRSample[LabelT]:
         return sample.loaded_ir_sample()
 
+    @override
+    def _pack(
+        self, sample: IRSample[LabelT]
+    ) -> tuple[str, dict[str, Any], npt.NDArray[np.uint8]]:
+        data = {k: v for k, v in sample.data.items() if k != "load_raw"}
+        return sample.id, data, sample.raw
+
+    @override
+    def _unpack(
+        self, id: str, data: dict[str, Any], array: npt.NDArray[Any]
+    ) -> IRSample[LabelT]:
+        return IRSample[LabelT].create(id=id, raw=array, data=data)
+
 
 __all__ = ["IRDataset"]
@@ -0,0 +1,79 @@
+# pyright: reportUnnecessaryIsInstance=false
+
+from __future__ import annotations
+
+import threading
+
+from typing import Any, Callable, TypeVar
+from typing_extensions import ParamSpec, Self
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+class LoaderPool(Executor):
+    """
+    여러 번의 반복과 여러 데이터셋이 함께 사용하는 오래 사는 로더 스레드 풀이다. \n
+    thread_iter(pool=...)나 aiter(executor=...)에 넘기면 호출마다 Executor를 만들고 종료하지 않고 스레드를 재사용한다.
+    풀은 반복이 끝나도 종료되지 않으며, shutdown을 호출하거나 with 블록을 벗어날 때 종료된다.
+
+    Attributes:
+        num_workers (int): 스레드의 수
+        name (str): 스레드 이름의 접두사
+        is_shutdown (bool): 종료 여부
+    Raises:
+        ValueError: num_workers가 양의 정수가 아니거나 name이 문자열이 아닌 경우 발생한다.
+    """
+
+    def __init__(self, num_workers: int = 4, *, name: str = "dataset_loader"):
+        if not isinstance(num_workers, int) or num_workers <= 0:
+            raise ValueError("num_workers must be a positive integer")
+        if not isinstance(name, str):
+            raise ValueError("name must be a string")
+
+        self._num_workers = num_workers
+        self._name = name
+        self._executor = ThreadPoolExecutor(
+            max_workers=num_workers, thread_name_prefix=name
+        )
+        self._shutdown = False
+        self._lock = threading.Lock()
+
+    @property
+    def num_workers(self) -> int:
+        return self._num_workers
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def is_shutdown(self) -> bool:
+        return self._shutdown
+
+    def submit(
+        self, fn: Callable[P, R], /, *args: P.args, **kwargs: P.kwargs
+    ) -> Future[R]:
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("LoaderPool is shut down")
+            return self._executor.submit(fn, *args, **kwargs)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        with self._lock:
+            self._shutdown = True
+        self._executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.shutdown(wait=True, cancel_futures=True)
+
+    def __repr__(self) -> str:
+        state = "shutdown" if self._shutdown else "running"
+        return f"LoaderPool(num_workers={self._num_workers}, name={self._name!r}, {state})"
+
+
+__all__ = ["LoaderPool"]
@@ -0,0 +1,214 @@
+# pyright: reportUnnecessaryIsInstance=false
+
+from __future__ import annotations
+
+import multiprocessing
+import numpy as np
+import numpy.typing as npt
+
+from abc import ABC, abstractmethod
+from typing import Any, Generic, TypeVar, cast
+from collections import deque
+from collections.abc import Generator, Mapping
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor, Future
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+from dataset_loader.wrapper.shared_memory_ring import SharedMemoryRing, write_slot
+
+T = TypeVar("T")
+
+# (id, data, ring slot, shared memory name, shape, dtype)
+# ring slot이 None이면 배열은 name의 샘플 전용 공유 메모리에 있다.
+Packed = tuple[str, dict[str, Any], int | None, str, tuple[int, ...], str]
+
+_worker_dataset: Any = None
+_worker_ring: tuple[SharedMemory, int] | None = None
+
+
+def _init_worker(
+    cls: Any, state: Mapping[str, Any], ring: tuple[str, int] | None
+) -> None:
+    global _worker_dataset, _worker_ring
+    _worker_dataset = cls.__setstate__(state)
+    if ring is not None:
+        _worker_ring = (SharedMemory(name=ring[0]), ring[1])
+
+
+def _load_in_worker(idx: int, slot: int | None) -> Packed:
+    _id, data, array = _worker_dataset._pack(_worker_dataset.get(idx))
+    array = np.ascontiguousarray(array)
+
+    if slot is not None and _worker_ring is not None:
+        shm, slot_size = _worker_ring
+        if array.nbytes <= slot_size:
+            write_slot(shm, slot, slot_size, array)
+            return _id, data, slot, shm.name, array.shape, array.dtype.str
+
+    shm = SharedMemory(create=True, size=max(array.nbytes, 1))
+    try:
+        np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+    finally:
+        shm.close()
+    return _id, data, None, shm.name, array.shape, array.dtype.str
+
+
+def _receive(
+    packed: Packed, ring: SharedMemoryRing | None
+) -> tuple[str, dict[str, Any], npt.NDArray[Any]]:
+    _id, data, slot, name, shape, dtype = packed
+    if slot is not None and ring is not None:
+        return _id, data, ring.view(slot, shape, np.dtype(dtype))
+
+    shm = SharedMemory(name=name)
+    try:
+        array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf).copy()
+    finally:
+        shm.close()
+        shm.unlink()
+    return _id, data, array
+
+
+def _discard(packed: Packed) -> None:
+    if packed[2] is not None:
+        return
+    shm = SharedMemory(name=packed[3])
+    shm.close()
+    shm.unlink()
+
+
+def _abandon(
+    ring: SharedMemoryRing | None, slot: int | None, future: Future[Packed]
+) -> None:
+    """소비되지 않은 작업이 끝나면 샘플 전용 공유 메모리를 삭제하고 슬롯을 반환한다."""
+    if not future.cancelled() and future.exception() is None:
+        _discard(future.result())
+    if ring is not None and slot is not None:
+        ring.release(slot)
+
+
+class ProcessLoaderMixin(Generic[T], ABC):
+    def process_iter(
+        self,
+        *,
+        num_workers: int = 4,
+        prefetch: int = 8,
+        mp_context: str | None = None,
+        ring: SharedMemoryRing | None = None,
+        recycle: bool = True,
+        shutdown_wait: bool = False,
+    ) -> Generator[T, None, None]:
+        """
+        ProcessPoolExecutor를 사용하여 샘플을 병렬로 로드하는 제너레이터 메서드입니다. \n
+        각 워커는 __getstate__로 만든 상태에서 데이터셋을 복원하고, 디코딩된 배열은 pickle 대신
+        공유 메모리를 통해 전달됩니다. GIL에 묶이는 디코딩/전처리가 많을 때 thread_iter 대신 사용합니다. \n
+        ring이 주어지면 워커는 예약된 슬롯에 배열을 직접 쓰고, 샘플은 슬롯을 복사 없이 가리킵니다.
+        슬롯에 들어가지 않거나 빈 슬롯이 없으면 샘플 전용 공유 메모리로 전달되고 복사본을 받습니다.
+
+        Args:
+            num_workers (int): 사용할 프로세스의 수입니다. 기본값은 4입니다.
+            prefetch (int): 미리 로드할 샘플의 수입니다. 기본값은 8입니다.
+            mp_context (str | None): multiprocessing 시작 방식("fork", "spawn", "forkserver")입니다. None이면 플랫폼 기본값을 사용합니다.
+            ring (SharedMemoryRing | None): 배열을 전달할 공유 메모리 링입니다. 슬롯 수는 prefetch보다 커야 복사 없이 전달됩니다.
+            recycle (bool): True이면 다음 샘플을 요청할 때 이전 샘플의 슬롯을 반환합니다. 샘플을 보관하려면 배열을 복사해야 합니다.
+                False이면 ring.release(sample의 배열)로 직접 반환해야 합니다. 기본값은 True입니다.
+            shutdown_wait (bool): Executor를 종료할 때 작업이 완료될 때까지 기다릴지 여부입니다. 기본값은 False입니다.
+        Yields:
+            T: 로드된 샘플입니다.
+        Raises:
+            ValueError: num_workers 또는 prefetch가 양의 정수가 아닌 경우, shutdown_wait가 boolean이 아닌 경우 발생합니다.
+        """
+
+        if not isinstance(num_workers, int) or num_workers <= 0:
+            raise ValueError("num_workers must be a positive integer")
+        if not isinstance(prefetch, int) or prefetch <= 0:
+            raise ValueError("prefetch must be a positive integer")
+        if not isinstance(shutdown_wait, bool):
+            raise ValueError("shutdown_wait must be a boolean")
+        if not isinstance(recycle, bool):
+            raise ValueError("recycle must be a boolean")
+
+        # 워커가 만든 공유 메모리를 부모와 같은 resource tracker에 등록하도록 먼저 띄운다.
+        resource_tracker.ensure_running()
+        executor = ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=multiprocessing.get_context(mp_context),
+            initializer=_init_worker,
+            initargs=(
+                type(self),
+                self.__getstate__(),
+                None if ring is None else (ring.name, ring.slot_size),
+            ),
+        )
+        futures: deque[tuple[Future[Packed], int | None]] = deque()
+        yielded: int | None = None
+
+        def receive() -> T:
+            nonlocal yielded
+            future, slot = futures.popleft()
+            try:
+                packed = future.result()
+            except BaseException:
+                # 워커가 실패하면 예약한 슬롯이 채워지지 않으므로 바로 반환한다.
+                if slot is not None:
+                    cast(SharedMemoryRing, ring).release(slot)
+                raise
+            if slot is not None and packed[2] is None:
+                cast(SharedMemoryRing, ring).release(slot)
+            yielded = packed[2]
+            return self._unpack(*_receive(packed, ring))
+
+        def recycle_yielded() -> None:
+            nonlocal yielded
+            if recycle and ring is not None and yielded is not None:
+                ring.release(yielded)
+            yielded = None
+
+        try:
+            for idx in range(len(self)):
+                recycle_yielded()
+                slot = None if ring is None else ring.try_acquire()
+                futures.append((executor.submit(_load_in_worker, idx, slot), slot))
+
+                if len(futures) >= prefetch:
+                    yield receive()
+
+            while futures:
+                recycle_yielded()
+                yield receive()
+            recycle_yielded()
+        finally:
+            recycle_yielded()
+            for f, _ in futures:
+                f.cancel()
+            executor.shutdown(wait=shutdown_wait, cancel_futures=True)
+            # 아직 실행 중인 작업은 워커가 쓰기를 마친 뒤에 정리한다.
+            # 이미 끝난 작업의 콜백은 바로 호출된다.
+            for f, slot in futures:
+                f.add_done_callback(partial(_abandon, ring, slot))
+
+    @abstractmethod
+    def __len__(self) -> int:
+        raise NotImplementedError("Subclasses must implement __len__ method")
+
+    @abstractmethod
+    def get(self, idx: int) -> T:
+        raise NotImplementedError("Subclasses must implement get method")
+
+    @abstractmethod
+    def __getstate__(self) -> dict[str, Any]:
+        raise NotImplementedError("Subclasses must implement __getstate__ method")
+
+    @abstractmethod
+    def _pack(self, sample: T) -> tuple[str, dict[str, Any], npt.NDArray[Any]]:
+        """워커에서 샘플을 (id, 배열을 제외한 data, 배열)로 나눈다."""
+        raise NotImplementedError("Subclasses must implement _pack method")
+
+    @abstractmethod
+    def _unpack(self, id: str, data: dict[str, Any], array: npt.NDArray[Any]) -> T:
+        """_pack으로 나눈 값을 다시 로드된 샘플로 만든다."""
+        raise NotImplementedError("Subclasses must implement _unpack method")
+
+
+__all__ = ["ProcessLoaderMixin"]
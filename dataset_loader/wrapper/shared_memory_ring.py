@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import threading
+import numpy as np
+import numpy.typing as npt
+
+from typing import Any, cast
+from typing_extensions import Self
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+SLOT_ALIGNMENT = 64
+
+
+class SharedMemoryRing:
+    """
+    고정 크기 슬롯으로 나뉜 하나의 공유 메모리 영역이다. \n
+    process_iter의 워커는 디코딩한 배열을 슬롯에 직접 쓰고, 소비자는 복사 없이 슬롯을 가리키는 numpy 뷰를 받는다.
+    슬롯은 release로 반환되어 재사용된다. 뷰는 슬롯이 반환된 뒤에는 다른 샘플로 덮어써질 수 있다.
+
+    Attributes:
+        num_slots (int): 슬롯의 수
+        slot_size (int): 슬롯 하나의 바이트 크기 (64바이트 단위로 올림된다)
+        name (str): 공유 메모리 이름
+    Raises:
+        ValueError: num_slots 또는 slot_size가 양의 정수가 아닌 경우 발생한다.
+    """
+
+    def __init__(self, *, num_slots: int, slot_size: int):
+        if not isinstance(num_slots, int) or num_slots <= 0:
+            raise ValueError("num_slots must be a positive integer")
+        if not isinstance(slot_size, int) or slot_size <= 0:
+            raise ValueError("slot_size must be a positive integer")
+
+        self._slot_size = -(-slot_size // SLOT_ALIGNMENT) * SLOT_ALIGNMENT
+        self._num_slots = num_slots
+        resource_tracker.ensure_running()
+        self._shm: SharedMemory | None = SharedMemory(
+            create=True, size=self._num_slots * self._slot_size
+        )
+        self._free: list[int] = list(range(num_slots - 1, -1, -1))
+        self._lock = threading.Lock()
+
+    @property
+    def num_slots(self) -> int:
+        return self._num_slots
+
+    @property
+    def slot_size(self) -> int:
+        return self._slot_size
+
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    @property
+    def free_slots(self) -> int:
+        with self._lock:
+            return len(self._free)
+
+    @property
+    def _memory(self) -> SharedMemory:
+        if self._shm is None:
+            raise RuntimeError("SharedMemoryRing is closed")
+        return self._shm
+
+    def try_acquire(self) -> int | None:
+        """비어있는 슬롯 하나를 예약한다. 비어있는 슬롯이 없으면 None을 반환한다."""
+        with self._lock:
+            return self._free.pop() if self._free else None
+
+    def release(self, slot: int | npt.NDArray[Any]) -> None:
+        """
+        슬롯을 반환하여 재사용할 수 있게 한다. 슬롯 번호 또는 view로 받은 배열을 받으며, 여러 번 호출해도 안전하다.
+
+        Raises:
+            ValueError: 슬롯 번호가 범위를 벗어나거나 배열이 이 링의 슬롯을 가리키지 않는 경우
+        """
+        if isinstance(slot, np.ndarray):
+            slot = self.slot_of(slot)
+        if not (0 <= slot < self._num_slots):
+            raise ValueError(f"Invalid slot: {slot}")
+        with self._lock:
+            if slot not in self._free:
+                self._free.append(slot)
+
+    def slot_of(self, array: npt.NDArray[Any]) -> int:
+        """배열이 가리키는 슬롯 번호를 반환한다."""
+        base = np.frombuffer(cast(memoryview, self._memory.buf), dtype=np.uint8)
+        offset = (
+            array.__array_interface__["data"][0] - base.__array_interface__["data"][0]
+        )
+        if not (0 <= offset < self._num_slots * self._slot_size):
+            raise ValueError("Array does not point into this SharedMemoryRing")
+        return int(offset // self._slot_size)
+
+    def view(
+        self, slot: int, shape: tuple[int, ...], dtype: npt.DTypeLike
+    ) -> npt.NDArray[Any]:
+        """슬롯에 저장된 배열을 복사 없이 가리키는 numpy 배열을 반환한다."""
+        return np.ndarray(
+            shape, dtype=dtype, buffer=self._memory.buf, offset=slot * self._slot_size
+        )
+
+    def close(self) -> None:
+        """
+        공유 메모리를 닫고 삭제한다.
+
+        Raises:
+            RuntimeError: view로 받은 배열이 아직 살아있는 경우
+        """
+        if self._shm is None:
+            return
+        try:
+            self._shm.close()
+        except BufferError as e:
+            raise RuntimeError(
+                "Cannot close SharedMemoryRing while views into it are alive"
+            ) from e
+        self._shm.unlink()
+        self._shm = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+def write_slot(
+    shm: SharedMemory, slot: int, slot_size: int, array: npt.NDArray[Any]
+) -> None:
+    """워커 쪽에서 이름으로 연결한 공유 메모리의 슬롯에 배열을 쓴다."""
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf, offset=slot * slot_size)[
+        ...
+    ] = array
+
+
+__all__ = ["SharedMemoryRing", "write_slot"]
@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+import heapq
+
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar
 from collections import deque
-from collections.abc import Generator
-from concurrent.futures import ThreadPoolExecutor, Future
+from collections.abc import Generator, Collection
+from concurrent.futures import (
+    Executor,
+    ThreadPoolExecutor,
+    Future,
+    wait,
+    FIRST_COMPLETED,
+)
 
 T = TypeVar("T")
 
@@ -18,18 +26,31 @@ class ThreadLoaderMixin(Generic[T], ABC):
         num_workers: int = 4,
         prefetch: int = 8,
         shutdown_wait: bool = False,
+        ordered: bool = True,
+        reorder_buffer: int | None = None,
+        pool: Executor | None = None,
     ) -> Generator[T, None, None]:
         """
         ThreadPoolExecutor를 사용하여 샘플을 병렬로 로드하는 제너레이터 메서드입니다. \n
+        ordered가 False이면 샘플을 로드가 끝난 순서대로 반환하므로, 느린 샘플 하나가 나머지를 막지 않습니다. \n
+        pool이 주어지면 새 Executor를 만들지 않고 pool(LoaderPool 등 임의의 Executor)을 사용하며, 반복이 끝나도 pool은 종료하지 않습니다.
+        제너레이터를 중간에 버리면(close 또는 참조 해제) 아직 시작되지 않은 로드는 즉시 취소됩니다.
 
         Args:
-            num_workers (int): 사용할 스레드의 수입니다. 기본값은 4입니다.
+            num_workers (int): 사용할 스레드의 수입니다. pool이 주어지면 무시됩니다. 기본값은 4입니다.
             prefetch (int): 미리 로드할 샘플의 수입니다. 기본값은 8입니다.
             shutdown_wait (bool): Executor를 종료할 때 작업이 완료될 때까지 기다릴지 여부입니다. 기본값은 False입니다.
+            ordered (bool): True이면 데이터셋 순서대로, False이면 완료 순서대로 반환합니다. 기본값은 True입니다.
+            reorder_buffer (int | None): ordered가 False일 때 완료된 샘플을 최대 reorder_buffer개까지 모아
+                순서에 가깝게 반환합니다. 다음 순서의 샘플이 도착하면 바로 반환하고, 버퍼가 가득 차면 가장 앞선 샘플을 반환합니다.
+                None이면 버퍼 없이 완료 순서대로 반환합니다. 기본값은 None입니다.
+            pool (Executor | None): 재사용할 Executor입니다(예: LoaderPool). shutdown_wait가 True이면 이 반복이 제출한 로드가 끝날 때까지 기다립니다.
+                기본값은 None입니다.
         Yields:
             T: 로드된 샘플입니다.
         Raises:
-            ValueError: num_workers 또는 prefetch가 양의 정수가 아닌 경우, shutdown_wait가 boolean이 아닌 경우 발생합니다.
+            ValueError: num_workers 또는 prefetch가 양의 정수가 아닌 경우, shutdown_wait 또는 ordered가 boolean이 아닌 경우,
+                reorder_buffer가 음이 아닌 정수가 아니거나 ordered가 True인데 주어진 경우, pool이 Executor가 아닌 경우 발생합니다.
         """
 
         if not isinstance(num_workers, int) or num_workers <= 0:
@@ -38,8 +59,25 @@ class ThreadLoaderMixin(Generic[T], ABC):
             raise ValueError("prefetch must be a positive integer")
         if not isinstance(shutdown_wait, bool):
             raise ValueError("shutdown_wait must be a boolean")
+        if not isinstance(ordered, bool):
+            raise ValueError("ordered must be a boolean")
+        if reorder_buffer is not None:
+            if not isinstance(reorder_buffer, int) or reorder_buffer < 0:
+                raise ValueError("reorder_buffer must be a non-negative integer")
+            if ordered:
+                raise ValueError("reorder_buffer requires ordered=False")
+        if pool is not None and not isinstance(pool, Executor):
+            raise ValueError("pool must be an Executor")
+
+        executor: Executor = (
+            ThreadPoolExecutor(max_workers=num_workers) if pool is None else pool
+        )
+        if not ordered:
+            yield from self._unordered_iter(
+                executor, pool is None, prefetch, shutdown_wait, reorder_buffer or 0
+            )
+            return
 
-        executor = ThreadPoolExecutor(max_workers=num_workers)
         futures: deque[Future[T]] = deque()
         try:
             for sample in self:
@@ -51,9 +89,46 @@ class ThreadLoaderMixin(Generic[T], ABC):
             while futures:
                 yield futures.popleft().result()
         finally:
-            for f in futures:
-                f.cancel()
-            executor.shutdown(wait=shutdown_wait, cancel_futures=True)
+            _release(executor, pool is None, futures, shutdown_wait)
+
+    def _unordered_iter(
+        self,
+        executor: Executor,
+        owned: bool,
+        prefetch: int,
+        shutdown_wait: bool,
+        reorder_buffer: int,
+    ) -> Generator[T, None, None]:
+        pending: dict[Future[T], int] = {}
+        # (index, 완료된 샘플) 힙과 다음으로 반환할 index. 이미 지나간 index는 도착하는 대로 반환한다.
+        buffer: list[tuple[int, T]] = []
+        next_idx = 0
+
+        def collect() -> Generator[T, None, None]:
+            nonlocal next_idx
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for f in done:
+                heapq.heappush(buffer, (pending.pop(f), f.result()))
+            while buffer and (
+                buffer[0][0] <= next_idx or len(buffer) > reorder_buffer
+            ):
+                idx, sample = heapq.heappop(buffer)
+                next_idx = max(next_idx, idx + 1)
+                yield sample
+
+        try:
+            for idx, sample in enumerate(self):
+                pending[executor.submit(self._loader, sample)] = idx
+
+                if len(pending) >= prefetch:
+                    yield from collect()
+
+            while pending:
+                yield from collect()
+            while buffer:
+                yield heapq.heappop(buffer)[1]
+        finally:
+            _release(executor, owned, pending, shutdown_wait)
 
     @abstractmethod
     def __iter__(self) -> Generator[T, None, None]:
@@ -64,4 +139,19 @@ class ThreadLoaderMixin(Generic[T], ABC):
         raise NotImplementedError("Subclasses must implement _loader method")
 
 
+def _release(
+    executor: Executor,
+    owned: bool,
+    futures: Collection[Future[Any]],
+    shutdown_wait: bool,
+) -> None:
+    """반복이 제출한 로드를 취소하고, 반복이 만든 Executor라면 종료한다."""
+    for f in futures:
+        f.cancel()
+    if owned:
+        executor.shutdown(wait=shutdown_wait, cancel_futures=True)
+    elif shutdown_wait:
+        wait(futures)
+
+
 __all__ = ["ThreadLoaderMixin"]
@@ -0,0 +1 @@
+# tests/unit/abstract/__init__.py
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import pytest
+import threading
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+from dataset_loader.base import Sample
+from dataset_loader.librispeech import LibriSpeechDataset
+
+from tests.unit.base import MixinDatasetTest
+
+SR = 16_000
+NUM_ROWS = 50
+
+
+@pytest.fixture
+def parquet() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "id": [f"{i:03d}" for i in range(NUM_ROWS)],
+            "ref": [f"ref {i}" for i in range(NUM_ROWS)],
+            "audio_path": [f"audio/{i:03d}.flac" for i in range(NUM_ROWS)],
+            "duration": np.linspace(1.0, 20.0, NUM_ROWS),
+        }
+    )
+
+
+@pytest.fixture
+def table(parquet: pd.DataFrame) -> pa.Table:
+    # row group 경계를 넘는 행 접근을 확인하기 위해 여러 chunk로 나눈다.
+    return pa.Table.from_batches(
+        pa.Table.from_pandas(parquet, preserve_index=False).to_batches(max_chunksize=7)
+    )
+
+
+class TestArrowParquetDataset(MixinDatasetTest):
+    @pytest.fixture
+    def dataset(self, table: pa.Table) -> LibriSpeechDataset:
+        return LibriSpeechDataset(parquet=table, sr=SR)
+
+    @pytest.fixture
+    def samples(self, dataset: LibriSpeechDataset) -> list[Sample]:
+        return [sample for sample in dataset]
+
+
+def test_rows_match_pandas(parquet: pd.DataFrame, table: pa.Table) -> None:
+    pandas = LibriSpeechDataset(parquet=parquet, sr=SR)
+    arrow = LibriSpeechDataset(parquet=table, sr=SR)
+    assert arrow.is_arrow and not pandas.is_arrow
+
+    for idx in (0, 6, 7, 31, -1):
+        assert arrow.row(idx) == pandas.row(idx)
+    with pytest.raises(IndexError):
+        arrow.row(NUM_ROWS)
+
+    indices = [40, 3, -2, 17]
+    for view_arrow, view_pandas in (
+        (arrow.select(indices), pandas.select(indices)),
+        (arrow[5:45:3][2:], pandas[5:45:3][2:]),
+        (arrow[10:30].select([4, 0]), pandas[10:30].select([4, 0])),
+    ):
+        assert len(view_arrow) == len(view_pandas)
+        assert [s.id for s in view_arrow] == [s.id for s in view_pandas]
+        np.testing.assert_array_equal(
+            view_arrow.column("duration"), view_pandas.column("duration")
+        )
+
+
+def test_select_does_not_copy_table(table: pa.Table) -> None:
+    dataset = LibriSpeechDataset(parquet=table, sr=SR)
+    selected = dataset.select([3, 1, 2])[1:]
+    assert selected.args["parquet"] is table
+    assert selected.args["indices"].tolist() == [1, 2]
+    assert dataset[10:20].args["indices"] is None
+
+    restored = LibriSpeechDataset.from_dict(selected.to_dict())
+    assert restored.is_arrow
+    assert [s.id for s in restored] == ["001", "002"]
+
+
+def test_concurrent_rows(table: pa.Table) -> None:
+    for _ in range(20):
+        dataset = LibriSpeechDataset(parquet=table, sr=SR)
+        barrier = threading.Barrier(8)
+
+        def read(idx: int) -> str:
+            barrier.wait()
+            return str(dataset.row(idx)["id"])
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            ids = list(executor.map(read, range(NUM_ROWS - 8, NUM_ROWS)))
+        assert ids == [f"{i:03d}" for i in range(NUM_ROWS - 8, NUM_ROWS)]
+
+
+def test_indices_require_arrow(parquet: pd.DataFrame) -> None:
+    with pytest.raises(ValueError):
+        LibriSpeechDataset(parquet=parquet, sr=SR, indices=[0])
+
+
+@pytest.mark.parametrize("backend", ["pandas", "arrow"])
+def test_root_resolves_paths_lazily(
+    parquet: pd.DataFrame, table: pa.Table, backend: str
+) -> None:
+    data = parquet if backend == "pandas" else table
+    dataset = LibriSpeechDataset(parquet=data, sr=SR, root=Path("/data/LibriSpeech"))
+    assert dataset.root == Path("/data/LibriSpeech")
+    assert dataset.row(3)["audio_path"] == "audio/003.flac"
+    assert dataset.resolve_path("audio/003.flac") == Path(
+        "/data/LibriSpeech/audio/003.flac"
+    )
+    assert dataset.resolve_path("/abs/0.flac") == Path("/abs/0.flac")
+    assert LibriSpeechDataset(parquet=data, sr=SR).resolve_path("a.flac") == Path(
+        "a.flac"
+    )
+
+    selected = dataset.select([3, 1])
+    assert selected.root == dataset.root
+    serialized = selected.to_dict()
+    assert serialized["root"] == "/data/LibriSpeech"
+    assert [row["audio_path"] for row in serialized["parquet"]] == [
+        "audio/003.flac",
+        "audio/001.flac",
+    ]
+    assert LibriSpeechDataset.from_dict(serialized).root == dataset.root
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import gc
+import os
+import pytest
+import numpy as np
+import pandas as pd
+import soundfile as sf
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from pathlib import Path
+from typing import Any
+from typing_extensions import override
+
+from dataset_loader.abstract import ParquetLoader
+
+SPLITS = {"a": "a.parquet", "b": "b.parquet", "c": "c.parquet"}
+SR = 8000
+
+
+class DummyLoader(ParquetLoader):
+    def __init__(self, *, path: Path, required_columns: tuple[str, ...] = ()):
+        super().__init__(
+            dir_name="DummyLoader",
+            path=path,
+            parquet_name_and_path=SPLITS,
+            audio_column="audio_path",
+            required_columns=required_columns,
+        )
+
+    @override
+    def download(self, *args: Any, **kwargs: Any) -> None:
+        raise NotImplementedError
+
+    def _files(self, name: str) -> list[Path]:
+        return sorted((self.path / name).glob("*.txt"))
+
+    @override
+    def _list_files(self, *, name: str) -> list[Path]:
+        return self._files(name)
+
+    @override
+    def _parse_file(self, file: Path, *, name: str) -> list[dict[str, Any]]:
+        return [
+            {
+                "id": f"{file.stem}-{i}",
+                "audio_path": str(file.with_suffix(".wav").relative_to(self.path)),
+                "ref": line,
+            }
+            for i, line in enumerate(file.read_text().splitlines())
+        ]
+
+
+class LegacyLoader(DummyLoader):
+    """_list_files 없이 _parse_files만 구현한 로더"""
+
+    @override
+    def _parse_files(
+        self, *, name: str, verbose: bool = True, **options: Any
+    ) -> list[dict[str, Any]]:
+        return [
+            row for file in self._files(name) for row in self._parse_file(file, name=name)
+        ]
+
+    @override
+    def _list_files(self, *, name: str) -> list[Path]:
+        raise NotImplementedError
+
+
+@pytest.fixture
+def root(tmp_path: Path) -> Path:
+    rng = np.random.default_rng(seed=0)
+    for split in SPLITS:
+        for f in range(5):
+            directory = tmp_path / "DummyLoader" / split
+            directory.mkdir(parents=True, exist_ok=True)
+            lines = [f"{split} {f} {i}" for i in range(rng.integers(1, 4))]
+            (directory / f"{f:02d}.txt").write_text("\n".join(lines))
+            sf.write(directory / f"{f:02d}.wav", np.zeros(SR * (f + 1)), SR)
+    return tmp_path
+
+
+def prepared(loader: ParquetLoader, num_workers: int) -> dict[str, pd.DataFrame]:
+    prepare_dir = f".prepare-{num_workers}"
+    loader.prepare(verbose=False, prepare_dir=prepare_dir, num_workers=num_workers)
+    return {
+        name: pd.read_parquet(loader.path / prepare_dir / parquet)
+        for name, parquet in SPLITS.items()
+    }
+
+
+@pytest.mark.parametrize("loader_type", [DummyLoader, LegacyLoader])
+def test_parallel_prepare_is_deterministic(
+    root: Path, loader_type: type[DummyLoader]
+) -> None:
+    loader = loader_type(path=root)
+    sequential = prepared(loader, num_workers=1)
+    parallel = prepared(loader, num_workers=3)
+
+    for name in SPLITS:
+        pd.testing.assert_frame_equal(sequential[name], parallel[name])
+        ids = sequential[name]["id"].tolist()
+        assert ids == sorted(ids)
+    assert sequential["b"]["num_samples"].tolist() == [
+        SR * (int(i.split("-")[0]) + 1) for i in sequential["b"]["id"]
+    ]
+
+
+def test_prepare_invalid_num_workers(root: Path) -> None:
+    with pytest.raises(ValueError):
+        DummyLoader(path=root).prepare(num_workers=0)
+
+
+@pytest.mark.parametrize("num_workers", [1, 2])
+def test_incremental_prepare(root: Path, num_workers: int) -> None:
+    loader = DummyLoader(path=root)
+    loader.prepare(verbose=False, incremental=True, num_workers=num_workers)
+    manifest = root / "DummyLoader" / ".prepare" / "a.parquet.manifest.json"
+    assert manifest.exists()
+
+    directory = root / "DummyLoader" / "a"
+    (directory / "02.txt").write_text("changed\nlines")
+    (directory / "05.txt").write_text("added")
+    sf.write(directory / "05.wav", np.zeros(SR), SR)
+    (directory / "00.txt").unlink()
+
+    parsed: list[str] = []
+    parse_file = DummyLoader._parse_file
+
+    def counting(self: DummyLoader, file: Path, *, name: str) -> list[dict[str, Any]]:
+        parsed.append(f"{name}/{file.name}")
+        return parse_file(self, file, name=name)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(DummyLoader, "_parse_file", counting)
+        loader.prepare(verbose=False, incremental=True, num_workers=1)
+    assert sorted(parsed) == ["a/02.txt", "a/05.txt"]
+
+    incremental = pd.read_parquet(root / "DummyLoader" / ".prepare" / "a.parquet")
+    full = prepared(loader, num_workers=1)["a"]
+    pd.testing.assert_frame_equal(incremental, full)
+    assert [i for i in incremental["id"] if i.startswith("02-")] == ["02-0", "02-1"]
+
+
+def test_incremental_prepare_with_hash(root: Path) -> None:
+    loader = DummyLoader(path=root)
+    loader.prepare(verbose=False, incremental=True, hash_files=True)
+
+    target = root / "DummyLoader" / "b" / "01.txt"
+    stat = target.stat()
+    os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(DummyLoader, "_parse_file", None)
+        loader.prepare(verbose=False, incremental=True, hash_files=True)
+
+
+def test_load_columns_and_filters(root: Path) -> None:
+    loader = DummyLoader(path=root, required_columns=("id",))
+    loader.prepare(verbose=False)
+    full = loader.load(name="c")
+
+    projected = loader.load(name="c", columns=["duration"])
+    assert list(projected.columns) == ["id", "duration"]
+
+    filtered = loader.load(name="c", filters=pc.field("duration") < 3)
+    pd.testing.assert_frame_equal(
+        filtered, full[full["duration"] < 3].reset_index(drop=True)
+    )
+
+    both = loader.load(
+        name="c", columns=["ref"], filters=[("id", "in", {"00-0", "04-0"})]
+    )
+    assert both.to_dict(orient="list") == {
+        "id": ["00-0", "04-0"],
+        "ref": ["c 0 0", "c 4 0"],
+    }
+
+
+def test_load_arrow_backend(root: Path) -> None:
+    loader = DummyLoader(path=root)
+    loader.prepare(verbose=False)
+    frame = loader.load(name="b")
+    table = loader.load(name="b", backend="arrow", filters=pc.field("duration") < 4)
+
+    expected = frame[frame["duration"] < 4].reset_index(drop=True)
+    assert table.column("id").to_pylist() == expected["id"].tolist()
+    assert table.column("audio_path").to_pylist() == expected["audio_path"].tolist()
+    assert all(path.startswith("b/") for path in expected["audio_path"])
+    with pytest.raises(ValueError):
+        loader.load(name="b", backend="polars")  # type: ignore[call-overload]
+
+
+def test_arrow_cache(root: Path) -> None:
+    loader = DummyLoader(path=root)
+    loader.prepare(verbose=False, name="a")
+    parquet_path = root / "DummyLoader" / ".prepare" / "a.parquet"
+    cache_path = parquet_path.with_suffix(".arrow")
+    assert not cache_path.exists()
+    loader.load(name="a")
+    assert not cache_path.exists()
+
+    expected = loader.load(name="a", backend="arrow", cache=False)
+    cached = loader.load(name="a", backend="arrow")
+    assert cache_path.exists()
+    assert cached.equals(expected)
+    assert cached.schema.metadata == expected.schema.metadata
+    # 캐시에서 읽은 컬럼은 memory map된 버퍼를 그대로 사용한다.
+    gc.collect()
+    allocated = pa.total_allocated_bytes()
+    mapped = loader.load(name="a", backend="arrow", columns=["ref", "duration"])
+    assert pa.total_allocated_bytes() <= allocated
+    assert mapped.equals(expected.select(["ref", "duration"]))
+
+    filters = [("duration", ">", 2.0)]
+    assert loader.load(
+        name="a", backend="arrow", columns=["id"], filters=filters
+    ).equals(
+        loader.load(
+            name="a", backend="arrow", columns=["id"], filters=filters, cache=False
+        )
+    )
+
+    cache_path.unlink()
+    loader.load(name="a", backend="arrow")
+    assert cache_path.exists()
+
+    mtime = parquet_path.stat().st_mtime_ns
+    os.utime(cache_path, ns=(mtime - 10**9, mtime - 10**9))
+    loader.load(name="a", backend="arrow")
+    assert cache_path.stat().st_mtime_ns == mtime - 10**9
+
+    # 더 오래된 mtime을 가진 parquet으로 바꿔도(cp -p 등) 캐시를 다시 만든다.
+    replaced = pd.read_parquet(parquet_path).iloc[:2]
+    replaced.to_parquet(parquet_path)
+    os.utime(parquet_path, ns=(mtime - 10**10, mtime - 10**10))
+    assert loader.load(name="a", backend="arrow").num_rows == 2
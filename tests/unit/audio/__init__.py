@@ -0,0 +1 @@
+# tests/unit/audio/__init__.py
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import os
+import pickle
+import pytest
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+import soundfile as sf
+
+from pathlib import Path
+
+from dataset_loader.audio import AudioDiskCache
+from dataset_loader.librispeech import LibriSpeechDataset
+
+SR = 8000
+
+
+@pytest.fixture
+def source(tmp_path: Path) -> Path:
+    path = tmp_path / "audio.wav"
+    sf.write(path, np.linspace(-0.5, 0.5, SR, dtype=np.float32), SR)
+    return path
+
+
+def test_get_or_load(tmp_path: Path, source: Path) -> None:
+    cache = AudioDiskCache(tmp_path / "cache", max_bytes=1 << 20)
+    audio = np.linspace(-1.0, 1.0, 100, dtype=np.float32)
+    calls: list[int] = []
+
+    def load() -> npt.NDArray[np.float32]:
+        calls.append(1)
+        return audio
+
+    assert cache.get_or_load(source, SR, load) is audio
+    cached = cache.get_or_load(source, SR, load)
+    assert len(calls) == 1
+    assert isinstance(cached, np.memmap) and not cached.flags.writeable
+    np.testing.assert_array_equal(cached, audio)
+
+    cache.get_or_load(source, SR * 2, load)
+    assert len(calls) == 2
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    cache.get_or_load(source, SR, load)
+    assert len(calls) == 3
+
+    restored = pickle.loads(pickle.dumps(cache))
+    assert restored.get(restored.key(source, SR)) is not None
+    cache.clear()
+    assert cache.size() == 0
+
+
+def test_lru_eviction(tmp_path: Path) -> None:
+    audio = np.zeros(1000, dtype=np.float32)
+    cache = AudioDiskCache(tmp_path, max_bytes=int(3.5 * (audio.nbytes + 128)))
+    for key in ("a", "b", "c"):
+        cache.put(key, audio)
+    # a를 사용하면 가장 오래 사용하지 않은 b가 지워진다.
+    for key, offset in (("a", 3), ("b", 1), ("c", 2)):
+        os.utime(tmp_path / f"{key}.npy", ns=(offset * 10**9, offset * 10**9))
+    assert cache.get("a") is not None
+    cache.put("d", audio)
+
+    assert cache.get("b") is None
+    assert all(cache.get(key) is not None for key in ("a", "c", "d"))
+    assert cache.size() <= cache.max_bytes
+
+
+def test_eviction_to_low_water(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    audio = np.zeros(1000, dtype=np.float32)
+    cache = AudioDiskCache(tmp_path, max_bytes=20 * (audio.nbytes + 128))
+    entries = cache._entries
+    scans: list[int] = []
+
+    def counted() -> list[tuple[Path, os.stat_result]]:
+        scans.append(1)
+        return entries()
+
+    monkeypatch.setattr(cache, "_entries", counted)
+    for i in range(60):
+        cache.put(str(i), audio)
+    monkeypatch.undo()
+
+    # 넘칠 때마다 max_bytes의 90%(18개)까지 지우므로 디렉토리는 세 번의 put마다 한 번만 읽는다.
+    assert len(scans) <= 15
+    assert cache.size() <= cache.max_bytes
+    assert len(list(tmp_path.glob("*.npy"))) >= 18
+
+
+def test_int16(tmp_path: Path) -> None:
+    cache = AudioDiskCache(tmp_path, max_bytes=1 << 20, dtype="int16")
+    audio = np.linspace(-1.0, 1.0, 101, dtype=np.float32)
+    cache.put("a", audio)
+    cached = cache.get("a")
+    assert cached is not None and cached.dtype == np.float32
+    np.testing.assert_allclose(cached, audio, atol=1 / 32767)
+    assert (tmp_path / "a.npy").stat().st_size < audio.nbytes
+
+    with pytest.raises(ValueError):
+        AudioDiskCache(tmp_path, max_bytes=0)
+
+
+def test_dataset_uses_cache(
+    tmp_path: Path, source: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from dataset_loader.audio import load_audio
+
+    calls: list[str] = []
+
+    def counting(path: Path, **kwargs: object) -> object:
+        calls.append(str(path))
+        return load_audio(path, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(
+        "dataset_loader.librispeech.librispeech_dataset.load_audio", counting
+    )
+    parquet = pd.DataFrame({"id": ["0"], "ref": [""], "audio_path": [source.name]})
+    dataset = LibriSpeechDataset(
+        parquet=parquet,
+        sr=SR,
+        root=tmp_path,
+        audio_cache=AudioDiskCache(tmp_path / "cache", max_bytes=1 << 20),
+    )
+    first = dataset[0].audio
+    second = dataset.select([0])[0].audio
+    assert calls == [str(source)]
+    np.testing.assert_array_equal(first, second)
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import pickle
+import pytest
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+import soundfile as sf
+
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+from dataset_loader.audio import AudioMemoryCache
+from dataset_loader.librispeech import LibriSpeechDataset
+
+SR = 8000
+
+
+def test_get_or_load() -> None:
+    cache = AudioMemoryCache(1 << 20)
+    audio = np.zeros(100, dtype=np.float32)
+    calls: list[int] = []
+
+    def load() -> npt.NDArray[np.float32]:
+        calls.append(1)
+        return audio
+
+    assert cache.get_or_load("a", load) is audio
+    assert cache.get_or_load("a", load) is audio
+    assert len(calls) == 1 and not audio.flags.writeable
+    assert (cache.hits, cache.misses, cache.size) == (1, 1, audio.nbytes)
+
+    restored = pickle.loads(pickle.dumps(cache))
+    assert len(restored) == 0 and restored.max_bytes == cache.max_bytes
+    cache.clear()
+    assert (len(cache), cache.hits, cache.misses) == (0, 0, 0)
+
+    with pytest.raises(ValueError):
+        AudioMemoryCache(0)
+
+
+def test_lru_eviction() -> None:
+    audio = np.zeros(1000, dtype=np.float32)
+    cache = AudioMemoryCache(3 * audio.nbytes)
+    for key in ("a", "b", "c"):
+        cache.get_or_load(key, audio.copy)
+    # a를 사용하면 가장 오래 사용하지 않은 b가 지워진다.
+    cache.get_or_load("a", audio.copy)
+    cache.get_or_load("d", audio.copy)
+    assert cache.size <= cache.max_bytes
+
+    misses = cache.misses
+    for key in ("a", "c", "d"):
+        cache.get_or_load(key, audio.copy)
+    assert cache.misses == misses
+    cache.get_or_load("b", audio.copy)
+    assert cache.misses == misses + 1
+
+    cache.get_or_load("big", np.zeros(4000, dtype=np.float32).copy)
+    assert len(cache) == 3
+
+
+def test_thread_safe() -> None:
+    cache = AudioMemoryCache(64 * 400)
+
+    def load(key: int) -> npt.NDArray[np.float32]:
+        return cache.get_or_load(key % 100, lambda: np.full(100, key, np.float32))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(load, range(2000)))
+    assert all(int(audio[0]) % 100 == key % 100 for key, audio in enumerate(results))
+    assert cache.hits + cache.misses == 2000
+    assert cache.size <= cache.max_bytes
+
+
+def test_dataset_uses_cache(tmp_path: Path) -> None:
+    sf.write(tmp_path / "a.wav", np.zeros(SR, dtype=np.float32), SR)
+    parquet = pd.DataFrame({"id": ["0"], "ref": [""], "audio_path": ["a.wav"]})
+    cache = AudioMemoryCache(1 << 20)
+    dataset = LibriSpeechDataset(
+        parquet=parquet, sr=SR, root=tmp_path, memory_cache=cache
+    )
+
+    first = dataset[0].audio
+    assert dataset.select([0])[0].audio is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    view = dataset.select([0])
+    view.clean()
+    assert view.memory_cache is None
+    assert len(cache) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    dataset.clean()
+    assert len(cache) == 1
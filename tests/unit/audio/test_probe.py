@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import pytest
+import numpy as np
+import soundfile as sf
+
+from pathlib import Path
+from typing import Any
+
+from dataset_loader.audio import AudioInfo, probe_audio, probe_sph
+
+
+@pytest.mark.parametrize(
+    ("format", "subtype", "sr", "channels"),
+    [("FLAC", "PCM_16", 16000, 1), ("WAV", "PCM_16", 22050, 2), ("NIST", "PCM_16", 16000, 1)],
+)
+def test_probe_audio(
+    tmp_path: Path, format: str, subtype: str, sr: int, channels: int
+) -> None:
+    num_samples = 12345
+    path = tmp_path / f"audio.{format.lower()}"
+    sf.write(
+        path,
+        np.zeros((num_samples, channels), dtype=np.float32),
+        sr,
+        format=format,
+        subtype=subtype,
+    )
+
+    info = probe_audio(path)
+    assert info == AudioInfo(num_samples=num_samples, native_sr=sr, channels=channels)
+    assert info.duration == num_samples / sr
+    assert info.to_dict()["duration"] == info.duration
+
+
+def test_probe_audio_missing_file(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        probe_audio(tmp_path / "missing.flac")
+
+
+def test_probe_sph_reads_header_only(tmp_path: Path) -> None:
+    path = tmp_path / "audio.sph"
+    sf.write(path, np.zeros(1000, dtype=np.float32), 16000, format="NIST")
+    # 헤더 뒤의 샘플을 잘라도 헤더의 sample_count를 그대로 읽는다.
+    path.write_bytes(path.read_bytes()[:1024])
+
+    assert probe_sph(path) == AudioInfo(num_samples=1000, native_sr=16000, channels=1)
+
+    bad = tmp_path / "bad.sph"
+    bad.write_text("not a sphere file")
+    with pytest.raises(RuntimeError):
+        probe_sph(bad)
+
+
+@pytest.mark.parametrize(
+    "stream",
+    [
+        {"codec_type": "audio", "channels": 1, "duration": "1.0"},
+        {"codec_type": "audio", "sample_rate": "16000", "duration": "1.0"},
+        {"codec_type": "audio", "sample_rate": "16000", "channels": 1},
+        {"codec_type": "audio", "sample_rate": "N/A", "channels": 1, "duration": "1.0"},
+    ],
+)
+def test_probe_ffprobe_incomplete_stream(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, stream: dict[str, Any]
+) -> None:
+    ffmpeg = pytest.importorskip("ffmpeg")
+    monkeypatch.setattr(
+        ffmpeg, "probe", lambda *args, **kwargs: {"streams": [stream], "format": {}}
+    )
+    path = tmp_path / "audio.m4a"
+    path.write_bytes(bytes(64))
+
+    with pytest.raises(RuntimeError, match="Incomplete audio stream info"):
+        probe_audio(path)
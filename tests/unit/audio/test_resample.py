@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import pytest
+import librosa
+import numpy as np
+import pandas as pd
+import soundfile as sf
+
+from pathlib import Path
+
+from dataset_loader.audio import RESAMPLE_QUALITIES, ResampleQuality, resample
+from dataset_loader.librispeech import LibriSpeechDataset
+
+SR = 16_000
+
+
+@pytest.fixture
+def wav() -> np.ndarray:
+    t = np.arange(SR, dtype=np.float32) / SR
+    return (0.5 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+
+
+@pytest.mark.parametrize("quality", RESAMPLE_QUALITIES)
+def test_resample(wav: np.ndarray, quality: ResampleQuality) -> None:
+    assert np.shares_memory(resample(wav, SR, SR, quality=quality), wav)
+
+    resampled = resample(wav, SR, 8000, quality=quality)
+    assert resampled.dtype == np.float32 and len(resampled) == 8000
+    expected = librosa.resample(wav, orig_sr=SR, target_sr=8000)
+    np.testing.assert_allclose(resampled[100:-100], expected[100:-100], atol=0.05)
+
+    with pytest.raises(ValueError):
+        resample(wav, SR, 8000, quality="fast")  # type: ignore[arg-type]
+
+
+def test_dataset_resample_quality(tmp_path: Path, wav: np.ndarray) -> None:
+    sf.write(tmp_path / "a.flac", wav, SR)
+    parquet = pd.DataFrame({"id": ["0"], "ref": [""], "audio_path": ["a.flac"]})
+
+    default = LibriSpeechDataset(parquet=parquet, sr=8000, root=tmp_path)
+    expected, _ = librosa.load(tmp_path / "a.flac", sr=8000)
+    np.testing.assert_array_equal(default[0].audio, expected)
+
+    native = LibriSpeechDataset(parquet=parquet, sr=SR, root=tmp_path)
+    np.testing.assert_array_equal(native[0].audio, sf.read(tmp_path / "a.flac")[0])
+
+    polyphase = default.select([0])
+    polyphase.resample_quality = "polyphase"
+    assert len(polyphase[0].audio) == 8000
+    assert polyphase.args["resample_quality"] == "polyphase"
+    with pytest.raises(ValueError):
+        LibriSpeechDataset(parquet=parquet, sr=SR, resample_quality="fast")  # type: ignore[arg-type]
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import pytest
+import numpy as np
+import pandas as pd
+import soundfile as sf
+
+from pathlib import Path
+
+from dataset_loader.abstract import ASRSample
+from dataset_loader.audio import frame_audio, stream_audio
+from dataset_loader.librispeech import LibriSpeechDataset
+
+SR = 8000
+
+
+@pytest.fixture
+def wav() -> np.ndarray:
+    return np.random.default_rng(seed=0).uniform(-0.5, 0.5, 3 * SR).astype(np.float32)
+
+
+@pytest.fixture
+def source(tmp_path: Path, wav: np.ndarray) -> Path:
+    path = tmp_path / "audio.wav"
+    sf.write(path, wav, SR, subtype="FLOAT")
+    return path
+
+
+@pytest.mark.parametrize(
+    ("length", "window", "hop", "starts"),
+    [
+        (10, 4, None, [0, 4, 8]),
+        (10, 4, 2, [0, 2, 4, 6]),
+        (9, 4, 2, [0, 2, 4, 6]),
+        (3, 4, 2, [0]),
+        (0, 4, 2, []),
+    ],
+)
+def test_frame_audio(
+    length: int, window: int, hop: int | None, starts: list[int]
+) -> None:
+    audio = np.arange(length, dtype=np.float32)
+    blocks = np.array_split(audio, 4)
+    windows = list(frame_audio(blocks, window, hop))
+    assert [int(w[0]) for w in windows] == starts
+    for start, w in zip(starts, windows):
+        np.testing.assert_array_equal(w, audio[start : start + window])
+
+    with pytest.raises(ValueError):
+        next(frame_audio([audio], window, window + 1))
+
+
+def test_stream_audio(source: Path, wav: np.ndarray) -> None:
+    windows = list(stream_audio(source, sr=SR, window=SR, hop=SR // 2))
+    assert len(windows) == 5
+    assert max(len(w) for w in windows) == SR
+    np.testing.assert_array_equal(windows[3], wav[3 * SR // 2 : 5 * SR // 2])
+
+    segment = list(stream_audio(source, sr=SR, window=SR, start=0.5, end=2.0))
+    np.testing.assert_array_equal(np.concatenate(segment), wav[SR // 2 : 2 * SR])
+
+    resampled = np.concatenate(list(stream_audio(source, sr=SR // 2, window=1000)))
+    assert abs(len(resampled) - len(wav) // 2) <= 1
+
+
+def test_sample_stream(tmp_path: Path, source: Path, wav: np.ndarray) -> None:
+    parquet = pd.DataFrame({"id": ["0"], "ref": [""], "audio_path": [source.name]})
+    sample = LibriSpeechDataset(parquet=parquet, sr=SR, root=tmp_path)[0]
+    streamed = np.concatenate(list(sample.stream(SR)))
+    np.testing.assert_array_equal(streamed, sample.audio)
+
+    loaded = sample.loaded_audio_sample()
+    assert "stream_audio_func" not in loaded.data
+    assert [len(w) for w in loaded.stream(SR, SR // 2)] == [SR] * 5
+
+    in_memory = ASRSample[str, None].create(id="0", audio=wav, ref="")
+    np.testing.assert_array_equal(next(in_memory.stream(100)), wav[:100])
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import pytest
+import numpy as np
+
+from dataset_loader.base import Sample, ConcatDataset
+
+from tests.unit.base.dummy_dataset import DummyDataset
+from tests.unit.base.mixin_dataset_test import MixinDatasetTest
+
+DATASET_LENGTHS = (7, 0, 13, 1, 29)
+
+
+class TestConcatDataset(MixinDatasetTest):
+    @pytest.fixture
+    def samples(self) -> list[Sample]:
+        return [
+            Sample(id=str(i), data={"value": i}) for i in range(sum(DATASET_LENGTHS))
+        ]
+
+    @pytest.fixture
+    def dataset(self, samples: list[Sample]) -> ConcatDataset[DummyDataset, Sample]:
+        datasets: list[DummyDataset] = []
+        start = 0
+        for length in DATASET_LENGTHS:
+            datasets.append(DummyDataset(samples=samples[start : start + length]))
+            start += length
+        return ConcatDataset(datasets=datasets)
+
+    def test_offsets(self, dataset: ConcatDataset[DummyDataset, Sample]) -> None:
+        assert dataset.offsets.tolist() == [0, 7, 7, 20, 21, 50]
+        assert len(dataset) == sum(DATASET_LENGTHS)
+
+    def test_get(
+        self, dataset: ConcatDataset[DummyDataset, Sample], samples: list[Sample]
+    ) -> None:
+        for i, sample in enumerate(samples):
+            assert dataset.get(i) == sample
+        assert dataset.get(-1) == samples[-1]
+        with pytest.raises(IndexError):
+            dataset.get(len(samples))
+        with pytest.raises(IndexError):
+            dataset.get(-len(samples) - 1)
+
+    def test_select_keeps_order(
+        self, dataset: ConcatDataset[DummyDataset, Sample], samples: list[Sample]
+    ) -> None:
+        indices = np.random.default_rng(seed=0).permutation(len(samples))
+        selected = dataset.select(indices)
+        assert [sample for sample in selected] == [samples[i] for i in indices]
+
+        selected = dataset.select([-1, 3, 3, 20])
+        assert [sample.id for sample in selected] == ["49", "3", "3", "20"]
+
+        assert len(dataset.select([])) == 0
+        with pytest.raises(IndexError):
+            dataset.select([len(samples)])
+
+    def test_select_is_index_view(
+        self, dataset: ConcatDataset[DummyDataset, Sample], samples: list[Sample]
+    ) -> None:
+        rng = np.random.default_rng(seed=0)
+        first = rng.permutation(len(samples))
+        second = rng.permutation(len(samples))[:20]
+
+        view = dataset.select(first).select(second)
+        assert view.dataset == dataset.dataset
+        assert view.indices is not None
+        assert view.indices.tolist() == first[second].tolist()
+        assert [sample for sample in view] == [samples[i] for i in first[second]]
+
+        materialized = view.materialize()
+        assert len(materialized.dataset) <= len(dataset.dataset)
+        assert [sample for sample in materialized] == [sample for sample in view]
+
+        ordered = dataset.select(sorted(first[second].tolist())).materialize()
+        assert ordered.indices is None
+        assert [sample.id for sample in ordered] == [
+            str(i) for i in sorted(first[second].tolist())
+        ]
+
+    def test_clean_view_keeps_children(
+        self, dataset: ConcatDataset[DummyDataset, Sample], samples: list[Sample]
+    ) -> None:
+        view = dataset.select([30, 2, 11])
+        assert dataset.owns_datasets
+        assert not view.owns_datasets
+        assert not (view + dataset).owns_datasets
+
+        view.clean()
+        assert view.is_cleaned
+        assert not any(ds.is_cleaned for ds in dataset.dataset)
+        assert [sample for sample in dataset] == samples
+
+        materialized = dataset.select([30, 2, 11]).materialize()
+        assert materialized.owns_datasets
+        materialized.clean()
+        assert not any(ds.is_cleaned for ds in dataset.dataset)
+
+    def test_concat_views(
+        self, dataset: ConcatDataset[DummyDataset, Sample], samples: list[Sample]
+    ) -> None:
+        head = dataset.select([30, 2, 11])
+        tail = dataset.dataset[0]
+        concat = head + tail + head
+        assert [sample.id for sample in concat] == (
+            ["30", "2", "11"] + [s.id for s in tail] + ["30", "2", "11"]
+        )
+        concat = tail + head
+        assert [sample.id for sample in concat] == (
+            [s.id for s in tail] + ["30", "2", "11"]
+        )
+
+    def test_view_to_dict_and_from_dict(
+        self, dataset: ConcatDataset[DummyDataset, Sample], samples: list[Sample]
+    ) -> None:
+        view = dataset.select([40, 0, 25])
+        restored: ConcatDataset[DummyDataset, Sample] = ConcatDataset.from_dict(
+            view.to_dict()
+        )
+        assert [sample for sample in restored] == [samples[i] for i in (40, 0, 25)]
+
+    def test_sample_with_rng(
+        self, dataset: ConcatDataset[DummyDataset, Sample], samples: list[Sample]
+    ) -> None:
+        sampled = dataset.sample(30, start=10, rng=np.random.default_rng(seed=0))
+        ids = [int(sample.id) for sample in sampled]
+        assert len(set(ids)) == 30
+        assert all(10 <= i < len(samples) for i in ids)
+
+        again = dataset.sample(30, start=10, rng=np.random.default_rng(seed=0))
+        assert [sample.id for sample in again] == [sample.id for sample in sampled]
+
+    def test_weighted_sample(
+        self, dataset: ConcatDataset[DummyDataset, Sample]
+    ) -> None:
+        rng = np.random.default_rng(seed=0)
+        sampled = dataset.weighted_sample(10, [0.7, 0.0, 0.0, 0.0, 0.3], rng=rng)
+        ids = [int(sample.id) for sample in sampled]
+        assert len(set(ids)) == 10
+        assert sum(i < 7 for i in ids) == 7
+        assert sum(i >= 21 for i in ids) == 3
+
+        view = dataset.select(range(0, 50, 2))
+        sampled = view.weighted_sample(4, [1, 0, 1, 1, 1], rng=rng)
+        assert all(int(sample.id) % 2 == 0 for sample in sampled)
+
+        with pytest.raises(ValueError):
+            dataset.weighted_sample(10, [1.0, 0.0, 0.0, 0.0, 0.0], rng=rng)
+        with pytest.raises(ValueError):
+            dataset.weighted_sample(10, [1.0, 1.0], rng=rng)
+
+    def test_clean_invalidates_offsets(
+        self, dataset: ConcatDataset[DummyDataset, Sample]
+    ) -> None:
+        assert len(dataset) == sum(DATASET_LENGTHS)
+        dataset.clean()
+        assert dataset.offsets.tolist() == [0]
+
+
+__all__ = ["TestConcatDataset"]
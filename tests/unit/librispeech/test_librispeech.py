@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import pytest
 
+from pathlib import Path
+
 from dataset_loader.base import Sample
 from dataset_loader.abstract import ASRSample
 from dataset_loader.librispeech import LibriSpeech, LibriSpeechDataset
@@ -52,4 +54,20 @@ class TestLibriSpeech(MixinASRDatasetTest[str, None], MixinDatasetTest):
         return [sample for sample in asr_dataset]
 
 
+def test_source_files_include_audio(tmp_path: Path) -> None:
+    chapter = tmp_path / "test-clean" / "19" / "198"
+    chapter.mkdir(parents=True)
+    transcript = chapter / "19-198.trans.txt"
+    transcript.write_text("19-198-0001 A\n19-198-0000 B\n", encoding="utf-8")
+    for utterance in ("19-198-0001", "19-198-0000"):
+        (chapter / f"{utterance}.flac").write_bytes(b"")
+
+    loader = LibriSpeech(path=tmp_path)
+    assert loader._source_files(transcript, name="test-clean") == [
+        transcript,
+        chapter / "19-198-0000.flac",
+        chapter / "19-198-0001.flac",
+    ]
+
+
 __all__ = ["TestLibriSpeech"]
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import json
+import pytest
+import hashlib
+import librosa
+import numpy as np
+import soundfile as sf
+
+from pathlib import Path
+
+from dataset_loader.tedlium import algorithm
+from dataset_loader.tedlium.algorithm import (
+    get_duration,
+    get_file_hash,
+    verify_file_hashes,
+)
+
+
+@pytest.mark.parametrize("sr", [8000, 16000, 22050, 44100])
+@pytest.mark.parametrize("num_samples", [1, 16000, 123457])
+def test_get_duration_matches_decoding(
+    tmp_path: Path, sr: int, num_samples: int
+) -> None:
+    sph_file = tmp_path / "talk.sph"
+    audio = np.random.default_rng(seed=0).standard_normal(num_samples) * 0.1
+    sf.write(sph_file, audio.astype(np.float32), sr, format="NIST", subtype="PCM_16")
+
+    wav, wav_sr = librosa.load(sph_file)
+    assert get_duration(sph_file) == librosa.get_duration(y=wav, sr=wav_sr)
+
+
+def test_get_file_hash_streams_in_chunks(tmp_path: Path) -> None:
+    file = tmp_path / "data.bin"
+    data = np.random.default_rng(seed=0).bytes(10_000)
+    file.write_bytes(data)
+
+    expected = hashlib.md5(data).hexdigest()
+    assert get_file_hash(file) == expected
+    assert get_file_hash(file, chunk_size=7) == expected
+
+
+def test_verify_file_hashes_uses_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    files = {}
+    for i in range(4):
+        file = tmp_path / f"{i}.sph"
+        file.write_bytes(bytes([i]) * 100)
+        files[file] = hashlib.md5(file.read_bytes()).hexdigest()
+    cache_file = tmp_path / ".verified_md5.json"
+
+    verify_file_hashes(files, cache_file=cache_file, num_workers=2)
+    assert set(json.loads(cache_file.read_text())) == {f.name for f in files}
+
+    hashed: list[Path] = []
+
+    def counting_hash(file: Path) -> str:
+        hashed.append(file)
+        return hashlib.md5(file.read_bytes()).hexdigest()
+
+    monkeypatch.setattr(algorithm, "get_file_hash", counting_hash)
+    verify_file_hashes(files, cache_file=cache_file)
+    assert hashed == []
+
+    changed = tmp_path / "2.sph"
+    changed.write_bytes(b"changed")
+    with pytest.raises(ValueError):
+        verify_file_hashes(files, cache_file=cache_file)
+    assert hashed == [changed]
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import pytest
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import soundfile as sf
+
+from pathlib import Path
+from typing import Any
+
+from dataset_loader.base import Sample
+from dataset_loader.audio import load_segment
+from dataset_loader.tedlium import TedliumDataset, TedliumUtteranceDataset
+
+from tests.unit.base import MixinDatasetTest
+
+SR = 8000
+NUM_TALKS = 3
+IGNORE = "ignore_time_segment_in_scoring"
+
+
+def _stm(talk: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "start": float(i),
+            "end": i + 0.5 + 0.1 * talk,
+            "label": "<o,f0,male>",
+            "ref": IGNORE if i == 1 else f"talk {talk} segment {i}",
+            "speaker_id": f"speaker{talk}",
+        }
+        for i in range(4)
+    ]
+
+
+@pytest.fixture
+def parquet(tmp_path: Path) -> pd.DataFrame:
+    rng = np.random.default_rng(seed=0)
+    for talk in range(NUM_TALKS):
+        wav = rng.uniform(-0.5, 0.5, 5 * SR).astype(np.float32)
+        sf.write(
+            tmp_path / f"talk{talk}.sph", wav, SR, format="NIST", subtype="PCM_16"
+        )
+    return pd.DataFrame(
+        {
+            "id": [f"talk{talk}" for talk in range(NUM_TALKS)],
+            "audio_path": [f"talk{talk}.sph" for talk in range(NUM_TALKS)],
+            "stm": [_stm(talk) for talk in range(NUM_TALKS)],
+            "text": ["" for _ in range(NUM_TALKS)],
+        }
+    )
+
+
+@pytest.fixture
+def talks(parquet: pd.DataFrame, tmp_path: Path) -> TedliumDataset:
+    return TedliumDataset(
+        parquet=pa.Table.from_pandas(parquet, preserve_index=False),
+        sr=SR,
+        ignore_set=[IGNORE],
+        root=tmp_path,
+    )
+
+
+class TestTedliumUtteranceDataset(MixinDatasetTest):
+    @pytest.fixture
+    def dataset(self, talks: TedliumDataset) -> TedliumUtteranceDataset:
+        return talks.segments()
+
+    @pytest.fixture
+    def samples(self, dataset: TedliumUtteranceDataset) -> list[Sample]:
+        return [sample for sample in dataset]
+
+
+def test_segments(
+    talks: TedliumDataset, parquet: pd.DataFrame, tmp_path: Path
+) -> None:
+    segments = talks.segments()
+    assert len(segments) == NUM_TALKS * 3
+    assert len(talks.segments(drop_ignored=False)) == NUM_TALKS * 4
+    assert all(sample.ref for sample in segments)
+    np.testing.assert_allclose(
+        segments.column("duration"), [0.5 + 0.1 * (i // 3) for i in range(9)]
+    )
+
+    pandas = TedliumDataset(
+        parquet=parquet, sr=SR, ignore_set=[IGNORE], root=tmp_path
+    ).segments()
+    assert not pandas.is_arrow
+    assert [s.id for s in pandas] == [s.id for s in segments]
+
+    sample = segments[4]
+    assert (sample.talk_id, sample.start, sample.end) == ("talk1", 2.0, 2.6)
+    full, _ = sf.read(tmp_path / "talk1.sph", dtype="float32")
+    np.testing.assert_array_equal(sample.audio, full[2 * SR : int(2.6 * SR)])
+    assert sample.diarization[0]["end"] == pytest.approx(0.6)
+
+
+def test_load_segment(tmp_path: Path) -> None:
+    wav = np.linspace(-0.5, 0.5, SR, dtype=np.float32)
+    path = tmp_path / "a.wav"
+    sf.write(path, wav, SR, subtype="FLOAT")
+
+    np.testing.assert_array_equal(load_segment(path, 0.25, 0.5), wav[2000:4000])
+    assert len(load_segment(path, 0.5)) == SR // 2
+    assert len(load_segment(path, 0.5, 2.0, sr=SR // 2)) == SR // 4
+    with pytest.raises(ValueError):
+        load_segment(path, 0.5, 0.25)
@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+import os
+import time
+import asyncio
+import pytest
+import numpy as np
+
 from typing import TypeVar, Generic
+from concurrent.futures import ThreadPoolExecutor
 
 from dataset_loader.abstract import ASRSample
-from dataset_loader.wrapper.asr import ASRDataset, ASRConcatDataset
+from dataset_loader.wrapper import LoaderPool, SharedMemoryRing
+from dataset_loader.wrapper.asr import ASRBatch, ASRDataset, ASRConcatDataset
 
 from tests.unit.protocol import MixinDatasetProtocolTest
 
@@ -50,6 +58,152 @@ class MixinASRDatasetTest(MixinDatasetProtocolTest, Generic[RefT, DiarizationT])
             if idx >= THREAD_ITER_TEST_SIZE - 1:
                 break
 
+    @pytest.mark.parametrize("reorder_buffer", [None, 2])
+    def test_asr_thread_iter_unordered(
+        self, asr_dataset: ASRDataset[RefT, DiarizationT], reorder_buffer: int | None
+    ) -> None:
+        prefetch = 4
+        ids: list[str] = []
+        for sample in asr_dataset.thread_iter(
+            num_workers=2, prefetch=prefetch, ordered=False, reorder_buffer=reorder_buffer
+        ):
+            assert sample.audio is not None
+            ids.append(sample.id)
+
+            if len(ids) >= THREAD_ITER_TEST_SIZE:
+                break
+
+        window = THREAD_ITER_TEST_SIZE + prefetch + (reorder_buffer or 0)
+        expected = {asr_dataset[idx].id for idx in range(min(window, len(asr_dataset)))}
+        assert len(set(ids)) == len(ids)
+        assert set(ids) <= expected
+
+    def test_asr_thread_iter_pool(
+        self, asr_dataset: ASRDataset[RefT, DiarizationT]
+    ) -> None:
+        size = min(len(asr_dataset), THREAD_ITER_TEST_SIZE)
+        with LoaderPool(2, name="asr_loader") as pool:
+            for start, stop in ((0, size // 2), (size // 2, size)):
+                shard = asr_dataset[start:stop]
+                ids = [sample.id for sample in shard.thread_iter(prefetch=4, pool=pool)]
+                assert ids == [sample.id for sample in shard]
+
+            loader = asr_dataset.thread_iter(prefetch=4, pool=pool)
+            assert next(loader).audio is not None
+            loader.close()
+            assert not pool.is_shutdown
+            assert pool.submit(len, "pool").result() == 4
+        assert pool.is_shutdown
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            shard = asr_dataset[:size]
+            ids = [sample.id for sample in shard.thread_iter(pool=executor)]
+            assert ids == [sample.id for sample in shard]
+        with pytest.raises(ValueError):
+            next(asr_dataset.thread_iter(pool=object()))
+
+    @pytest.mark.parametrize("max_length", [None, 16000])
+    def test_asr_batch_iter(
+        self, asr_dataset: ASRDataset[RefT, DiarizationT], max_length: int | None
+    ) -> None:
+        batch_size = 4
+        for step, batch in enumerate(
+            asr_dataset.batch_iter(
+                batch_size, num_workers=2, prefetch=2, max_length=max_length
+            )
+        ):
+            assert isinstance(batch, ASRBatch)
+            assert batch.audio.dtype == np.float32
+            assert batch.lengths.dtype == np.int32
+            assert batch.audio.shape[0] == len(batch) == len(batch.lengths)
+            if max_length is not None:
+                assert batch.audio.shape[1] == max_length
+            else:
+                assert batch.audio.shape[1] == batch.lengths.max()
+
+            for row, id in enumerate(batch.ids):
+                sample = asr_dataset[step * batch_size + row]
+                n = batch.lengths[row]
+                assert id == sample.id
+                assert n == min(len(sample.audio), batch.audio.shape[1])
+                assert np.array_equal(batch.audio[row, :n], sample.audio[:n])
+                assert not batch.audio[row, n:].any()
+
+            if (step + 1) * batch_size >= THREAD_ITER_TEST_SIZE:
+                break
+
+    def test_asr_process_iter(
+        self, asr_dataset: ASRDataset[RefT, DiarizationT]
+    ) -> None:
+        for idx, sample in enumerate(
+            asr_dataset.process_iter(num_workers=2, prefetch=4)
+        ):
+            assert isinstance(sample, ASRSample)
+            assert sample.id == asr_dataset[idx].id
+            assert sample.audio is not None
+
+            if idx >= THREAD_ITER_TEST_SIZE - 1:
+                break
+
+    def test_asr_process_iter_ring(
+        self, asr_dataset: ASRDataset[RefT, DiarizationT]
+    ) -> None:
+        with SharedMemoryRing(num_slots=6, slot_size=16000 * 4 * 40) as ring:
+            for idx, sample in enumerate(
+                asr_dataset.process_iter(num_workers=2, prefetch=4, ring=ring)
+            ):
+                assert sample.id == asr_dataset[idx].id
+                assert sample.audio is not None
+                assert sample.audio.shape == asr_dataset[idx].audio.shape
+
+                if idx >= THREAD_ITER_TEST_SIZE - 1:
+                    break
+            del sample
+            assert ring.free_slots == ring.num_slots
+
+    def test_asr_process_iter_ring_close(
+        self, asr_dataset: ASRDataset[RefT, DiarizationT]
+    ) -> None:
+        with SharedMemoryRing(num_slots=6, slot_size=16000 * 4 * 40) as ring:
+            for _ in range(3):
+                iterator = asr_dataset.process_iter(num_workers=2, prefetch=4, ring=ring)
+                next(iterator)
+                iterator.close()
+
+            deadline = time.monotonic() + 30
+            while ring.free_slots < ring.num_slots and time.monotonic() < deadline:
+                time.sleep(0.05)
+            assert ring.free_slots == ring.num_slots
+
+    @pytest.mark.skipif(not os.path.isdir("/dev/shm"), reason="requires /dev/shm")
+    def test_asr_process_iter_close_unlinks(
+        self, asr_dataset: ASRDataset[RefT, DiarizationT]
+    ) -> None:
+        before = set(os.listdir("/dev/shm"))
+        iterator = asr_dataset.process_iter(num_workers=4, prefetch=8)
+        next(iterator)
+        iterator.close()
+
+        deadline = time.monotonic() + 30
+        while set(os.listdir("/dev/shm")) - before and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert not set(os.listdir("/dev/shm")) - before
+
+    def test_asr_aiter(self, asr_dataset: ASRDataset[RefT, DiarizationT]) -> None:
+        async def consume() -> list[str]:
+            ids: list[str] = []
+            async for sample in asr_dataset.aiter(concurrency=2, prefetch=4):
+                assert isinstance(sample, ASRSample)
+                assert sample.audio is not None
+                ids.append(sample.id)
+
+                if len(ids) >= THREAD_ITER_TEST_SIZE:
+                    break
+            return ids
+
+        ids = asyncio.run(consume())
+        assert ids == [asr_dataset[idx].id for idx in range(len(ids))]
+
     def test_asr__len__(
         self,
         asr_dataset: ASRDataset[RefT, DiarizationT],
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import pytest
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+import soundfile as sf
+
+from pathlib import Path
+from typing import Any
+
+from dataset_loader.abstract import ASRSample
+from dataset_loader.librispeech.librispeech_dataset import LibriSpeechDataset
+from dataset_loader.wrapper.asr import ASRDataset, BucketBatchSampler
+from dataset_loader.wrapper.asr import asr_dataset_mixin
+
+SR = 100
+
+
+def wav_dataset(
+    root: Path, frames: list[int], durations: list[float | None]
+) -> ASRDataset[str, None]:
+    for i, n in enumerate(frames):
+        sf.write(root / f"{i}.wav", np.full(n, (i + 1) / 10, dtype=np.float32), SR)
+    parquet = pd.DataFrame(
+        {
+            "id": [str(i) for i in range(len(frames))],
+            "ref": ["" for _ in frames],
+            "audio_path": [f"{i}.wav" for i in range(len(frames))],
+            "duration": durations,
+        }
+    )
+    return ASRDataset(dataset=LibriSpeechDataset(parquet=parquet, sr=SR, root=root))
+
+
+def test_batch_iter_with_sampler(tmp_path: Path) -> None:
+    frames = [30, 150, 60, 120, 90, 40, 200, 70]
+    dataset = wav_dataset(tmp_path, frames, [n / SR for n in frames])
+    sampler = BucketBatchSampler(
+        dataset, max_frames=300, num_buckets=2, rng=np.random.default_rng(seed=0)
+    )
+    expected = sampler.batches()
+    sampler = BucketBatchSampler(
+        dataset, max_frames=300, num_buckets=2, rng=np.random.default_rng(seed=0)
+    )
+
+    batches = list(dataset.batch_iter(batches=sampler, num_workers=2))
+    assert [[int(id) for id in batch.ids] for batch in batches] == expected
+    assert sorted(int(id) for batch in batches for id in batch.ids) == list(
+        range(len(frames))
+    )
+    for batch in batches:
+        lengths = [frames[int(id)] for id in batch.ids]
+        assert batch.lengths.tolist() == lengths
+        assert batch.audio.shape == (len(batch), max(lengths))
+        assert len(batch) == 1 or batch.audio.size <= 300
+        for row, n in enumerate(lengths):
+            assert not batch.audio[row, n:].any()
+
+    with pytest.raises(ValueError):
+        next(dataset.batch_iter(4, batches=sampler))
+    with pytest.raises(ValueError):
+        next(dataset.batch_iter())
+
+
+@pytest.mark.parametrize(
+    "durations, written",
+    [
+        ([0.5, 1.2, 0.8, 2.0], [True, True, True, True]),
+        ([0.5, 1.5, 0.8, 2.5], [True, True, True, True]),
+        ([0.5, 1.1, 0.8, 1.5], [True, False, True, False]),
+        ([0.5, None, 0.8, 2.0], [False, False, False, True]),
+    ],
+)
+def test_batch_iter_buffer_from_durations(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    durations: list[float | None],
+    written: list[bool],
+) -> None:
+    frames = [50, 120, 80, 200]
+    dataset = wav_dataset(tmp_path, frames, durations)
+    load_row = asr_dataset_mixin._load_row
+    rows: dict[int, bool] = {}
+
+    def spy(
+        sample: ASRSample[Any, Any],
+        buffer: npt.NDArray[np.float32] | None,
+        row: int,
+        truncate: bool,
+    ) -> tuple[int, npt.NDArray[np.float32] | None]:
+        n, audio = load_row(sample, buffer, row, truncate)
+        rows[int(sample.id)] = audio is None
+        return n, audio
+
+    monkeypatch.setattr(asr_dataset_mixin, "_load_row", spy)
+    batches = list(dataset.batch_iter(batches=[[0, 1, 2], [3]], num_workers=2))
+
+    assert [rows[i] for i in range(len(frames))] == written
+    assert [batch.audio.shape for batch in batches] == [(3, 120), (1, 200)]
+    for batch in batches:
+        for row, id in enumerate(batch.ids):
+            n = frames[int(id)]
+            assert batch.lengths[row] == n
+            assert np.allclose(batch.audio[row, :n], (int(id) + 1) / 10, atol=1e-3)
+            assert not batch.audio[row, n:].any()
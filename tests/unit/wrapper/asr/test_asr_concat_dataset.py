@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from dataset_loader.librispeech.librispeech_dataset import LibriSpeechDataset
+from dataset_loader.wrapper.asr import ASRDataset
+
+SR = 16000
+
+
+def asr_dataset(size: int) -> ASRDataset[str, None]:
+    parquet = pd.DataFrame(
+        {
+            "id": [str(i) for i in range(size)],
+            "ref": ["" for _ in range(size)],
+            "audio_path": ["" for _ in range(size)],
+        }
+    )
+    return ASRDataset(dataset=LibriSpeechDataset(parquet=parquet, sr=SR))
+
+
+def test_view_sr_does_not_change_source() -> None:
+    a, b = asr_dataset(5), asr_dataset(5)
+    concat = a.concat(b)
+    view = concat[[0, 7, 3]]
+
+    view.sr = 8000
+    assert view.sr == 8000
+    assert [sample.id for sample in view] == ["0", "2", "3"]
+    assert (concat.sr, a.sr, b.sr) == (SR, SR, SR)
+
+    view.clean()
+    assert not (concat.is_cleaned or a.is_cleaned or b.is_cleaned)
+    assert len(concat) == 10
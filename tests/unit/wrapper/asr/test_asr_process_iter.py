@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import os
+import time
+import pytest
+import numpy as np
+
+from pathlib import Path
+from typing import Callable
+
+from dataset_loader.wrapper import SharedMemoryRing
+from dataset_loader.wrapper.asr import ASRDataset
+
+from tests.unit.wrapper.asr.test_asr_batch_iter import SR, wav_dataset
+
+FRAMES = [30, 150, 60, 120, 90, 40, 200, 70, 110, 50, 80, 130]
+SLOT_SIZE = max(FRAMES) * 4
+
+
+@pytest.fixture
+def dataset(tmp_path: Path) -> ASRDataset[str, None]:
+    return wav_dataset(tmp_path, FRAMES, [n / SR for n in FRAMES])
+
+
+def wait_for(condition: Callable[[], bool], timeout: float = 30) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    return condition()
+
+
+def test_process_iter(dataset: ASRDataset[str, None]) -> None:
+    samples = list(dataset.process_iter(num_workers=2, prefetch=4))
+
+    assert [sample.id for sample in samples] == [sample.id for sample in dataset]
+    for idx, sample in enumerate(samples):
+        assert sample.audio is not None
+        assert np.array_equal(sample.audio, dataset[idx].audio)
+
+
+def test_process_iter_ring(dataset: ASRDataset[str, None]) -> None:
+    with SharedMemoryRing(num_slots=6, slot_size=SLOT_SIZE) as ring:
+        for idx, sample in enumerate(
+            dataset.process_iter(num_workers=2, prefetch=4, ring=ring)
+        ):
+            assert sample.id == dataset[idx].id
+            assert sample.audio is not None
+            assert np.array_equal(sample.audio, dataset[idx].audio)
+        del sample
+        assert ring.free_slots == ring.num_slots
+
+
+def test_process_iter_ring_close(dataset: ASRDataset[str, None]) -> None:
+    with SharedMemoryRing(num_slots=6, slot_size=SLOT_SIZE) as ring:
+        for _ in range(3):
+            iterator = dataset.process_iter(num_workers=2, prefetch=4, ring=ring)
+            next(iterator)
+            iterator.close()
+
+        assert wait_for(lambda: ring.free_slots == ring.num_slots)
+
+
+def test_process_iter_ring_worker_error(
+    tmp_path: Path, dataset: ASRDataset[str, None]
+) -> None:
+    (tmp_path / "3.wav").unlink()
+    with SharedMemoryRing(num_slots=6, slot_size=SLOT_SIZE) as ring:
+        ids: list[str] = []
+        with pytest.raises(FileNotFoundError):
+            for sample in dataset.process_iter(num_workers=2, prefetch=4, ring=ring):
+                ids.append(sample.id)
+
+        assert ids == ["0", "1", "2"]
+        assert wait_for(lambda: ring.free_slots == ring.num_slots)
+
+
+@pytest.mark.skipif(not os.path.isdir("/dev/shm"), reason="requires /dev/shm")
+def test_process_iter_close_unlinks(dataset: ASRDataset[str, None]) -> None:
+    before = set(os.listdir("/dev/shm"))
+    iterator = dataset.process_iter(num_workers=4, prefetch=8)
+    next(iterator)
+    iterator.close()
+
+    assert wait_for(lambda: not set(os.listdir("/dev/shm")) - before)
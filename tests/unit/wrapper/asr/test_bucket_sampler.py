@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from dataset_loader.librispeech.librispeech_dataset import LibriSpeechDataset
+from dataset_loader.wrapper.asr import ASRDataset, BucketBatchSampler
+
+SR = 100
+MAX_FRAMES = 2000
+
+
+@pytest.fixture
+def durations() -> list[float]:
+    durations: list[float] = (
+        np.random.default_rng(seed=0).uniform(1.0, 35.0, size=200).tolist()
+    )
+    return durations
+
+
+@pytest.fixture
+def asr_dataset(durations: list[float]) -> ASRDataset[str, None]:
+    parquet = pd.DataFrame(
+        {
+            "id": [str(i) for i in range(len(durations))],
+            "ref": ["" for _ in durations],
+            "audio_path": ["" for _ in durations],
+            "duration": durations,
+        }
+    )
+    return ASRDataset(dataset=LibriSpeechDataset(parquet=parquet, sr=SR))
+
+
+def test_durations(asr_dataset: ASRDataset[str, None], durations: list[float]) -> None:
+    assert asr_dataset.durations.tolist() == durations
+    assert asr_dataset.durations is asr_dataset.durations
+
+    concat = asr_dataset.concat(asr_dataset[:10])
+    assert concat.durations.tolist() == durations + durations[:10]
+    assert concat[[205, 3]].durations.tolist() == [durations[5], durations[3]]
+
+
+def test_batches_fit_budget(asr_dataset: ASRDataset[str, None]) -> None:
+    sampler = BucketBatchSampler(
+        asr_dataset, max_frames=MAX_FRAMES, rng=np.random.default_rng(seed=0)
+    )
+    batches = sampler.batches()
+    assert sorted(i for batch in batches for i in batch) == list(range(len(asr_dataset)))
+    for batch in batches:
+        frames = sampler.frames[batch]
+        assert len(batch) == 1 or frames.max() * len(batch) <= MAX_FRAMES
+
+
+def test_shuffle_is_reproducible(asr_dataset: ASRDataset[str, None]) -> None:
+    def make() -> BucketBatchSampler:
+        return BucketBatchSampler(
+            asr_dataset, max_frames=MAX_FRAMES, rng=np.random.default_rng(seed=1)
+        )
+
+    first, second = make(), make()
+    assert list(first) == list(second)
+    assert list(first) != list(make())
+
+    ordered = BucketBatchSampler(asr_dataset, max_frames=MAX_FRAMES, shuffle=False)
+    assert list(ordered) == list(ordered)
+
+
+def test_missing_durations() -> None:
+    durations = [1.0, None, 2.0, float("nan"), 3.0]
+    parquet = pd.DataFrame(
+        {
+            "id": [str(i) for i in range(len(durations))],
+            "ref": ["" for _ in durations],
+            "audio_path": ["" for _ in durations],
+            "duration": durations,
+        }
+    )
+    dataset = ASRDataset(dataset=LibriSpeechDataset(parquet=parquet, sr=SR))
+    sampler = BucketBatchSampler(
+        dataset, max_frames=MAX_FRAMES, num_buckets=1, shuffle=False
+    )
+
+    assert sampler.frames.tolist() == [100, -1, 200, -1, 300]
+    assert sampler.batches() == [[0, 2, 4], [1], [3]]
+
+
+def test_missing_duration_column() -> None:
+    parquet = pd.DataFrame({"id": ["0"], "ref": [""], "audio_path": [""]})
+    dataset = ASRDataset(dataset=LibriSpeechDataset(parquet=parquet, sr=SR))
+    with pytest.raises(KeyError):
+        BucketBatchSampler(dataset, max_frames=MAX_FRAMES)
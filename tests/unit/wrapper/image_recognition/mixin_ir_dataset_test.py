@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 from typing import TypeVar, Generic
 
 from dataset_loader.abstract import IRSample
@@ -25,6 +27,32 @@ class MixinIRDatasetTest(MixinDatasetProtocolTest, Generic[LabelT]):
             if idx >= THREAD_ITER_TEST_SIZE - 1:
                 break
 
+    def test_ir_aiter(self, ir_dataset: IRDataset[LabelT]) -> None:
+        async def consume() -> list[str]:
+            ids: list[str] = []
+            async for sample in ir_dataset:
+                assert isinstance(sample, IRSample)
+                assert sample.raw is not None
+                ids.append(sample.id)
+
+                if len(ids) >= THREAD_ITER_TEST_SIZE:
+                    break
+            return ids
+
+        ids = asyncio.run(consume())
+        assert ids == [ir_dataset[idx].id for idx in range(len(ids))]
+
+    def test_ir_process_iter(self, ir_dataset: IRDataset[LabelT]) -> None:
+        for idx, sample in enumerate(
+            ir_dataset.process_iter(num_workers=2, prefetch=4)
+        ):
+            assert isinstance(sample, IRSample)
+            assert sample.id == ir_dataset[idx].id
+            assert sample.raw is not None
+
+            if idx >= THREAD_ITER_TEST_SIZE - 1:
+                break
+
     def test_ir__len__(
         self, ir_dataset: IRDataset[LabelT], ir_samples: list[IRSample[LabelT]]
     ) -> None: